@@ -1,18 +1,17 @@
 from flask import Flask, render_template, request, redirect, url_for, session, flash, jsonify, Response
 from werkzeug.utils import secure_filename
+from werkzeug.wsgi import wrap_file
 import os
 import json
 import sys
+import queue
+import threading
 import warnings
+from concurrent.futures import ThreadPoolExecutor
 from dotenv import load_dotenv
 from database import init_db, insert_sample_users, validate_user
-from utils import get_groq_response, extract_pdf_text, prepare_prompt, generate_cover_letter, generate_updated_resume, get_groq_chat_response
-import requests
-from bs4 import BeautifulSoup
-from mcq_utils import QuestionGenerator, get_response
-from groq import Groq
-from PyPDF2 import PdfReader
-from pdf_generator import generate_resume_pdf, generate_cover_letter_pdf
+from pdf_cache import get_pdf_cache, pdf_cache_key
+from lazy_imports import lazy_module, lazy_attribute, load_subsystem
 
 
 # Suppress LangChain deprecation warnings
@@ -21,17 +20,58 @@ warnings.filterwarnings("ignore", category=DeprecationWarning, module="langchain
 # Add the current directory to sys.path for RAG imports
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
-# RAG imports
-try:
-    from rag.embeddings import get_embedding_function
-    from rag.vector_store import get_or_create_vector_store
-    from rag.retriever import get_retriever, get_multi_query_retriever, get_contextual_retriever
-    from rag.llm_service import get_llm
-    from rag.rag_qa_chain import create_rag_chain, create_conversation_chain
-    RAG_AVAILABLE = True
-except ImportError as e:
-    print(f"Warning: RAG modules not available: {e}")
-    RAG_AVAILABLE = False
+# Heavy subsystems are imported on first use (see lazy_imports.LAZY_SUBSYSTEMS)
+get_groq_response = lazy_attribute('utils', 'get_groq_response')
+extract_pdf_text = lazy_attribute('utils', 'extract_pdf_text')
+prepare_prompt = lazy_attribute('utils', 'prepare_prompt')
+generate_cover_letter = lazy_attribute('utils', 'generate_cover_letter')
+generate_updated_resume = lazy_attribute('utils', 'generate_updated_resume')
+requests = lazy_module('requests')
+BeautifulSoup = lazy_attribute('bs4', 'BeautifulSoup')
+mcq_utils = lazy_module('mcq_utils')
+QuestionGenerator = lazy_attribute('mcq_utils', 'QuestionGenerator')
+get_batch_response = lazy_attribute('mcq_utils', 'get_batch_response')
+generate_assessment_narrative = lazy_attribute('mcq_utils', 'generate_assessment_narrative')
+get_question_bank = lazy_attribute('question_bank', 'get_question_bank')
+score_assessment = lazy_attribute('psychometric_scoring', 'score_assessment')
+aggregate_dimensions = lazy_attribute('psychometric_scoring', 'aggregate_dimensions')
+InterviewAssistant = lazy_attribute('interview_assistant', 'InterviewAssistant')
+warm_up_interview_questions = lazy_attribute('interview_assistant', 'warm_up_interview_questions')
+create_interview_session = lazy_attribute('interview_assistant', 'create_interview_session')
+save_interview_session = lazy_attribute('interview_assistant', 'save_interview_session')
+interview_session_store = lazy_module('interview_session_store')
+get_interview_session_store = lazy_attribute('interview_session_store', 'get_interview_session_store')
+validate_responses = lazy_attribute('interview_session_store', 'validate_responses')
+PdfReader = lazy_attribute('PyPDF2', 'PdfReader')
+write_resume_pdf = lazy_attribute('pdf_generator', 'write_resume_pdf')
+write_cover_letter_pdf = lazy_attribute('pdf_generator', 'write_cover_letter_pdf')
+get_output_profile = lazy_attribute('pdf_generator', 'get_output_profile')
+validate_export_documents = lazy_attribute('pdf_export', 'validate_export_documents')
+iter_export_zip = lazy_attribute('pdf_export', 'iter_export_zip')
+
+# RAG components
+get_embedding_function = lazy_attribute('rag.embeddings', 'get_embedding_function')
+get_or_create_vector_store = lazy_attribute('rag.vector_store', 'get_or_create_vector_store')
+get_retriever = lazy_attribute('rag.retriever', 'get_retriever')
+get_multi_query_retriever = lazy_attribute('rag.retriever', 'get_multi_query_retriever')
+get_contextual_retriever = lazy_attribute('rag.retriever', 'get_contextual_retriever')
+get_cached_retriever = lazy_attribute('rag.retriever', 'get_cached_retriever')
+get_llm = lazy_attribute('rag.llm_service', 'get_llm')
+create_rag_chain = lazy_attribute('rag.rag_qa_chain', 'create_rag_chain')
+create_conversation_chain = lazy_attribute('rag.rag_qa_chain', 'create_conversation_chain')
+pack_retriever = lazy_attribute('rag.rag_qa_chain', 'pack_retriever')
+condense_question = lazy_attribute('rag.rag_qa_chain', 'condense_question')
+stream_rag_answer = lazy_attribute('rag.rag_qa_chain', 'stream_rag_answer')
+get_conversation_store = lazy_attribute('rag.conversation_store', 'get_conversation_store')
+
+_rag_available = None
+
+def rag_available():
+    """Whether the RAG modules can be imported (checked once, on first use)"""
+    global _rag_available
+    if _rag_available is None:
+        _rag_available = load_subsystem('rag')
+    return _rag_available
 
 # Load environment variables
 load_dotenv()
@@ -466,6 +506,30 @@ def generate_updated_resume_route():
         flash(f'Error generating updated resume: {str(e)}', 'error')
         return redirect(url_for('dashboard'))
 
+def pdf_download_response(cache_key, write, filename):
+    """Stream a cached or freshly rendered PDF, answering 304 when the client's ETag matches
+
+    The download endpoints are POST because the document text is too long (and
+    too personal) for a URL. RFC 9110 wants 412 for a matching If-None-Match on
+    a POST; we deliberately answer 304 instead, since the POST is a read here and
+    the result templates reuse their saved copy of the PDF on a 304.
+    """
+    etag = f'"{cache_key}"'
+    headers = {
+        'ETag': etag,
+        # Clients may keep the file but must revalidate; the ETag makes that a cheap 304
+        'Cache-Control': 'private, no-cache'
+    }
+    if cache_key in request.if_none_match:
+        return Response(status=304, headers=headers)
+
+    # The PDF is streamed from the cache file in chunks rather than loaded into memory
+    stream = get_pdf_cache().open_or_render(cache_key, write)
+    headers['Content-Length'] = str(stream.seek(0, os.SEEK_END))
+    stream.seek(0)
+    headers['Content-Disposition'] = f'attachment; filename={filename}'
+    return Response(wrap_file(request.environ, stream), mimetype='application/pdf', headers=headers, direct_passthrough=True)
+
 @app.route('/api/download_resume_pdf', methods=['POST'])
 @login_required
 @role_required('Applicant')
@@ -478,21 +542,18 @@ def download_resume_pdf():
         if not resume_text:
             return jsonify({'error': 'Resume text is required'}), 400
         
-        # Generate PDF
-        pdf_data = generate_resume_pdf(resume_text)
-        
-        # Return PDF as response
-        response = Response(
-            pdf_data,
-            mimetype='application/pdf',
-            headers={
-                'Content-Disposition': 'attachment; filename=optimized_resume.pdf',
-                'Content-Type': 'application/pdf'
-            }
-        )
+        # Optional output profile (compression / metadata), see PDF_OUTPUT_PROFILES
+        profile = get_output_profile(data.get('profile'))
         
-        return response
+        # Generate PDF (or reuse the cached render of identical text)
+        return pdf_download_response(
+            pdf_cache_key('resume', resume_text, profile=profile),
+            lambda output: write_resume_pdf(resume_text, output, profile),
+            'optimized_resume.pdf'
+        )
         
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
     except Exception as e:
         return jsonify({'error': f'Error generating PDF: {str(e)}'}), 500
 
@@ -511,24 +572,41 @@ def download_cover_letter_pdf():
         if not cover_letter_text:
             return jsonify({'error': 'Cover letter text is required'}), 400
         
-        # Generate PDF
-        pdf_data = generate_cover_letter_pdf(cover_letter_text, applicant_name, contact_info)
-        
-        # Return PDF as response
-        response = Response(
-            pdf_data,
-            mimetype='application/pdf',
-            headers={
-                'Content-Disposition': f'attachment; filename=cover_letter_{tone}.pdf',
-                'Content-Type': 'application/pdf'
-            }
-        )
+        # Optional output profile (compression / metadata), see PDF_OUTPUT_PROFILES
+        profile = get_output_profile(data.get('profile'))
         
-        return response
+        # Generate PDF (or reuse the cached render of identical content)
+        return pdf_download_response(
+            pdf_cache_key('cover_letter', cover_letter_text, applicant_name, contact_info, profile),
+            lambda output: write_cover_letter_pdf(cover_letter_text, output, applicant_name, contact_info, profile),
+            f'cover_letter_{tone}.pdf'
+        )
         
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
     except Exception as e:
         return jsonify({'error': f'Error generating PDF: {str(e)}'}), 500
 
+@app.route('/api/bulk_export_pdfs', methods=['POST'])
+@login_required
+@role_required('Recruiter')
+def bulk_export_pdfs():
+    """Render a batch of resumes and cover letters in worker processes and stream them as a ZIP"""
+    try:
+        data = request.get_json() or {}
+        documents = validate_export_documents(data.get('documents'))
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    
+    return Response(
+        iter_export_zip(documents),
+        mimetype='application/zip',
+        headers={
+            'Content-Disposition': 'attachment; filename=pdf_export.zip',
+            'X-Accel-Buffering': 'no'
+        }
+    )
+
 # Interview Assistant Routes for Hiring Companies
 @app.route('/interview_assistant')
 @login_required
@@ -545,16 +623,16 @@ def interview_assistant():
 def generate_interview_questions():
     """Generate AI-powered interview questions"""
     try:
-        from interview_assistant import InterviewAssistant
-        
         data = request.get_json()
         job_description = data.get('job_description', '')
         candidate_resume = data.get('candidate_resume', '')
         model = data.get('model', 'llama-3.3-70b-versatile')
         question_count = int(data.get('question_count', 10))
         categories = data.get('categories', ['technical', 'behavioral', 'cultural'])
-        difficulty = data.get('difficulty', 'mid')
+        # The setup form sends difficulty_level
+        difficulty = data.get('difficulty', data.get('difficulty_level', 'mid'))
         interview_type = data.get('interview_type', 'screening')
+        regenerate = bool(data.get('regenerate', False))
         
         if not job_description:
             return jsonify({'error': 'Job description is required'}), 400
@@ -564,7 +642,7 @@ def generate_interview_questions():
         if not api_key:
             return jsonify({'error': f'API key not configured for model: {model}'}), 400
         
-        # Generate questions
+        # Generate questions (served from the cache unless regenerating)
         assistant = InterviewAssistant()
         questions_data = assistant.generate_interview_questions(
             model=model,
@@ -574,7 +652,8 @@ def generate_interview_questions():
             question_count=question_count,
             categories=categories,
             difficulty=difficulty,
-            interview_type=interview_type
+            interview_type=interview_type,
+            regenerate=regenerate
         )
         
         if 'error' in questions_data:
@@ -587,20 +666,48 @@ def generate_interview_questions():
             'success': True,
             'questions': questions_list,
             'interview_tips': questions_data.get('interview_tips', []),
-            'total_duration': questions_data.get('total_duration', 60)
+            'total_duration': questions_data.get('total_duration', 60),
+            'cached': questions_data.get('cached', False)
         })
         
     except Exception as e:
         return jsonify({'error': f'Error generating questions: {str(e)}'}), 500
 
+@app.route('/api/warm_interview_questions', methods=['POST'])
+@login_required
+@role_required('Hiring Company')
+def warm_interview_questions():
+    """Pre-generate cached question sets for a role in the background"""
+    try:
+        data = request.get_json()
+        job_description = data.get('job_description', '')
+        model = data.get('model', 'llama-3.3-70b-versatile')
+        configurations = data.get('configurations')
+        
+        if not job_description:
+            return jsonify({'error': 'Job description is required'}), 400
+        
+        api_key = get_api_key_for_model(model)
+        if not api_key:
+            return jsonify({'error': f'API key not configured for model: {model}'}), 400
+        
+        threading.Thread(
+            target=warm_up_interview_questions,
+            args=(model, api_key, job_description, configurations),
+            daemon=True
+        ).start()
+        
+        return jsonify({'success': True, 'message': 'Warm-up started'}), 202
+        
+    except Exception as e:
+        return jsonify({'error': f'Error starting warm-up: {str(e)}'}), 500
+
 @app.route('/api/evaluate_interview_responses', methods=['POST'])
 @login_required
 @role_required('Hiring Company')
 def evaluate_interview_responses():
     """Evaluate candidate interview responses"""
     try:
-        from interview_assistant import InterviewAssistant
-        
         data = request.get_json()
         questions = data.get('questions', [])
         responses = data.get('responses', {})
@@ -641,6 +748,110 @@ def psychometric_test():
     """Psychometric test page for recruiters"""
     return render_template('psychometric_test.html', models=MODEL_DICT)
 
+# Psychometric question helpers
+# Size of the first generated batch when streaming, so the first question arrives quickly
+FIRST_STREAMED_BATCH_SIZE = 3
+
+def build_question_plan(test_type, num_questions):
+    """Split the requested number of questions into (category, count) pairs"""
+    if test_type == 'mixed':
+        # Half personality, half workplace
+        personality_count = num_questions // 2
+        workplace_count = num_questions - personality_count
+        return [("Personality Traits", personality_count), ("Workplace Behaviors", workplace_count)]
+    elif test_type == 'personality':
+        return [("Personality Traits", num_questions)]
+    elif test_type == 'workplace':
+        return [("Workplace Behaviors", num_questions)]
+    return []
+
+def generate_category_questions(model, category, count, emit, first_batch_size=None):
+    """Source questions for one category, calling emit() with each question as it becomes available
+    
+    Samples a balanced set from the precomputed bank and only generates (in
+    batches) whatever the bank can't supply.
+    """
+    banked = get_question_bank().sample(category, count)
+    for item in banked:
+        emit({
+            'type': 'MCQ',
+            'question': item['question'],
+            'options': item['options'],
+            'category': category,
+            'dimension': item['dimension'],
+            'reverse_keyed': item.get('reverse_keyed', False)
+        })
+    
+    missing = count - len(banked)
+    if missing <= 0:
+        return
+    
+    print(f"Question bank low for {category}: generating {missing} questions")
+    # One generator per category, so duplicate-avoidance memory stays per category
+    generator = QuestionGenerator(model)
+    generator.remember_questions(item['question'] for item in banked)
+    
+    batch_size = first_batch_size or mcq_utils.MAX_QUESTIONS_PER_CALL
+    while missing > 0:
+        batch = generator.generate_mcq_batch(topic=category, count=min(missing, batch_size))
+        for question in batch:
+            emit({
+                'type': 'MCQ',
+                'question': question.question,
+                'options': question.options,
+                'category': category,
+                'dimension': question.dimension,
+                'reverse_keyed': question.reverse_keyed
+            })
+        missing -= len(batch)
+        batch_size = mcq_utils.MAX_QUESTIONS_PER_CALL
+
+def iter_assessment_questions(model, plan, first_batch_size=None):
+    """Yield questions for every category in the plan as they arrive
+    
+    Each category is sourced in its own thread, so a mixed test takes as long as
+    its slowest category rather than the sum of both.
+    """
+    plan = [(category, count) for category, count in plan if count > 0]
+    if not plan:
+        return
+    
+    events = queue.Queue()
+    stopped = threading.Event()
+    
+    def emit(question):
+        # Abandon the category once the consumer has gone (error or disconnect)
+        if stopped.is_set():
+            raise RuntimeError("Question stream closed")
+        events.put(('question', question))
+    
+    def worker(category, count):
+        try:
+            generate_category_questions(model, category, count, emit, first_batch_size)
+        except Exception as e:
+            events.put(('error', f"{category}: {str(e)}"))
+        finally:
+            events.put(('done', category))
+    
+    executor = ThreadPoolExecutor(max_workers=len(plan))
+    try:
+        for category, count in plan:
+            executor.submit(worker, category, count)
+        
+        remaining = len(plan)
+        while remaining:
+            kind, payload = events.get()
+            if kind == 'done':
+                remaining -= 1
+            elif kind == 'error':
+                raise RuntimeError(payload)
+            else:
+                yield payload
+    finally:
+        # Don't wait for the other category's in-flight LLM calls on an error or disconnect
+        stopped.set()
+        executor.shutdown(wait=False, cancel_futures=True)
+
 @app.route('/api/generate_questions', methods=['POST'])
 @login_required
 @role_required('Recruiter')
@@ -656,63 +867,17 @@ def generate_questions():
         data = request.get_json()
         print(f"Request data: {data}")
         
-        from mcq_utils import QuestionGenerator
-        
         model = data.get('model', 'llama3-8b-8192')
         num_questions = int(data.get('num_questions', 10))
         test_type = data.get('test_type', 'mixed')
         
         print(f"Model: {model}, Questions: {num_questions}, Type: {test_type}")
         
-        generator = QuestionGenerator(model)
-        questions = []
+        plan = build_question_plan(test_type, num_questions)
         
-        if test_type == 'mixed':
-            # Half personality, half workplace
-            personality_count = num_questions // 2
-            workplace_count = num_questions - personality_count
-            
-            # Generate personality questions
-            for _ in range(personality_count):
-                question = generator.generate_mcq(topic="Personality Traits")
-                questions.append({
-                    'type': 'MCQ',
-                    'question': question.question,
-                    'options': question.options,
-                    'category': "Personality Traits"
-                })
-            
-            # Generate workplace questions
-            for _ in range(workplace_count):
-                question = generator.generate_mcq(topic="Workplace Behaviors")
-                questions.append({
-                    'type': 'MCQ',
-                    'question': question.question,
-                    'options': question.options,
-                    'category': "Workplace Behaviors"
-                })
-        
-        elif test_type == 'personality':
-            # All personality questions
-            for _ in range(num_questions):
-                question = generator.generate_mcq(topic="Personality Traits")
-                questions.append({
-                    'type': 'MCQ',
-                    'question': question.question,
-                    'options': question.options,
-                    'category': "Personality Traits"
-                })
-        
-        elif test_type == 'workplace':
-            # All workplace questions
-            for _ in range(num_questions):
-                question = generator.generate_mcq(topic="Workplace Behaviors")
-                questions.append({
-                    'type': 'MCQ',
-                    'question': question.question,
-                    'options': question.options,
-                    'category': "Workplace Behaviors"
-                })
+        # Categories are sourced concurrently; keep the response grouped by category
+        order = {category: position for position, (category, _) in enumerate(plan)}
+        questions = sorted(iter_assessment_questions(model, plan), key=lambda q: order[q['category']])
         
         return jsonify({
             'success': True,
@@ -730,79 +895,75 @@ def generate_questions():
             'error': f'Failed to generate questions: {str(e)}'
         }), 500
 
+@app.route('/api/generate_questions_stream', methods=['POST'])
+@login_required
+@role_required('Recruiter')
+def generate_questions_stream():
+    """Generate psychometric questions, streaming each one as a JSON line as soon as it is ready"""
+    data = request.get_json()
+    model = data.get('model', 'llama3-8b-8192')
+    num_questions = int(data.get('num_questions', 10))
+    plan = build_question_plan(data.get('test_type', 'mixed'), num_questions)
+    
+    def generate():
+        count = 0
+        try:
+            for question in iter_assessment_questions(model, plan, first_batch_size=FIRST_STREAMED_BATCH_SIZE):
+                count += 1
+                yield json.dumps({'type': 'question', 'question': question}) + "\n"
+            yield json.dumps({'type': 'done', 'count': count, 'config': data}) + "\n"
+        except Exception as e:
+            print(f"Error in generate_questions_stream: {str(e)}")
+            yield json.dumps({'type': 'error', 'error': f'Failed to generate questions: {str(e)}'}) + "\n"
+    
+    return Response(
+        generate(),
+        mimetype='application/x-ndjson',
+        headers={
+            'Cache-Control': 'no-cache',
+            'X-Accel-Buffering': 'no'
+        }
+    )
+
 @app.route('/api/evaluate_assessment', methods=['POST'])
 @login_required
 @role_required('Recruiter')
 def evaluate_assessment():
     """API endpoint to evaluate psychometric assessment"""
-    print("=== EVALUATE ASSESSMENT DEBUG ===")
     try:
-        from mcq_utils import get_response
-        
         data = request.get_json()
-        print(f"Request data: {data}")
         
         questions = data.get('questions', [])
         answers = data.get('answers', [])
         config = data.get('config', {})
         model = config.get('model', 'llama3-8b-8192')
         
-        print(f"Model: {model}")
-        print(f"Questions count: {len(questions)}")
-        print(f"Answers count: {len(answers)}")
-        print(f"Config: {config}")
+        print(f"Evaluating assessment: {len(questions)} questions, {len(answers)} answers")
         
-        results = []
-        
-        for i, (question, answer) in enumerate(zip(questions, answers)):
-            if answer is None:
-                print(f"Skipping question {i+1} - no answer provided")
-                continue
-                
-            result_dict = {
-                'question_number': i + 1,
-                'question': question['question'],
-                'question_type': question['type'],
-                'user_answer': answer,
-                'category': question.get('category', 'Unknown')
-            }
-            
-            print(f"Processing question {i+1}: {question['question'][:50]}...")
-            print(f"User answer: {answer}")
-            
-            try:
-                # Get AI analysis
-                response = get_response(model, result_dict)
-                print(f"AI response for question {i+1}: {response}")
-                
-                result_dict['Dimension'] = response.get('inferred_dimension', 'Unknown')
-                result_dict['Score'] = response.get('normalized_score', 0.0)
-                result_dict['Label'] = response.get('label', 'Unknown')
-                result_dict['Reasoning'] = response.get('reasoning', 'No analysis available')
-                
-                results.append(result_dict)
-                print(f"Successfully processed question {i+1}")
-                
-            except Exception as question_error:
-                print(f"Error processing question {i+1}: {str(question_error)}")
-                print(f"Question error type: {type(question_error)}")
-                import traceback
-                traceback.print_exc()
-                
-                # Add a fallback result
-                result_dict['Dimension'] = 'Unknown'
-                result_dict['Score'] = 0.5
-                result_dict['Label'] = 'Moderate'
-                result_dict['Reasoning'] = f'Analysis failed: {str(question_error)}'
-                results.append(result_dict)
+        # Likert answers are scored deterministically; no per-question LLM calls
+        results = score_assessment(questions, answers)
+        dimension_scores = aggregate_dimensions(results)
         
         print(f"Total results: {len(results)}")
         
-        return jsonify({
+        # Optional AI-written reasoning for every item, in one batched LLM call;
+        # scores stay deterministic so reverse-keyed items are handled correctly
+        if results and str(config.get('detailed_reasoning', '')).lower() in ('true', 'on', '1'):
+            for result, evaluation in zip(results, get_batch_response(model, results)):
+                result['Reasoning'] = evaluation.get('reasoning', result['Reasoning'])
+        
+        response = {
             'success': True,
             'results': results,
+            'dimension_scores': dimension_scores,
             'config': config
-        })
+        }
+        
+        # Optional single LLM call summarizing the computed scores
+        if str(config.get('include_narrative', '')).lower() in ('true', 'on', '1'):
+            response['narrative'] = generate_assessment_narrative(model, dimension_scores)
+        
+        return jsonify(response)
         
     except Exception as e:
         print(f"Error in evaluate_assessment: {str(e)}")
@@ -950,29 +1111,51 @@ def generate_simple_response(query, llm):
         else:
             return "I'm specialized in career guidance! 💼 I can help you with resumes, interviews, job searching, and career development. What career topic would you like to explore?"
 
-def process_rag_question(prompt, llm_provider="groq", model="llama3-8b-8192", retrieval_strategy="contextual", num_sources=5, enable_memory=True):
-    """Process a question using the RAG system"""
+def select_rag_retriever(vector_store, llm, prompt, retrieval_strategy, search_kwargs):
+    """Select the retriever for a retrieval strategy, backed by the retrieval cache"""
+    if retrieval_strategy == "contextual":
+        query_type = classify_career_query_type(prompt)
+        retriever = get_contextual_retriever(vector_store, query_type, search_kwargs)
+    elif retrieval_strategy == "multi_query":
+        retriever = get_multi_query_retriever(vector_store, llm, search_kwargs)
+    else:
+        retriever = get_retriever(vector_store, search_kwargs, retrieval_strategy)
+    return get_cached_retriever(retriever, retrieval_strategy, search_kwargs)
+
+def format_rag_sources(sources):
+    """Format retrieved documents for JSON responses"""
+    formatted_sources = []
+    for i, doc in enumerate(sources or []):
+        source_info = {
+            'title': doc.metadata.get('title', f'Document {i+1}'),
+            'doc_type': doc.metadata.get('doc_type', 'Unknown'),
+            'content_preview': doc.page_content[:200] + "..." if len(doc.page_content) > 200 else doc.page_content,
+            'relevance': 1 - doc._distance if hasattr(doc, '_distance') else None
+        }
+        formatted_sources.append(source_info)
+    return formatted_sources
+
+def process_rag_question(prompt, llm_provider="groq", model="llama3-8b-8192", retrieval_strategy="contextual", num_sources=5, enable_memory=True, user_id=None):
+    """Process a question using the RAG system
+    
+    Returns (answer, sources, error_msg, retrieval_metadata)
+    """
     try:
-        if not RAG_AVAILABLE:
-            return "Sorry, the RAG system is not available. Please check the system configuration.", [], "RAG system not available"
+        if not rag_available():
+            return "Sorry, the RAG system is not available. Please check the system configuration.", [], "RAG system not available", {}
         
         # Initialize RAG components
         embedding_function = get_embedding_function()
         vector_store = get_or_create_vector_store(embedding_function)
         
+        llm = get_llm(provider=llm_provider, model=model)
+        
         # Select retriever based on strategy
         search_kwargs = {"k": num_sources}
+        retriever = select_rag_retriever(vector_store, llm, prompt, retrieval_strategy, search_kwargs)
         
-        if retrieval_strategy == "contextual":
-            query_type = classify_career_query_type(prompt)
-            retriever = get_contextual_retriever(vector_store, query_type, search_kwargs)
-        elif retrieval_strategy == "multi_query":
-            llm = get_llm(provider=llm_provider, model=model)
-            retriever = get_multi_query_retriever(vector_store, llm, search_kwargs)
-        else:
-            retriever = get_retriever(vector_store, search_kwargs, retrieval_strategy)
-        
-        llm = get_llm(provider=llm_provider, model=model)
+        # Memory needs a user to key the conversation store on
+        enable_memory = enable_memory and user_id is not None
         
         # Create QA chain
         if enable_memory:
@@ -986,27 +1169,16 @@ def process_rag_question(prompt, llm_provider="groq", model="llama3-8b-8192", re
         # Handle non-career queries without RAG
         if intent == 'SIMPLE_RESPONSE':
             response = generate_simple_response(prompt, llm)
-            return response, [], None
+            return response, [], None, {}
         
         # For career questions, proceed with RAG pipeline
         if intent == 'RAG_RETRIEVAL':
-            # Use contextual retriever if selected
-            if retrieval_strategy == "contextual":
-                query_type = classify_career_query_type(prompt)
-                contextual_retriever = get_contextual_retriever(vector_store, query_type, search_kwargs)
-                # Create a new chain with the contextual retriever
-                if enable_memory:
-                    qa_chain = create_conversation_chain(llm, contextual_retriever)
-                else:
-                    qa_chain = create_rag_chain(llm, contextual_retriever)
-            
             # Prepare input based on chain type
-            if enable_memory and hasattr(qa_chain, 'memory'):
-                # For conversation chain with memory
-                if hasattr(qa_chain, 'combine_docs_chain'):
-                    response = qa_chain.invoke({"question": prompt, "chat_history": []})
-                else:
-                    response = qa_chain.invoke({"question": prompt})
+            if enable_memory:
+                # Token-bounded history: recent turns plus a rolling summary of older ones
+                conversation_store = get_conversation_store()
+                chat_history = conversation_store.format_history(user_id, llm)
+                response = qa_chain.invoke({"question": prompt, "chat_history": chat_history})
             else:
                 # For regular RAG chain
                 response = qa_chain.invoke({"query": prompt})
@@ -1020,15 +1192,21 @@ def process_rag_question(prompt, llm_provider="groq", model="llama3-8b-8192", re
                 
             sources = response.get("source_documents", []) if isinstance(response, dict) else []
             
-            return answer, sources, None
+            if enable_memory and answer:
+                conversation_store.add_turn(user_id, prompt, answer)
+            
+            # Per-variant latency (multi-query) and context packing stats live on the chain's retriever
+            retrieval_metadata = dict(getattr(qa_chain.retriever, 'last_run_metadata', None) or {})
+            
+            return answer, sources, None, retrieval_metadata
         
         # Fallback for any unhandled cases
         response = generate_simple_response(prompt, llm)
-        return response, [], None
+        return response, [], None, {}
         
     except Exception as e:
         error_msg = f"Sorry, I encountered an error: {str(e)}"
-        return None, [], error_msg
+        return None, [], error_msg, {}
 
 @app.route('/faq_chat', methods=['POST'])
 @login_required
@@ -1048,34 +1226,122 @@ def faq_chat():
             return jsonify({'error': 'Please enter a message'}), 400
         
         # Process the question using RAG
-        answer, sources, error_msg = process_rag_question(
-            message, llm_provider, model, retrieval_strategy, num_sources, enable_memory
+        answer, sources, error_msg, retrieval_metadata = process_rag_question(
+            message, llm_provider, model, retrieval_strategy, num_sources, enable_memory,
+            user_id=session.get('user_id')
         )
         
         if error_msg:
             return jsonify({'error': error_msg}), 500
         
-        # Format sources for JSON response
-        formatted_sources = []
-        if sources:
-            for i, doc in enumerate(sources):
-                source_info = {
-                    'title': doc.metadata.get('title', f'Document {i+1}'),
-                    'doc_type': doc.metadata.get('doc_type', 'Unknown'),
-                    'content_preview': doc.page_content[:200] + "..." if len(doc.page_content) > 200 else doc.page_content,
-                    'relevance': 1 - doc._distance if hasattr(doc, '_distance') else None
-                }
-                formatted_sources.append(source_info)
-        
         return jsonify({
             'success': True,
             'response': answer,
-            'sources': formatted_sources
+            'sources': format_rag_sources(sources),
+            'retrieval': retrieval_metadata
         })
         
     except Exception as e:
         return jsonify({'error': f'Error processing message: {str(e)}'}), 500
 
+def stream_rag_question(prompt, llm_provider="groq", model="llama3-8b-8192", retrieval_strategy="contextual", num_sources=5, enable_memory=True, user_id=None):
+    """Process a question using the RAG system, yielding events as they become available
+    
+    Yields dicts: {'type': 'sources'}, then {'type': 'token'} per answer chunk,
+    then {'type': 'done'} - or a single {'type': 'error'}.
+    """
+    try:
+        if not rag_available():
+            yield {'type': 'error', 'error': 'RAG system not available'}
+            return
+        
+        embedding_function = get_embedding_function()
+        vector_store = get_or_create_vector_store(embedding_function)
+        llm = get_llm(provider=llm_provider, model=model)
+        
+        intent = classify_query_intent(prompt, llm)
+        if intent == 'SIMPLE_RESPONSE':
+            yield {'type': 'sources', 'sources': []}
+            yield {'type': 'token', 'content': generate_simple_response(prompt, llm)}
+            yield {'type': 'done', 'retrieval': {}}
+            return
+        
+        search_kwargs = {"k": num_sources}
+        retriever = pack_retriever(llm, select_rag_retriever(vector_store, llm, prompt, retrieval_strategy, search_kwargs))
+        
+        # Memory needs a user to key the conversation store on
+        enable_memory = enable_memory and user_id is not None
+        chat_history = None
+        question = prompt
+        if enable_memory:
+            conversation_store = get_conversation_store()
+            chat_history = conversation_store.format_history(user_id, llm)
+            question = condense_question(llm, prompt, chat_history)
+        
+        # Sources go out as soon as retrieval finishes
+        documents = retriever.invoke(question)
+        yield {'type': 'sources', 'sources': format_rag_sources(documents)}
+        
+        answer_parts = []
+        for token in stream_rag_answer(llm, documents, question, chat_history):
+            answer_parts.append(token)
+            yield {'type': 'token', 'content': token}
+        
+        answer = "".join(answer_parts)
+        if enable_memory and answer:
+            conversation_store.add_turn(user_id, prompt, answer)
+        
+        yield {'type': 'done', 'retrieval': dict(retriever.last_run_metadata or {})}
+        
+    except Exception as e:
+        yield {'type': 'error', 'error': f"Sorry, I encountered an error: {str(e)}"}
+
+@app.route('/faq_chat_stream', methods=['POST'])
+@login_required
+@role_required('Applicant')
+def faq_chat_stream():
+    """Handle FAQ chat messages, streaming the answer as JSON lines"""
+    data = request.get_json()
+    message = data.get('message', '').strip()
+    llm_provider = data.get('llm_provider', 'groq')
+    model = data.get('model', 'llama3-8b-8192')
+    retrieval_strategy = data.get('retrieval_strategy', 'contextual')
+    num_sources = int(data.get('num_sources', 5))
+    enable_memory = data.get('enable_memory', True)
+    
+    if not message:
+        return jsonify({'error': 'Please enter a message'}), 400
+    
+    events = stream_rag_question(
+        message, llm_provider, model, retrieval_strategy, num_sources, enable_memory,
+        user_id=session.get('user_id')
+    )
+    
+    def generate():
+        for event in events:
+            yield json.dumps(event) + "\n"
+    
+    return Response(
+        generate(),
+        mimetype='application/x-ndjson',
+        headers={
+            'Cache-Control': 'no-cache',
+            'X-Accel-Buffering': 'no'
+        }
+    )
+
+@app.route('/faq_clear_history', methods=['POST'])
+@login_required
+@role_required('Applicant')
+def faq_clear_history():
+    """Clear the stored FAQ conversation for the current user"""
+    try:
+        if rag_available():
+            get_conversation_store().clear(session.get('user_id'))
+        return jsonify({'success': True})
+    except Exception as e:
+        return jsonify({'error': f'Error clearing history: {str(e)}'}), 500
+
 @app.route('/resume_ranking')
 @login_required
 @role_required('Recruiter')
@@ -1278,11 +1544,104 @@ def rank_resumes_llm(job_description, resumes_data, model):
 @role_required('Hiring Company')
 def interview_session(session_id):
     """Individual interview session page"""
+    interview = get_interview_session_store().get(session_id, owner_id=session['user_id'])
+    if interview is None:
+        flash('Interview session not found', 'error')
+        return redirect(url_for('interview_assistant'))
+    
     return render_template('interview_session.html', 
                          session_id=session_id,
+                         interview=interview,
                          username=session.get('username'),
                          models=MODEL_DICT)
 
+@app.route('/api/interview_sessions', methods=['POST'])
+@login_required
+@role_required('Hiring Company')
+def create_interview_session_api():
+    """Create and store a new interview session"""
+    try:
+        data = request.get_json()
+        interviewer_info = data.get('interviewer_info', {})
+        interviewer_info.setdefault('company', session.get('username', ''))
+        
+        interview = create_interview_session(
+            data.get('candidate_info', {}),
+            data.get('job_description', ''),
+            interviewer_info,
+            owner_id=session['user_id']
+        )
+        interview['questions'] = data.get('questions', [])
+        session_id = save_interview_session(interview)
+        
+        return jsonify({
+            'success': True,
+            'session_id': session_id,
+            'url': url_for('interview_session', session_id=session_id)
+        })
+        
+    except Exception as e:
+        return jsonify({'error': f'Error creating interview session: {str(e)}'}), 500
+
+@app.route('/api/interview_sessions', methods=['GET'])
+@login_required
+@role_required('Hiring Company')
+def list_interview_sessions():
+    """List the current account's interview sessions filtered by company, status and creation date"""
+    try:
+        sessions = get_interview_session_store().list_sessions(
+            owner_id=session['user_id'],
+            company=request.args.get('company'),
+            status=request.args.get('status'),
+            date_from=request.args.get('date_from'),
+            date_to=request.args.get('date_to'),
+            limit=int(request.args.get('limit', 50))
+        )
+        return jsonify({'success': True, 'sessions': sessions})
+        
+    except Exception as e:
+        return jsonify({'error': f'Error listing interview sessions: {str(e)}'}), 500
+
+@app.route('/api/interview_sessions/<session_id>', methods=['GET'])
+@login_required
+@role_required('Hiring Company')
+def get_interview_session_api(session_id):
+    """Get a stored interview session"""
+    # Sessions of other accounts are reported as missing
+    interview = get_interview_session_store().get(session_id, owner_id=session['user_id'])
+    if interview is None:
+        return jsonify({'error': 'Interview session not found'}), 404
+    return jsonify({'success': True, 'session': interview})
+
+@app.route('/api/interview_sessions/<session_id>', methods=['PATCH'])
+@login_required
+@role_required('Hiring Company')
+def update_interview_session_api(session_id):
+    """Autosave part of an interview session: only the fields sent are written"""
+    try:
+        data = request.get_json()
+        store = get_interview_session_store()
+        owner_id = session['user_id']
+        
+        # Reject bad responses before any field is written
+        responses = data.get('responses')
+        if responses:
+            validate_responses(responses)
+        
+        fields = {field: data[field] for field in interview_session_store.UPDATABLE_FIELDS if field in data}
+        found = store.update_fields(session_id, owner_id=owner_id, **fields)
+        if found and responses:
+            found = store.set_responses(session_id, responses, owner_id=owner_id)
+        
+        if not found:
+            return jsonify({'error': 'Interview session not found'}), 404
+        return jsonify({'success': True})
+        
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    except Exception as e:
+        return jsonify({'error': f'Error updating interview session: {str(e)}'}), 500
+
 @app.route('/api/extract_resume_text', methods=['POST'])
 def extract_resume_text():
     """Extract text from uploaded PDF resume"""
@@ -1298,8 +1657,6 @@ def extract_resume_text():
             return jsonify({'error': 'Only PDF files are allowed'}), 400
         
         # Extract text from PDF using the existing utility function
-        from utils import extract_pdf_text
-        
         try:
             resume_text = extract_pdf_text(file)
             
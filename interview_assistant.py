@@ -4,11 +4,173 @@ Intelligent Interview Assistant for Hiring Companies
 Provides AI-powered interview question generation, candidate evaluation, and interview management
 """
 
-import json
-import re
-from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Tuple
-from utils import get_groq_response, get_openai_response
+import os
+import uuid
+from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional
+from structured_response import request_json, MAX_FIELD_REPAIRS
+from interview_session_store import get_interview_session_store
+from interview_cache import get_interview_question_cache, get_interview_score_cache, make_cache_key, make_score_key
+
+QUESTION_TOPUP_TEMPLATE = """
+        You are an expert interview assistant. Generate exactly {count} more professional interview questions for this position.
+
+        Job Description: {job_description}
+        Difficulty Level: {difficulty}
+        Question Categories: {categories}
+
+        Do not repeat any of these existing questions:
+        {existing}
+
+        IMPORTANT: Return ONLY valid JSON in this exact format:
+
+        {{
+            "questions": [
+                {{
+                    "category": "technical",
+                    "question": "The question text",
+                    "follow_up_questions": ["Follow-up question"],
+                    "evaluation_criteria": ["Criterion"],
+                    "time_minutes": 5
+                }}
+            ]
+        }}
+        """
+
+# Upper bounds on one evaluation request: answers per chunk and prompt characters
+EVALUATION_CHUNK_SIZE = int(os.getenv("INTERVIEW_EVALUATION_CHUNK_SIZE", "5"))
+EVALUATION_CHUNK_CHARS = int(os.getenv("INTERVIEW_EVALUATION_CHUNK_CHARS", "8000"))
+EVALUATION_MAX_WORKERS = int(os.getenv("INTERVIEW_EVALUATION_WORKERS", "4"))
+
+EVALUATION_CHUNK_TEMPLATE = """
+        You are an expert interviewer. Evaluate each of the candidate's interview responses below independently.
+
+        {items}
+
+        For each item, score the response from 1 (poor) to 5 (excellent) against its evaluation criteria.
+
+        IMPORTANT: Return ONLY valid JSON in this exact format, with one entry per item:
+
+        {{
+            "evaluations": [
+                {{
+                    "item": 1,
+                    "score": 4,
+                    "feedback": "Brief assessment of the response",
+                    "strengths": ["Specific strength"],
+                    "improvements": ["Specific area to improve"]
+                }}
+            ]
+        }}
+        """
+
+def lookup_response(responses: Dict, question: Dict, index: int) -> str:
+    """Find the candidate's answer to a question by id, falling back to position"""
+    for key in (question.get('id'), str(question.get('id')), index, str(index)):
+        if key is not None and key in responses:
+            response = responses[key]
+            return response.strip() if isinstance(response, str) else ''
+    return ''
+
+def chunk_evaluation_items(items: List[Dict]) -> List[List[Dict]]:
+    """Split answers into chunks bounded by item count and total prompt characters"""
+    chunks = []
+    current = []
+    current_chars = 0
+    for item in items:
+        size = len(item['question'].get('question', '')) + len(item['response'])
+        if current and (len(current) >= EVALUATION_CHUNK_SIZE or current_chars + size > EVALUATION_CHUNK_CHARS):
+            chunks.append(current)
+            current = []
+            current_chars = 0
+        current.append(item)
+        current_chars += size
+    if current:
+        chunks.append(current)
+    return chunks
+
+def normalize_evaluation(entry) -> Optional[Dict]:
+    """Validate one per-question evaluation; returns None if it is unusable"""
+    if not isinstance(entry, dict):
+        return None
+    try:
+        score = float(entry.get('score'))
+    except (TypeError, ValueError):
+        return None
+    if not 1 <= score <= 5:
+        return None
+    return {
+        'score': score,
+        'feedback': str(entry.get('feedback') or ''),
+        'strengths': [str(s) for s in entry.get('strengths') or [] if s],
+        'improvements': [str(s) for s in entry.get('improvements') or [] if s]
+    }
+
+def get_recommendation(average_score: float) -> str:
+    """Hiring recommendation for an average score on the 1-5 scale"""
+    if average_score >= 4.2:
+        return 'Strong Hire'
+    elif average_score >= 3.5:
+        return 'Hire'
+    elif average_score >= 2.5:
+        return 'Maybe'
+    return 'No Hire'
+
+def merge_evaluations(evaluations: List[Dict], unanswered: int = 0, failed: int = 0) -> Dict:
+    """Combine per-question evaluations (in question order) into the overall assessment"""
+    average = sum(e['score'] for e in evaluations) / len(evaluations)
+    
+    category_scores = {}
+    for evaluation in evaluations:
+        category_scores.setdefault(evaluation['category'], []).append(evaluation['score'])
+    
+    # Strengths from the best-scored answers first, improvements from the weakest first
+    by_score = sorted(evaluations, key=lambda e: -e['score'])
+    key_strengths = list(dict.fromkeys(s for e in by_score for s in e['strengths']))[:5]
+    areas_for_improvement = list(dict.fromkeys(s for e in reversed(by_score) for s in e['improvements']))[:5]
+    
+    recommendation = get_recommendation(average)
+    return {
+        'question_evaluations': evaluations,
+        'category_scores': {category: round(sum(scores) / len(scores), 2) for category, scores in category_scores.items()},
+        'overall_assessment': {
+            'average_score': round(average, 2),
+            'percentage': round(average / 5 * 100, 1),
+            'recommendation': recommendation,
+            'questions_evaluated': len(evaluations),
+            'questions_unanswered': unanswered,
+            'questions_failed': failed
+        },
+        'overall_feedback': {
+            'key_strengths': key_strengths,
+            'areas_for_improvement': areas_for_improvement
+        },
+        'next_steps': {
+            'recommendation': recommendation,
+            'proceed': recommendation in ('Strong Hire', 'Hire')
+        }
+    }
+
+def is_valid_question(item) -> bool:
+    """Check that a generated interview question has usable question text"""
+    return isinstance(item, dict) and isinstance(item.get('question'), str) and bool(item['question'].strip())
+
+def normalize_question(item: Dict, question_id: int, default_category: str) -> Dict:
+    """Fill in optional question fields so every question has the same shape"""
+    try:
+        time_minutes = int(item.get('time_minutes') or 5)
+    except (TypeError, ValueError):
+        time_minutes = 5
+    return {
+        **item,
+        'id': question_id,
+        'category': item.get('category') or default_category,
+        'question': item['question'].strip(),
+        'follow_up_questions': item.get('follow_up_questions') if isinstance(item.get('follow_up_questions'), list) else [],
+        'evaluation_criteria': item.get('evaluation_criteria') if isinstance(item.get('evaluation_criteria'), list) else [],
+        'time_minutes': time_minutes
+    }
 
 class InterviewAssistant:
     """AI-powered interview assistant for hiring companies"""
@@ -41,12 +203,25 @@ class InterviewAssistant:
     def generate_interview_questions(self, model: str, api_key: str, job_description: str, 
                                    candidate_resume: str = "", question_count: int = 10,
                                    categories: List[str] = None, difficulty: str = "mid",
-                                   interview_type: str = "screening") -> Dict:
-        """Generate AI-powered interview questions"""
+                                   interview_type: str = "screening", regenerate: bool = False) -> Dict:
+        """Generate AI-powered interview questions
+        
+        Results are cached per job description, resume and configuration;
+        pass regenerate=True to bypass the cache and replace the cached set.
+        """
         
         if categories is None:
             categories = ['technical', 'behavioral', 'cultural']
         
+        cache = get_interview_question_cache()
+        cache_key = make_cache_key(job_description, candidate_resume, categories, difficulty,
+                                   interview_type, question_count, model)
+        if not regenerate:
+            cached = cache.get(cache_key)
+            if cached is not None:
+                print(f"Interview question cache hit: {cache_key[:12]}")
+                return {**cached, 'cached': True}
+        
         prompt = f"""
         You are an expert interview assistant. Generate exactly {question_count} professional interview questions for this position.
 
@@ -84,72 +259,139 @@ class InterviewAssistant:
         """
 
         try:
-            if model.startswith('gpt-'):
-                response = get_openai_response(model, prompt)
-            else:
-                response = get_groq_response(model, api_key, prompt)
+            # JSON mode plus tolerant parsing; missing top-level fields are re-requested on their own
+            questions_data = request_json(
+                model, api_key, prompt,
+                required_fields=['questions', 'interview_tips', 'total_duration'],
+                validators={'questions': lambda v: isinstance(v, list)}
+            )
             
-            # Try to parse JSON directly first
-            try:
-                return json.loads(response)
-            except json.JSONDecodeError:
-                # If direct parsing fails, try to extract and fix JSON
-                import re
-                
-                # Remove any markdown formatting
-                response = re.sub(r'```json\s*', '', response)
-                response = re.sub(r'```\s*$', '', response)
-                
-                # Try to find JSON object
-                json_match = re.search(r'\{.*\}', response, re.DOTALL)
-                if json_match:
-                    json_str = json_match.group()
-                    
-                    # Common fixes for malformed JSON
-                    json_str = re.sub(r',\s*}', '}', json_str)  # Remove trailing commas
-                    json_str = re.sub(r',\s*]', ']', json_str)  # Remove trailing commas in arrays
-                    json_str = re.sub(r'"(\d+)":', r'\1:', json_str)  # Fix quoted numbers as keys
-                    
-                    try:
-                        return json.loads(json_str)
-                    except json.JSONDecodeError:
-                        pass
-                
-                # If all parsing attempts fail, return a fallback structure
-                return {
-                    'error': f'Failed to parse JSON response: {response[:200]}...',
-                    'questions': [],
-                    'interview_tips': ['Unable to generate tips due to parsing error'],
-                    'total_duration': 60
-                }
+            questions = [q for q in questions_data['questions'] if is_valid_question(q)]
+            
+            # Re-request only the questions that were dropped as malformed
+            for attempt in range(MAX_FIELD_REPAIRS):
+                missing = question_count - len(questions)
+                if missing <= 0:
+                    break
+                print(f"Re-requesting {missing} malformed interview questions (attempt {attempt + 1})")
+                topup_prompt = QUESTION_TOPUP_TEMPLATE.format(
+                    count=missing,
+                    job_description=job_description,
+                    difficulty=difficulty,
+                    categories=', '.join(categories),
+                    existing='\n'.join(f"- {q['question']}" for q in questions) or "(none)"
+                )
+                try:
+                    topup = request_json(model, api_key, topup_prompt, required_fields=['questions'],
+                                         validators={'questions': lambda v: isinstance(v, list)})
+                except Exception as e:
+                    print(f"Question top-up failed: {e}")
+                    continue
+                questions.extend(q for q in topup['questions'][:missing] if is_valid_question(q))
+            
+            questions_data['questions'] = [
+                normalize_question(q, i + 1, categories[0] if categories else 'general')
+                for i, q in enumerate(questions[:question_count])
+            ]
+            if questions_data['questions']:
+                cache.set(cache_key, questions_data)
+            return questions_data
             
         except Exception as e:
             return {'error': str(e)}
 
     def evaluate_responses(self, model: str, api_key: str, questions: List[Dict], 
                          responses: Dict) -> Dict:
-        """Evaluate candidate responses"""
+        """Evaluate candidate responses
         
-        prompt = f"""
-        Evaluate these interview responses:
-        
-        Questions: {json.dumps(questions)}
-        Responses: {json.dumps(responses)}
-        
-        Return JSON with scores (1-5), feedback, and recommendation.
+        Answers are scored in size-bounded chunks evaluated concurrently, and
+        the per-question results are merged into the overall assessment
+        deterministically. Scores are cached per question and answer, so
+        re-evaluating after editing one answer only rescores that answer.
         """
         
         try:
-            if model.startswith('gpt-'):
-                response = get_openai_response(model, prompt)
-            else:
-                response = get_groq_response(model, api_key, prompt)
+            items = []
+            for index, question in enumerate(questions):
+                response = lookup_response(responses, question, index)
+                if response:
+                    items.append({'index': index, 'question': question, 'response': response,
+                                  'score_key': make_score_key(model, question, response)})
             
-            return json.loads(response)
+            if not items:
+                return {'error': 'No responses to evaluate'}
+            
+            score_cache = get_interview_score_cache()
+            cached = score_cache.get_many([item['score_key'] for item in items])
+            pending = [item for item in items if item['score_key'] not in cached]
+            print(f"Evaluating {len(pending)} of {len(items)} answers ({len(items) - len(pending)} cached)")
+            
+            scored = {}
+            chunks = chunk_evaluation_items(pending)
+            if chunks:
+                with ThreadPoolExecutor(max_workers=min(EVALUATION_MAX_WORKERS, len(chunks))) as executor:
+                    for chunk_scores in executor.map(lambda chunk: self._evaluate_chunk(model, api_key, chunk), chunks):
+                        scored.update(chunk_scores)
+                score_cache.set_many(scored)
+            
+            evaluations = []
+            for item in items:
+                evaluation = cached.get(item['score_key']) or scored.get(item['score_key'])
+                if evaluation is None:
+                    continue
+                evaluations.append({
+                    'question_id': item['question'].get('id', item['index'] + 1),
+                    'question': item['question'].get('question', ''),
+                    'category': item['question'].get('category', 'general'),
+                    **evaluation
+                })
+            
+            if not evaluations:
+                return {'error': 'Failed to evaluate responses'}
+            
+            return merge_evaluations(evaluations, unanswered=len(questions) - len(items),
+                                     failed=len(items) - len(evaluations))
             
         except Exception as e:
             return {'error': str(e)}
 
+    def _evaluate_chunk(self, model: str, api_key: str, chunk: List[Dict]) -> Dict[str, Dict]:
+        """Score one chunk of answers; items missing from the reply are retried once on their own"""
+        results = {}
+        remaining = chunk
+        for attempt in range(2):
+            if not remaining:
+                break
+            prompt = EVALUATION_CHUNK_TEMPLATE.format(items='\n\n'.join(
+                f"Item {number}:\nCategory: {item['question'].get('category', 'general')}\n"
+                f"Question: {item['question'].get('question', '')}\n"
+                f"Evaluation criteria: {', '.join(item['question'].get('evaluation_criteria', [])) or 'General quality'}\n"
+                f"Candidate response: {item['response']}"
+                for number, item in enumerate(remaining, start=1)
+            ))
+            try:
+                data = request_json(model, api_key, prompt, required_fields=['evaluations'],
+                                    validators={'evaluations': lambda v: isinstance(v, list)})
+            except Exception as e:
+                print(f"Evaluation chunk failed (attempt {attempt + 1}): {e}")
+                continue
+            
+            for entry in data['evaluations']:
+                evaluation = normalize_evaluation(entry)
+                if evaluation is None:
+                    continue
+                try:
+                    number = int(entry.get('item'))
+                except (TypeError, ValueError):
+                    continue
+                # Out-of-range item numbers are treated as missing, never wrapped around
+                if not 1 <= number <= len(remaining):
+                    continue
+                item = remaining[number - 1]
+                results.setdefault(item['score_key'], evaluation)
+            remaining = [item for item in remaining if item['score_key'] not in results]
+        return results
+
     def generate_interview_report(self, questions_data: Dict, evaluation_data: Dict,
                                 candidate_info: Dict, interviewer_notes: str = "") -> Dict:
         """Generate comprehensive interview report"""
@@ -235,14 +477,62 @@ class InterviewAssistant:
             ]
         })
 
+def warm_up_interview_questions(model: str, api_key: str, job_description: str,
+                                configurations: List[Dict] = None, max_workers: int = 3) -> Dict:
+    """Pre-generate and cache question sets for a role
+    
+    Each configuration may set question_count, categories, difficulty,
+    interview_type and candidate_resume; by default one standard set is
+    generated per interview type. Configurations that are already cached are
+    skipped.
+    """
+    assistant = InterviewAssistant()
+    if configurations is None:
+        configurations = [{'interview_type': interview_type} for interview_type in assistant.interview_types]
+    
+    cache = get_interview_question_cache()
+    summary = {'generated': 0, 'cached': 0, 'failed': 0}
+    pending = []
+    for config in configurations:
+        settings = {
+            'candidate_resume': config.get('candidate_resume', ''),
+            'question_count': int(config.get('question_count', 10)),
+            'categories': config.get('categories') or ['technical', 'behavioral', 'cultural'],
+            'difficulty': config.get('difficulty', 'mid'),
+            'interview_type': config.get('interview_type', 'screening')
+        }
+        cache_key = make_cache_key(job_description, settings['candidate_resume'], settings['categories'],
+                                   settings['difficulty'], settings['interview_type'],
+                                   settings['question_count'], model)
+        if cache.get(cache_key) is not None:
+            summary['cached'] += 1
+        else:
+            pending.append(settings)
+    
+    def generate(settings):
+        return assistant.generate_interview_questions(model=model, api_key=api_key,
+                                                      job_description=job_description, **settings)
+    
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for questions_data in executor.map(generate, pending):
+            if 'error' in questions_data or not questions_data.get('questions'):
+                summary['failed'] += 1
+            else:
+                summary['generated'] += 1
+    
+    print(f"Interview question warm-up: {summary}")
+    return summary
+
 def create_interview_session(candidate_info: Dict, job_description: str, 
-                           interviewer_info: Dict) -> Dict:
-    """Create a new interview session with metadata"""
+                           interviewer_info: Dict, owner_id: int = None) -> Dict:
+    """Create a new interview session with metadata, owned by the given user account"""
     
-    session_id = f"INT_{datetime.now().strftime('%Y%m%d_%H%M%S')}_{candidate_info.get('name', 'Unknown').replace(' ', '_')}"
+    # Random ids: unique even for the same candidate in the same second, and URL-safe
+    session_id = f"INT_{uuid.uuid4().hex}"
     
     session = {
         'session_id': session_id,
+        'owner_id': owner_id,
         'created_at': datetime.now().isoformat(),
         'status': 'scheduled',
         'candidate_info': candidate_info,
@@ -258,24 +548,21 @@ def create_interview_session(candidate_info: Dict, job_description: str,
     
     return session
 
-def save_interview_session(session: Dict, filename: str = None) -> str:
-    """Save interview session to file"""
-    
-    if filename is None:
-        filename = f"interview_session_{session['session_id']}.json"
+def save_interview_session(session: Dict) -> str:
+    """Save interview session to the session store; returns the session id"""
     
     try:
-        with open(filename, 'w', encoding='utf-8') as f:
-            json.dump(session, f, indent=2, ensure_ascii=False)
-        return filename
+        return get_interview_session_store().save(session)
     except Exception as e:
         raise Exception(f"Failed to save interview session: {str(e)}")
 
-def load_interview_session(filename: str) -> Dict:
-    """Load interview session from file"""
+def load_interview_session(session_id: str) -> Dict:
+    """Load interview session from the session store"""
     
     try:
-        with open(filename, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        session = get_interview_session_store().get(session_id)
     except Exception as e:
-        raise Exception(f"Failed to load interview session: {str(e)}") 
\ No newline at end of file
+        raise Exception(f"Failed to load interview session: {str(e)}")
+    if session is None:
+        raise Exception(f"Interview session not found: {session_id}")
+    return session
@@ -0,0 +1,176 @@
+"""
+Caches for the interview assistant
+Generated question sets are keyed by a hash of the normalized job description, the
+resume and the generation settings, so reopening the same role with the same
+configuration loads instantly. Per-question evaluation scores are keyed by the
+question and answer, so re-evaluating an interview only rescores edited answers.
+"""
+
+import os
+import re
+import json
+import hashlib
+import sqlite3
+import threading
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional
+
+# Cached question sets older than this are regenerated
+CACHE_TTL_HOURS = float(os.getenv("INTERVIEW_QUESTION_CACHE_TTL_HOURS", "168"))
+
+def normalize_text(text: str) -> str:
+    """Normalize free text so formatting-only edits map to the same key"""
+    return re.sub(r'\s+', ' ', (text or '').strip().lower())
+
+def text_hash(text: str) -> str:
+    """SHA-256 of normalized text"""
+    return hashlib.sha256(normalize_text(text).encode('utf-8')).hexdigest()
+
+def make_cache_key(job_description: str, candidate_resume: str, categories: List[str],
+                   difficulty: str, interview_type: str, question_count: int, model: str) -> str:
+    """Cache key for one question generation configuration"""
+    payload = json.dumps({
+        'job_description': text_hash(job_description),
+        'resume': text_hash(candidate_resume),
+        'categories': sorted(categories or []),
+        'difficulty': difficulty,
+        'interview_type': interview_type,
+        'question_count': int(question_count),
+        'model': model
+    }, sort_keys=True)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+class InterviewQuestionCache:
+    """SQLite-backed cache of generated interview question sets"""
+
+    def __init__(self, db_path: str = None, ttl_hours: float = CACHE_TTL_HOURS):
+        self.db_path = db_path or os.getenv("INTERVIEW_CACHE_DB_PATH", "smart_ats.db")
+        self.ttl = timedelta(hours=ttl_hours)
+        self._lock = threading.Lock()
+        self._init_db()
+
+    def _connect(self):
+        conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        conn.row_factory = sqlite3.Row
+        return conn
+
+    def _init_db(self):
+        conn = self._connect()
+        cursor = conn.cursor()
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS interview_question_cache (
+                cache_key TEXT PRIMARY KEY,
+                questions_data TEXT NOT NULL,
+                created_at TEXT NOT NULL
+            )
+        ''')
+        conn.commit()
+        conn.close()
+
+    def get(self, cache_key: str) -> Optional[Dict]:
+        """Cached question set for a key, or None if missing or expired"""
+        conn = self._connect()
+        row = conn.execute(
+            "SELECT questions_data, created_at FROM interview_question_cache WHERE cache_key=?", (cache_key,)
+        ).fetchone()
+        conn.close()
+        if row is None:
+            return None
+        if datetime.now() - datetime.fromisoformat(row['created_at']) > self.ttl:
+            return None
+        return json.loads(row['questions_data'])
+
+    def set(self, cache_key: str, questions_data: Dict):
+        """Store a generated question set, replacing any earlier one for the key"""
+        with self._lock:
+            conn = self._connect()
+            conn.execute(
+                "INSERT OR REPLACE INTO interview_question_cache (cache_key, questions_data, created_at) VALUES (?, ?, ?)",
+                (cache_key, json.dumps(questions_data), datetime.now().isoformat())
+            )
+            conn.commit()
+            conn.close()
+
+def make_score_key(model: str, question: Dict, response: str) -> str:
+    """Cache key for the evaluation of one answer to one question"""
+    payload = json.dumps({
+        'model': model,
+        'question': normalize_text(question.get('question', '')),
+        'category': question.get('category', ''),
+        'evaluation_criteria': question.get('evaluation_criteria', []),
+        'response': normalize_text(response)
+    }, sort_keys=True)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+class InterviewScoreCache:
+    """SQLite-backed cache of per-question evaluation results"""
+
+    def __init__(self, db_path: str = None):
+        self.db_path = db_path or os.getenv("INTERVIEW_CACHE_DB_PATH", "smart_ats.db")
+        self._lock = threading.Lock()
+        self._init_db()
+
+    def _connect(self):
+        conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        conn.row_factory = sqlite3.Row
+        return conn
+
+    def _init_db(self):
+        conn = self._connect()
+        conn.execute('''
+            CREATE TABLE IF NOT EXISTS interview_score_cache (
+                score_key TEXT PRIMARY KEY,
+                evaluation TEXT NOT NULL,
+                created_at TEXT NOT NULL
+            )
+        ''')
+        conn.commit()
+        conn.close()
+
+    def get_many(self, score_keys: List[str]) -> Dict[str, Dict]:
+        """Cached evaluations for the given keys (missing keys are left out)"""
+        if not score_keys:
+            return {}
+        conn = self._connect()
+        rows = conn.execute(
+            f"SELECT score_key, evaluation FROM interview_score_cache WHERE score_key IN ({','.join('?' * len(score_keys))})",
+            list(score_keys)
+        ).fetchall()
+        conn.close()
+        return {row['score_key']: json.loads(row['evaluation']) for row in rows}
+
+    def set_many(self, evaluations: Dict[str, Dict]):
+        """Store evaluations keyed by score key"""
+        if not evaluations:
+            return
+        now = datetime.now().isoformat()
+        with self._lock:
+            conn = self._connect()
+            conn.executemany(
+                "INSERT OR REPLACE INTO interview_score_cache (score_key, evaluation, created_at) VALUES (?, ?, ?)",
+                [(key, json.dumps(evaluation), now) for key, evaluation in evaluations.items()]
+            )
+            conn.commit()
+            conn.close()
+
+_cache = None
+_score_cache = None
+_cache_lock = threading.Lock()
+
+def get_interview_question_cache() -> InterviewQuestionCache:
+    """Get the shared interview question cache"""
+    global _cache
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = InterviewQuestionCache()
+    return _cache
+
+def get_interview_score_cache() -> InterviewScoreCache:
+    """Get the shared per-question score cache"""
+    global _score_cache
+    if _score_cache is None:
+        with _cache_lock:
+            if _score_cache is None:
+                _score_cache = InterviewScoreCache()
+    return _score_cache
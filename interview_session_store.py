@@ -0,0 +1,253 @@
+"""
+SQLite-backed store for interview sessions
+Sessions are stored as rows (with responses in their own table) so autosaves
+update only the fields that changed, and sessions can be listed by company,
+status and date without scanning files. Every session belongs to the account
+that created it; reads and writes given an owner_id only see that owner's
+sessions.
+"""
+
+import os
+import json
+import sqlite3
+import threading
+from datetime import datetime
+from typing import Dict, List, Optional
+
+# Session fields stored as JSON text
+JSON_FIELDS = ('candidate_info', 'interviewer_info', 'questions', 'evaluation')
+
+# Fields that can be updated individually after creation
+UPDATABLE_FIELDS = ('status', 'notes', 'questions', 'evaluation', 'duration', 'completed_at')
+
+def _owner_filter(owner_id):
+    """Extra WHERE clause and parameters restricting a query to one owner's sessions"""
+    if owner_id is None:
+        return "", []
+    return " AND owner_id=?", [owner_id]
+
+def validate_responses(responses):
+    """Raise ValueError unless responses maps question ids to response strings"""
+    if not isinstance(responses, dict):
+        raise ValueError("responses must be an object mapping question ids to text")
+    for question_id, response in responses.items():
+        if not isinstance(response, str):
+            raise ValueError(f"Response for question {question_id} must be a string")
+
+class InterviewSessionStore:
+    """Interview sessions with per-field incremental updates"""
+
+    def __init__(self, db_path: str = None):
+        self.db_path = db_path or os.getenv("INTERVIEW_SESSION_DB_PATH", "smart_ats.db")
+        self._lock = threading.Lock()
+        self._init_db()
+
+    def _connect(self):
+        conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        conn.row_factory = sqlite3.Row
+        return conn
+
+    def _init_db(self):
+        conn = self._connect()
+        cursor = conn.cursor()
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS interview_sessions (
+                session_id TEXT PRIMARY KEY,
+                owner_id INTEGER,
+                company TEXT NOT NULL DEFAULT '',
+                candidate_name TEXT NOT NULL DEFAULT '',
+                position TEXT NOT NULL DEFAULT '',
+                status TEXT NOT NULL,
+                candidate_info TEXT NOT NULL,
+                job_description TEXT NOT NULL,
+                interviewer_info TEXT NOT NULL,
+                questions TEXT NOT NULL,
+                evaluation TEXT NOT NULL,
+                notes TEXT NOT NULL DEFAULT '',
+                duration INTEGER,
+                created_at TEXT NOT NULL,
+                updated_at TEXT NOT NULL,
+                completed_at TEXT
+            )
+        ''')
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS interview_responses (
+                session_id TEXT NOT NULL,
+                question_id TEXT NOT NULL,
+                response TEXT NOT NULL,
+                updated_at TEXT NOT NULL,
+                PRIMARY KEY (session_id, question_id)
+            )
+        ''')
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_interview_sessions_owner ON interview_sessions (owner_id, created_at)")
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_interview_sessions_company ON interview_sessions (company, created_at)")
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_interview_sessions_status ON interview_sessions (status, created_at)")
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_interview_sessions_created ON interview_sessions (created_at)")
+        conn.commit()
+        conn.close()
+
+    def save(self, session: Dict) -> str:
+        """Insert a new session (as built by create_interview_session)
+
+        Raises sqlite3.IntegrityError if the session id is already taken.
+        """
+        validate_responses(session.get('responses', {}))
+        now = datetime.now().isoformat()
+        candidate_info = session.get('candidate_info', {})
+        interviewer_info = session.get('interviewer_info', {})
+        with self._lock:
+            conn = self._connect()
+            try:
+                conn.execute(
+                    '''INSERT INTO interview_sessions
+                       (session_id, owner_id, company, candidate_name, position, status, candidate_info, job_description,
+                        interviewer_info, questions, evaluation, notes, duration, created_at, updated_at, completed_at)
+                       VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)''',
+                    (session['session_id'], session.get('owner_id'), interviewer_info.get('company', ''), candidate_info.get('name', ''),
+                     candidate_info.get('position', ''), session.get('status', 'scheduled'),
+                     json.dumps(candidate_info), session.get('job_description', ''), json.dumps(interviewer_info),
+                     json.dumps(session.get('questions', [])), json.dumps(session.get('evaluation', {})),
+                     session.get('notes', ''), session.get('duration'), session.get('created_at', now), now,
+                     session.get('completed_at'))
+                )
+                conn.executemany(
+                    "INSERT INTO interview_responses (session_id, question_id, response, updated_at) VALUES (?, ?, ?, ?)",
+                    [(session['session_id'], str(question_id), response, now)
+                     for question_id, response in session.get('responses', {}).items()]
+                )
+                conn.commit()
+            finally:
+                conn.close()
+        return session['session_id']
+
+    def get(self, session_id: str, owner_id: int = None) -> Optional[Dict]:
+        """Load a session in the create_interview_session format, or None if it doesn't exist (for this owner)"""
+        owner_clause, owner_params = _owner_filter(owner_id)
+        conn = self._connect()
+        row = conn.execute(
+            f"SELECT * FROM interview_sessions WHERE session_id=?{owner_clause}", [session_id] + owner_params
+        ).fetchone()
+        responses = conn.execute(
+            "SELECT question_id, response FROM interview_responses WHERE session_id=?", (session_id,)
+        ).fetchall() if row else []
+        conn.close()
+        if row is None:
+            return None
+
+        session = {
+            'session_id': row['session_id'],
+            'owner_id': row['owner_id'],
+            'created_at': row['created_at'],
+            'updated_at': row['updated_at'],
+            'status': row['status'],
+            'job_description': row['job_description'],
+            'notes': row['notes'],
+            'duration': row['duration'],
+            'completed_at': row['completed_at'],
+            'responses': {r['question_id']: r['response'] for r in responses}
+        }
+        for field in JSON_FIELDS:
+            session[field] = json.loads(row[field])
+        return session
+
+    def update_fields(self, session_id: str, owner_id: int = None, **fields) -> bool:
+        """Update individual session fields; returns False if the session doesn't exist (for this owner)"""
+        unknown = set(fields) - set(UPDATABLE_FIELDS)
+        if unknown:
+            raise ValueError(f"Cannot update fields: {', '.join(sorted(unknown))}")
+        if fields.get('status') == 'completed' and 'completed_at' not in fields:
+            fields['completed_at'] = datetime.now().isoformat()
+
+        values = [json.dumps(value) if field in JSON_FIELDS else value for field, value in fields.items()]
+        assignments = ', '.join(f"{field}=?" for field in fields)
+        owner_clause, owner_params = _owner_filter(owner_id)
+        with self._lock:
+            conn = self._connect()
+            cursor = conn.execute(
+                f"UPDATE interview_sessions SET {assignments + ', ' if assignments else ''}updated_at=? "
+                f"WHERE session_id=?{owner_clause}",
+                values + [datetime.now().isoformat(), session_id] + owner_params
+            )
+            conn.commit()
+            conn.close()
+        return cursor.rowcount > 0
+
+    def set_responses(self, session_id: str, responses: Dict[str, str], owner_id: int = None) -> bool:
+        """Upsert only the given question responses; returns False if the session doesn't exist (for this owner)"""
+        validate_responses(responses)
+        now = datetime.now().isoformat()
+        owner_clause, owner_params = _owner_filter(owner_id)
+        with self._lock:
+            conn = self._connect()
+            try:
+                cursor = conn.execute(
+                    f"UPDATE interview_sessions SET updated_at=? WHERE session_id=?{owner_clause}",
+                    [now, session_id] + owner_params
+                )
+                if cursor.rowcount == 0:
+                    return False
+                conn.executemany(
+                    "INSERT OR REPLACE INTO interview_responses (session_id, question_id, response, updated_at) VALUES (?, ?, ?, ?)",
+                    [(session_id, str(question_id), response, now) for question_id, response in responses.items()]
+                )
+                conn.commit()
+                return True
+            finally:
+                conn.close()
+
+    def list_sessions(self, owner_id: int = None, company: str = None, status: str = None, date_from: str = None,
+                      date_to: str = None, limit: int = 50) -> List[Dict]:
+        """Session summaries, newest first, filtered by owner, company, status and creation date"""
+        conditions = []
+        params = []
+        if owner_id is not None:
+            conditions.append("owner_id=?")
+            params.append(owner_id)
+        if company:
+            conditions.append("company=?")
+            params.append(company)
+        if status:
+            conditions.append("status=?")
+            params.append(status)
+        if date_from:
+            conditions.append("created_at>=?")
+            params.append(date_from)
+        if date_to:
+            conditions.append("created_at<?")
+            params.append(date_to)
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+
+        conn = self._connect()
+        rows = conn.execute(
+            f'''SELECT session_id, company, candidate_name, position, status, created_at, updated_at, completed_at
+                FROM interview_sessions {where} ORDER BY created_at DESC LIMIT ?''',
+            params + [int(limit)]
+        ).fetchall()
+        conn.close()
+        return [dict(row) for row in rows]
+
+    def delete(self, session_id: str, owner_id: int = None) -> bool:
+        """Delete a session and its responses; returns False if the session doesn't exist (for this owner)"""
+        owner_clause, owner_params = _owner_filter(owner_id)
+        with self._lock:
+            conn = self._connect()
+            cursor = conn.execute(
+                f"DELETE FROM interview_sessions WHERE session_id=?{owner_clause}", [session_id] + owner_params
+            )
+            if cursor.rowcount:
+                conn.execute("DELETE FROM interview_responses WHERE session_id=?", (session_id,))
+            conn.commit()
+            conn.close()
+        return cursor.rowcount > 0
+
+_store = None
+_store_lock = threading.Lock()
+
+def get_interview_session_store() -> InterviewSessionStore:
+    """Get the shared interview session store"""
+    global _store
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                _store = InterviewSessionStore()
+    return _store
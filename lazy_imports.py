@@ -0,0 +1,78 @@
+"""
+Lazy loading of heavy subsystems
+The LLM clients, LangChain, the RAG stack, ReportLab and the scraping/PDF
+parsing libraries take seconds to import. Modules registered here are only
+imported the first time one of their attributes is used, which keeps app
+import (gunicorn worker boot, autoreload) fast. scripts/import_time_report.py
+checks that none of the registered modules creep back into app import.
+"""
+
+import importlib
+
+# Subsystem -> modules it pulls in. flask_app must not import these eagerly.
+LAZY_SUBSYSTEMS = {
+    'llm': ('utils',),
+    'scraping': ('requests', 'bs4'),
+    'mcq': ('mcq_utils', 'question_bank', 'psychometric_scoring'),
+    'interview': ('interview_assistant', 'interview_session_store', 'interview_cache'),
+    'pdf_parsing': ('PyPDF2',),
+    'pdf_rendering': ('pdf_generator', 'pdf_export'),
+    'rag': ('rag.embeddings', 'rag.vector_store', 'rag.retriever', 'rag.llm_service',
+            'rag.rag_qa_chain', 'rag.conversation_store'),
+}
+
+_registered_modules = {module for modules in LAZY_SUBSYSTEMS.values() for module in modules}
+
+def load_module(module_name: str):
+    """Import a registered module (importlib makes concurrent first imports safe)"""
+    if module_name not in _registered_modules:
+        raise KeyError(f"Module '{module_name}' is not registered in LAZY_SUBSYSTEMS")
+    return importlib.import_module(module_name)
+
+def load_subsystem(subsystem: str) -> bool:
+    """Import every module of a subsystem; False (with a warning) if any is missing"""
+    try:
+        for module_name in LAZY_SUBSYSTEMS[subsystem]:
+            load_module(module_name)
+        return True
+    except ImportError as e:
+        print(f"Warning: {subsystem} subsystem not available: {e}")
+        return False
+
+class LazyModule:
+    """Stand-in for a module that imports it on first attribute access"""
+
+    def __init__(self, module_name: str):
+        self._module_name = module_name
+
+    def __getattr__(self, name):
+        return getattr(load_module(self._module_name), name)
+
+class LazyAttribute:
+    """Stand-in for a function or class that imports its module on first call"""
+
+    def __init__(self, module_name: str, attribute: str):
+        self._module_name = module_name
+        self._attribute = attribute
+        self._target = None
+
+    def resolve(self):
+        if self._target is None:
+            self._target = getattr(load_module(self._module_name), self._attribute)
+        return self._target
+
+    def __call__(self, *args, **kwargs):
+        return self.resolve()(*args, **kwargs)
+
+    def __getattr__(self, name):
+        return getattr(self.resolve(), name)
+
+def lazy_module(module_name: str) -> LazyModule:
+    return LazyModule(module_name)
+
+def lazy_attribute(module_name: str, attribute: str) -> LazyAttribute:
+    return LazyAttribute(module_name, attribute)
+
+def registered_modules():
+    """Every module that is supposed to load lazily"""
+    return sorted(_registered_modules)
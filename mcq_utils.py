@@ -1,6 +1,6 @@
 # Import required libraries
 import os
-from typing import List
+from typing import List, Optional
 from dotenv import load_dotenv
 from langchain_groq import ChatGroq
 from langchain_openai import ChatOpenAI
@@ -10,6 +10,10 @@ from langchain.chains import LLMChain
 from langchain.memory import ConversationBufferMemory
 from pydantic import BaseModel, Field, validator
 import json
+import re
+import atexit
+import threading
+from psychometric_scoring import PERSONALITY_TRAITS, WORKPLACE_BEHAVIORS, score_response
 
 # Load environment variables from .env file
 load_dotenv()
@@ -19,6 +23,8 @@ class MCQQuestion(BaseModel):
     # Define the structure of an MCQ with field descriptions
     question: str = Field(description="The question text")
     options: List[str] = Field(description="List of 5 possible answers")
+    dimension: Optional[str] = Field(default=None, description="The trait or behavior the question assesses")
+    reverse_keyed: bool = Field(default=False, description="True if agreeing indicates a lower level of the dimension")
     # correct_answer: str = Field(description="The correct answer from the options")
 
     # Custom validator to clean question text
@@ -29,19 +35,139 @@ class MCQQuestion(BaseModel):
             return v.get('description', str(v))
         return str(v)
 
-def get_llm_for_model(model):
-    """Get the appropriate LLM client based on the model type"""
-    # OpenAI models
-    openai_models = ["gpt-4o", "gpt-4o-mini", "gpt-4-turbo", "gpt-3.5-turbo"]
+# Batch schema: a list of questions returned from a single LLM call
+class MCQQuestionList(BaseModel):
+    questions: List[MCQQuestion] = Field(description="List of generated questions")
+
+LIKERT_OPTIONS = ["Strongly Agree", "Agree", "Neutral", "Disagree", "Strongly Disagree"]
+
+# Dimensions assessed by each question category
+CATEGORY_DIMENSIONS = {
+    'Personality Traits': PERSONALITY_TRAITS,
+    'Workplace Behaviors': WORKPLACE_BEHAVIORS
+}
+
+# Upper bound on questions requested per LLM call; keeps responses well within output limits
+MAX_QUESTIONS_PER_CALL = 15
+
+# How many previously generated questions are shown to the model for duplicate avoidance
+DEDUP_PROMPT_WINDOW = 30
+
+BATCH_MCQ_PROMPT = ChatPromptTemplate.from_messages([
+    ("system", """
+    Generate exactly {count} different questions designed to assess the following topics in a professional context: {dimensions}.
+    {topic_guidance}
+    Spread the questions evenly across the topics and set "dimension" to the topic each question assesses.
+    Phrase roughly one in four questions so that agreeing indicates a LOWER level of its topic, and set "reverse_keyed" to true for those.
+    Each question should be answered using one of the following options:
+    "Strongly Agree", "Agree", "Neutral", "Disagree", "Strongly Disagree".
+
+    Do not repeat or closely paraphrase any of these existing questions:
+    {existing_questions}
+
+    You must return a valid JSON object with the following structure:
+    {{
+    "questions": [
+        {{
+        "question": "A clear, specific question",
+        "options": ["Strongly Agree", "Agree", "Neutral", "Disagree", "Strongly Disagree"],
+        "dimension": "One of the listed topics",
+        "reverse_keyed": false
+        }}
+    ]
+    }}
+
+    Return ONLY the JSON. Do not add explanations, formatting, or markdown."""),
+    ("human", "{input}")
+])
+
+# Single-question prompts used by QuestionGenerator.generate_mcq, built once at import
+MCQ_PARSER = PydanticOutputParser(pydantic_object=MCQQuestion)
+
+PERSONALITY_MCQ_PROMPT = ChatPromptTemplate.from_messages([
+    ("system", """
+                    Generate a question designed to assess one of the following topics in a professional context: 'Conscientiousness', 'Extraversion', 'Agreeableness', 'Emotional Stability', 'Openness to Experience'.
+                    Each question should be answered using one of the following options:
+                    "Strongly Agree", "Agree", "Neutral", "Disagree", "Strongly Disagree".
+                 
+                    Review the previous conversation history and ensure that the generated question is not a duplicate or close paraphrase of any previously generated question.
+
+                    You must return a valid JSON object with the following structure:
+                    {{
+                    "question": "A clear, specific question",
+                    "options": ["Strongly Agree", "Agree", "Neutral", "Disagree", "Strongly Disagree"]
+                    }}
+
+                    Return ONLY the JSON. Do not add explanations, formatting, or markdown. """),
+    MessagesPlaceholder(variable_name="history"),  # Inject memory here
+    ("human", "{input}")  # Insert user input dynamically
+])
+
+WORKPLACE_MCQ_PROMPT = ChatPromptTemplate.from_messages([
+    ("system", """
+                Generate a behavioral question that assesses a candidate's general tendencies towards one of the following topics in the workplace: 'Teamwork', 'Problem-solving', 'Adaptability', 'Initiative', 'Communication', 'Time Management'.
+                Each question should be answered using one of the following options:
+                "Strongly Agree", "Agree", "Neutral", "Disagree", "Strongly Disagree".
+
+                Review the previous conversation history and ensure that the generated question is not a duplicate or close paraphrase of any previously generated question.
+
+                You must return a valid JSON object with the following structure:
+                {{
+                "question": "A clear, specific question",
+                "options": ["Strongly Agree", "Agree", "Neutral", "Disagree", "Strongly Disagree"]
+                }}
+
+                Return ONLY the JSON. Do not add explanations, formatting, or markdown.
+            """),
+    MessagesPlaceholder(variable_name="history"),  # Inject memory here
+    ("human", "{input}")  # Insert user input dynamically
+])
+
+def normalize_question_text(text):
+    """Normalize question text for duplicate detection"""
+    return re.sub(r'[^a-z0-9 ]', '', re.sub(r'\s+', ' ', text.lower())).strip()
+
+def parse_mcq_batch(response):
+    """Parse a batch response, validating each question independently
     
-    if model in openai_models:
+    Returns the list of valid MCQQuestion objects; malformed items are dropped
+    so only they need to be regenerated.
+    """
+    text = response.strip()
+    start = min((idx for idx in (text.find('{'), text.find('[')) if idx != -1), default=-1)
+    if start == -1:
+        return []
+    end = max(text.rfind('}'), text.rfind(']')) + 1
+    data = json.loads(text[start:end])
+    items = data.get('questions', []) if isinstance(data, dict) else data
+
+    questions = []
+    for item in items:
+        try:
+            question = MCQQuestion(**item)
+        except Exception:
+            continue
+        if question.question and len(question.options) == 5:
+            questions.append(question)
+    return questions
+
+# Models served through the OpenAI API; everything else goes to Groq
+OPENAI_MODELS = ["gpt-4o", "gpt-4o-mini", "gpt-4-turbo", "gpt-3.5-turbo"]
+
+# LLM clients keyed by (model, temperature, provider), reused across requests and threads
+_llm_cache = {}
+_llm_cache_lock = threading.Lock()
+
+def _create_llm(model, temperature, provider):
+    """Construct a new LLM client for the given provider"""
+    if provider == "openai":
         api_key = os.getenv("OPENAI_API_KEY")
         if not api_key:
             raise ValueError(f"OPENAI_API_KEY not found in environment variables for model {model}")
         return ChatOpenAI(
             api_key=api_key,
             model=model,
-            temperature=0.9
+            temperature=temperature
         )
     else:
         # Groq models (default)
@@ -51,9 +177,48 @@ def get_llm_for_model(model):
         return ChatGroq(
             api_key=api_key, 
             model=model,
-            temperature=0.9
+            temperature=temperature
         )
 
+def get_llm_for_model(model, temperature=0.9):
+    """Get the appropriate LLM client based on the model type
+    
+    Clients are cached per (model, temperature, provider), so their HTTP
+    connection pools are shared instead of rebuilt for every call.
+    """
+    provider = "openai" if model in OPENAI_MODELS else "groq"
+    key = (model, temperature, provider)
+
+    llm = _llm_cache.get(key)
+    if llm is None:
+        with _llm_cache_lock:
+            llm = _llm_cache.get(key)
+            if llm is None:
+                llm = _create_llm(model, temperature, provider)
+                _llm_cache[key] = llm
+    return llm
+
+def close_llm_clients():
+    """Close the HTTP clients of all cached LLMs and empty the cache
+    
+    Registered with atexit; can also be called explicitly (e.g. after rotating API keys).
+    """
+    with _llm_cache_lock:
+        clients = list(_llm_cache.values())
+        _llm_cache.clear()
+
+    for llm in clients:
+        # ChatOpenAI keeps its openai.OpenAI client as root_client; ChatGroq's
+        # completions resource holds the groq.Groq client as _client
+        http_client = getattr(llm, 'root_client', None) or getattr(getattr(llm, 'client', None), '_client', None)
+        try:
+            if http_client is not None and hasattr(http_client, 'close'):
+                http_client.close()
+        except Exception as e:
+            print(f"Error closing LLM client: {e}")
+
+atexit.register(close_llm_clients)
+
 class QuestionGenerator:
     def __init__(self, model):
         """
@@ -66,8 +231,79 @@ class QuestionGenerator:
         # Create memory to maintain chat history
         self.memory = ConversationBufferMemory(return_messages=True)
 
-        self.Personality_Traits = ['Conscientiousness', 'Extraversion', 'Agreeableness', 'Emotional Stability', 'Openness to Experience']
-        self.Workplace_Behaviors = ['Teamwork', 'Problem-solving', 'Adaptability', 'Initiative', 'Communication', 'Time Management']
+        self.Personality_Traits = list(PERSONALITY_TRAITS)
+        self.Workplace_Behaviors = list(WORKPLACE_BEHAVIORS)
+
+        # Question texts generated so far, used by the batch API for duplicate avoidance
+        self.generated_questions = []
+        self._seen_questions = set()
+
+    def _remember_question(self, question_text):
+        """Record a question; returns False if it duplicates an earlier one"""
+        key = normalize_question_text(question_text)
+        if key in self._seen_questions:
+            return False
+        self._seen_questions.add(key)
+        self.generated_questions.append(question_text)
+        return True
+
+    def remember_questions(self, question_texts):
+        """Record questions sourced elsewhere (e.g. the question bank) so generated ones don't repeat them"""
+        for question_text in question_texts:
+            self._remember_question(question_text)
+
+    def generate_mcq_batch(self, topic: str, count: int, max_attempts: int = 3,
+                           dimensions: Optional[List[str]] = None) -> List[MCQQuestion]:
+        """
+        Generate several Multiple Choice Questions per LLM call
+        - Requests up to MAX_QUESTIONS_PER_CALL questions as a JSON list
+        - Validates each question independently and tops up only the missing ones
+        - Avoids duplicates using a bounded list of earlier questions instead of chat history
+        - dimensions restricts the questions to some of the topic's dimensions
+        """
+        if topic == 'Personality Traits':
+            topic_dimensions = self.Personality_Traits
+            topic_guidance = "Each question should assess a personality trait."
+        else:
+            topic_dimensions = self.Workplace_Behaviors
+            topic_guidance = "Each question should be behavioral, assessing a candidate's general tendencies in the workplace."
+        dimensions = [d for d in dimensions if d in topic_dimensions] if dimensions else topic_dimensions
+        if not dimensions:
+            raise ValueError(f"No valid dimensions for topic '{topic}'")
+
+        questions = []
+        failed_attempts = 0
+        while len(questions) < count:
+            needed = min(count - len(questions), MAX_QUESTIONS_PER_CALL)
+            existing = self.generated_questions[-DEDUP_PROMPT_WINDOW:]
+            messages = BATCH_MCQ_PROMPT.format_messages(
+                count=needed,
+                dimensions=', '.join(f"'{d}'" for d in dimensions),
+                topic_guidance=topic_guidance,
+                existing_questions='\n'.join(f"- {q}" for q in existing) if existing else "(none)",
+                input=" "
+            )
+            try:
+                response = self.llm.invoke(messages)
+                batch = parse_mcq_batch(response.content if hasattr(response, 'content') else str(response))
+            except Exception as e:
+                print(f"Batch MCQ generation failed: {e}")
+                batch = []
+
+            added = 0
+            for question in batch[:needed]:
+                if question.dimension not in dimensions:
+                    question.dimension = None
+                if self._remember_question(question.question):
+                    questions.append(question)
+                    added += 1
+
+            if added == 0:
+                failed_attempts += 1
+                if failed_attempts >= max_attempts:
+                    raise RuntimeError(f"Failed to generate {count} valid MCQs after {max_attempts} attempts (got {len(questions)})")
+
+        return questions
 
     def generate_mcq(self, topic: str) -> MCQQuestion:
         """
@@ -78,51 +314,7 @@ class QuestionGenerator:
         - Multiple retry attempts on failure
         - Validation of generated questions
         """
-        # Set up Pydantic parser for type checking and validation
-        mcq_parser = PydanticOutputParser(pydantic_object=MCQQuestion)
-
-        if topic == 'Personality Traits':
-            # Define the prompt template with specific format requirements
-            topic = ', '.join(self.Personality_Traits)
-            prompt_template = ChatPromptTemplate.from_messages([
-                ("system", """
-                    Generate a question designed to assess one of the following topics in a professional context: 'Conscientiousness', 'Extraversion', 'Agreeableness', 'Emotional Stability', 'Openness to Experience'.
-                    Each question should be answered using one of the following options:
-                    "Strongly Agree", "Agree", "Neutral", "Disagree", "Strongly Disagree".
-                 
-                    Review the previous conversation history and ensure that the generated question is not a duplicate or close paraphrase of any previously generated question.
-
-                    You must return a valid JSON object with the following structure:
-                    {{
-                    "question": "A clear, specific question",
-                    "options": ["Strongly Agree", "Agree", "Neutral", "Disagree", "Strongly Disagree"]
-                    }}
-
-                    Return ONLY the JSON. Do not add explanations, formatting, or markdown. """),
-                    MessagesPlaceholder(variable_name="history"),  # ✅ This is how memory is injected
-                    ("human", "{input}")  # Insert user input dynamically
-            ])
-        else:
-            topic = ', '.join(self.Workplace_Behaviors)
-            prompt_template = ChatPromptTemplate.from_messages([
-                ("system", """
-                Generate a behavioral question that assesses a candidate's general tendencies towards one of the following topics in the workplace: 'Teamwork', 'Problem-solving', 'Adaptability', 'Initiative', 'Communication', 'Time Management'.
-                Each question should be answered using one of the following options:
-                "Strongly Agree", "Agree", "Neutral", "Disagree", "Strongly Disagree".
-
-                Review the previous conversation history and ensure that the generated question is not a duplicate or close paraphrase of any previously generated question.
-
-                You must return a valid JSON object with the following structure:
-                {{
-                "question": "A clear, specific question",
-                "options": ["Strongly Agree", "Agree", "Neutral", "Disagree", "Strongly Disagree"]
-                }}
-
-                Return ONLY the JSON. Do not add explanations, formatting, or markdown.
-            """),
-            MessagesPlaceholder(variable_name="history"),  # Inject memory here
-            ("human", "{input}")  # Insert user input dynamically
-        ])
+        prompt_template = PERSONALITY_MCQ_PROMPT if topic == 'Personality Traits' else WORKPLACE_MCQ_PROMPT
         # Generate response using LLM
         # Set up the chain using the appropriate model, memory, and custom prompt template
         chain = LLMChain(
@@ -137,7 +329,7 @@ class QuestionGenerator:
             try:
                 # Generate response using LLM
                 response = chain.run(input= " ")
-                parsed_response = mcq_parser.parse(response)
+                parsed_response = MCQ_PARSER.parse(response)
                 
                 # Validate the generated question meets requirements
                 if not parsed_response.question or len(parsed_response.options) != 5:
@@ -150,14 +342,8 @@ class QuestionGenerator:
                     raise RuntimeError(f"Failed to generate valid MCQ after {max_attempts} attempts: {str(e)}")
                 continue
 
-def get_response(model, result):
-    """Get AI analysis response using the appropriate model"""
-    llm = get_llm_for_model(model)
-
-    question = result['question']
-    user_response = result['user_answer']
-
-    prompt_template = ChatPromptTemplate.from_template("""
+# Per-question analysis prompt used by get_response
+RESPONSE_ANALYSIS_PROMPT = ChatPromptTemplate.from_template("""
 You are an intelligent psychometric analysis agent.
 
 Given a psychometric question and a user's Likert-scale response, do the following:
@@ -219,10 +405,17 @@ Expected Output:
 }}
 """)
 
+def get_response(model, result):
+    """Get AI analysis response using the appropriate model"""
+    llm = get_llm_for_model(model)
+
+    question = result['question']
+    user_response = result['user_answer']
+
     # Generate response using LLM
     chain = LLMChain(
         llm=llm,
-        prompt=prompt_template,
+        prompt=RESPONSE_ANALYSIS_PROMPT,
         verbose=False
     )
 
@@ -270,61 +463,160 @@ Expected Output:
                 return create_fallback_response(question, user_response)
             continue
 
-def create_fallback_response(question, user_response):
+def create_fallback_response(question, user_response, dimension=None, reverse_keyed=False):
     """Create a fallback response when AI analysis fails"""
-    # Simple heuristic-based analysis
-    question_lower = question.lower()
-    
-    # Determine dimension based on keywords in question
-    if any(word in question_lower for word in ['team', 'collaborate', 'group', 'together']):
-        dimension = 'Teamwork'
-    elif any(word in question_lower for word in ['lead', 'initiative', 'take charge', 'responsibility']):
-        dimension = 'Initiative'
-    elif any(word in question_lower for word in ['communicate', 'speak', 'express', 'listen']):
-        dimension = 'Communication'
-    elif any(word in question_lower for word in ['problem', 'solve', 'challenge', 'solution']):
-        dimension = 'Problem-solving'
-    elif any(word in question_lower for word in ['adapt', 'change', 'flexible', 'adjust']):
-        dimension = 'Adaptability'
-    elif any(word in question_lower for word in ['time', 'deadline', 'schedule', 'organize']):
-        dimension = 'Time Management'
-    elif any(word in question_lower for word in ['detail', 'careful', 'thorough', 'precise']):
-        dimension = 'Conscientiousness'
-    elif any(word in question_lower for word in ['social', 'outgoing', 'people', 'interact']):
-        dimension = 'Extraversion'
-    elif any(word in question_lower for word in ['help', 'kind', 'considerate', 'cooperative']):
-        dimension = 'Agreeableness'
-    elif any(word in question_lower for word in ['calm', 'stress', 'pressure', 'emotional']):
-        dimension = 'Emotional Stability'
-    elif any(word in question_lower for word in ['creative', 'new', 'innovative', 'ideas']):
-        dimension = 'Openness to Experience'
-    else:
-        dimension = 'Communication'  # Default fallback
-    
-    # Determine score based on response
-    score_map = {
-        'Strongly Agree': 1.0,
-        'Agree': 0.75,
-        'Neutral': 0.5,
-        'Disagree': 0.25,
-        'Strongly Disagree': 0.0
-    }
+    # Deterministic keyword/score-map analysis shared with the scoring engine
+    return score_response(question, user_response, dimension, reverse_keyed)
+
+# Data model for one item of a batched assessment evaluation; scores are
+# computed deterministically, so only the reasoning comes from the LLM
+class ResponseEvaluation(BaseModel):
+    id: int = Field(description="Item number from the request")
+    reasoning: str = Field(description="What the response reveals about the user")
+
+    @validator('reasoning')
+    def check_reasoning(cls, v):
+        if not v.strip():
+            raise ValueError("Empty reasoning")
+        return v
+
+BATCH_EVALUATION_PROMPT = ChatPromptTemplate.from_template("""
+You are an intelligent psychometric analysis agent.
+
+Each of the {count} numbered items below is a psychometric question, the user's Likert-scale
+response, and the result already computed for it: the dimension assessed, a normalized score
+between 0.0 and 1.0 and its label (Low, Moderate or High). Reverse-keyed questions are phrased
+so that agreeing indicates a LOWER level of the dimension; their score already accounts for that.
+
+For EACH item, write a brief reasoning describing what the response reveals about the user in
+relation to that dimension. The reasoning must agree with the given score and label; do not
+re-score the item.
+
+Items:
+{items}
+
+You must return only a valid JSON object with one entry per item, using the item numbers as "id":
+{{
+  "evaluations": [
+    {{
+      "id": 1,
+      "reasoning": "..."
+    }}
+  ]
+}}
+Do not include any explanation, headers or markdown.
+""")
+
+def parse_evaluation_batch(response, expected_ids):
+    """Parse a batched evaluation response, validating each item independently
     
-    score = score_map.get(user_response, 0.5)
+    Returns a dict of id -> ResponseEvaluation for the valid items; malformed or
+    missing items are left out so only they need to be retried.
+    """
+    text = response.strip()
+    start = min((idx for idx in (text.find('{'), text.find('[')) if idx != -1), default=-1)
+    if start == -1:
+        return {}
+    end = max(text.rfind('}'), text.rfind(']')) + 1
+    data = json.loads(text[start:end])
+    items = data.get('evaluations', []) if isinstance(data, dict) else data
+
+    evaluations = {}
+    for item in items:
+        try:
+            evaluation = ResponseEvaluation(**item)
+        except Exception:
+            continue
+        if evaluation.id in expected_ids and evaluation.id not in evaluations:
+            evaluations[evaluation.id] = evaluation
+    return evaluations
+
+def get_batch_response(model, results, max_attempts=3):
+    """Get AI-written reasoning for all scored answers in one LLM call
     
-    # Determine label
-    if score <= 0.33:
-        label = 'Low'
-    elif score <= 0.66:
-        label = 'Moderate'
-    else:
-        label = 'High'
+    results come from psychometric_scoring.score_assessment. Returns a list
+    aligned with results, each entry in the same format as get_response; the
+    dimension, score and label are the computed ones. Items that come back
+    malformed are retried on their own; any still invalid after max_attempts
+    use create_fallback_response.
+    """
+    llm = get_llm_for_model(model)
+    evaluations = {}
+    pending = list(range(1, len(results) + 1))
+
+    for attempt in range(max_attempts):
+        if not pending:
+            break
+
+        items = []
+        for item_id in pending:
+            result = results[item_id - 1]
+            items.append(
+                f'{item_id}. Question: "{result["question"]}"\n'
+                f'   Likert Response: "{result["user_answer"]}"\n'
+                f'   Dimension: {result["Dimension"]}\n'
+                f'   Score: {result["Score"]:.2f} ({result["Label"]})\n'
+                f'   Reverse-keyed: {"yes" if result.get("reverse_keyed") else "no"}'
+            )
+
+        try:
+            response = llm.invoke(BATCH_EVALUATION_PROMPT.format_messages(count=len(pending), items='\n'.join(items)))
+            parsed = parse_evaluation_batch(response.content if hasattr(response, 'content') else str(response), set(pending))
+        except Exception as e:
+            print(f"Batch evaluation failed (attempt {attempt + 1}): {e}")
+            parsed = {}
+
+        evaluations.update(parsed)
+        pending = [item_id for item_id in pending if item_id not in evaluations]
+        if pending:
+            print(f"Batch evaluation attempt {attempt + 1}: {len(pending)} items invalid or missing")
+
+    responses = []
+    for item_id, result in enumerate(results, start=1):
+        evaluation = evaluations.get(item_id)
+        if evaluation is None:
+            responses.append(create_fallback_response(
+                result['question'], result['user_answer'], result['Dimension'], result.get('reverse_keyed', False)
+            ))
+            continue
+        responses.append({
+            'inferred_dimension': result['Dimension'],
+            'original_response': result['user_answer'],
+            'normalized_score': result['Score'],
+            'label': result['Label'],
+            'reasoning': evaluation.reasoning
+        })
+    return responses
+
+NARRATIVE_PROMPT = ChatPromptTemplate.from_template("""
+You are an intelligent psychometric analysis agent.
+
+A candidate completed a Likert-scale assessment. Their scores have already been computed
+(normalized 0.0 to 1.0, labelled Low / Moderate / High) for each dimension:
+
+{dimension_summary}
+
+Write a short narrative (3 to 5 sentences) summarizing the candidate's strengths and
+development areas based only on these scores. Do not restate the numbers and do not
+use markdown.
+""")
+
+def generate_assessment_narrative(model, dimension_scores):
+    """Summarize precomputed dimension scores in a single LLM call
     
-    return {
-        'inferred_dimension': dimension,
-        'original_response': user_response,
-        'normalized_score': score,
-        'label': label,
-        'reasoning': f'Based on the response "{user_response}" to a question about {dimension.lower()}, this indicates a {label.lower()} level in this dimension.'
-    }
-            
\ No newline at end of file
+    Returns None if the model call fails; scoring itself never depends on the LLM.
+    """
+    if not dimension_scores:
+        return None
+
+    dimension_summary = '\n'.join(
+        f"- {dimension}: {info['score']:.2f} ({info['label']}, {info['count']} questions)"
+        for dimension, info in dimension_scores.items()
+    )
+    try:
+        llm = get_llm_for_model(model)
+        response = llm.invoke(NARRATIVE_PROMPT.format_messages(dimension_summary=dimension_summary))
+        return (response.content if hasattr(response, 'content') else str(response)).strip()
+    except Exception as e:
+        print(f"Error generating assessment narrative: {e}")
+        return None
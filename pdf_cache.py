@@ -0,0 +1,285 @@
+"""
+Cache of rendered PDF documents
+Rendered bytes are kept in a bounded in-memory LRU backed by a bounded disk
+directory, keyed by a hash of everything that affects the output. The key also
+serves as the ETag for download endpoints. Downloads stream larger PDFs from
+disk and only keep documents up to PDF_CACHE_MEMORY_ITEM_BYTES in memory.
+"""
+
+import os
+import json
+import hashlib
+import tempfile
+import threading
+from io import BytesIO
+from contextlib import contextmanager
+from collections import OrderedDict
+from typing import BinaryIO, Callable, Optional
+
+# Bump when template or layout changes alter the rendered output
+PDF_RENDER_VERSION = "1"
+
+PDF_CACHE_DIR = os.getenv("PDF_CACHE_DIR", os.path.join(os.path.dirname(os.path.abspath(__file__)), "pdf_cache"))
+PDF_CACHE_MEMORY_BYTES = int(os.getenv("PDF_CACHE_MEMORY_BYTES", str(32 * 1024 * 1024)))
+PDF_CACHE_DISK_BYTES = int(os.getenv("PDF_CACHE_DISK_BYTES", str(256 * 1024 * 1024)))
+# Largest PDF that downloads copy into the memory tier instead of streaming from disk
+PDF_CACHE_MEMORY_ITEM_BYTES = int(os.getenv("PDF_CACHE_MEMORY_ITEM_BYTES", str(512 * 1024)))
+# Renders kept in memory before spilling to a temporary file when the disk cache is off
+PDF_SPOOL_MAX_BYTES = int(os.getenv("PDF_SPOOL_MAX_BYTES", str(1024 * 1024)))
+# Documents rendered at the same time; bounds peak memory under concurrent downloads
+PDF_MAX_CONCURRENT_RENDERS = int(os.getenv("PDF_MAX_CONCURRENT_RENDERS", str(os.cpu_count() or 2)))
+
+_render_slots = threading.BoundedSemaphore(PDF_MAX_CONCURRENT_RENDERS)
+
+def pdf_cache_key(template: str, text: str, applicant_name: str = "", contact_info: str = "",
+                  profile: str = "") -> str:
+    """Hash of the inputs that determine a rendered PDF, including the output profile"""
+    payload = json.dumps([PDF_RENDER_VERSION, template, text, applicant_name or "", contact_info or "", profile or ""])
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+class RenderedPDFCache:
+    """Two-level (memory + disk) cache of rendered PDF bytes"""
+
+    def __init__(self, cache_dir: str = PDF_CACHE_DIR, memory_bytes: int = PDF_CACHE_MEMORY_BYTES,
+                 disk_bytes: int = PDF_CACHE_DISK_BYTES):
+        self.cache_dir = cache_dir
+        self.memory_bytes = memory_bytes
+        self.disk_bytes = disk_bytes
+        self._memory = OrderedDict()
+        self._memory_size = 0
+        self._lock = threading.Lock()
+        self._key_locks = {}
+        self.hits = 0
+        self.misses = 0
+        # Running size of the disk cache, so writes don't rescan the directory;
+        # it is recomputed whenever an eviction scan runs
+        self._disk_size = 0
+        if self.disk_bytes > 0:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            self._disk_size = sum(size for _, size, _ in self._scan_disk())
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, f"{key}.pdf")
+
+    def _remember(self, key: str, data: bytes):
+        """Add to the memory LRU, evicting the least recently used entries over budget"""
+        if len(data) > self.memory_bytes:
+            return
+        with self._lock:
+            if key in self._memory:
+                self._memory.move_to_end(key)
+                return
+            self._memory[key] = data
+            self._memory_size += len(data)
+            while self._memory_size > self.memory_bytes:
+                _, evicted = self._memory.popitem(last=False)
+                self._memory_size -= len(evicted)
+
+    def get(self, key: str) -> Optional[bytes]:
+        """Cached PDF bytes for a key, or None"""
+        with self._lock:
+            data = self._memory.get(key)
+            if data is not None:
+                self._memory.move_to_end(key)
+                self.hits += 1
+                return data
+
+        if self.disk_bytes > 0:
+            try:
+                with open(self._path(key), 'rb') as f:
+                    data = f.read()
+                os.utime(self._path(key))  # Mark as recently used for disk eviction
+            except OSError:
+                data = None
+            if data is not None:
+                self._remember(key, data)
+                with self._lock:
+                    self.hits += 1
+                return data
+
+        with self._lock:
+            self.misses += 1
+        return None
+
+    def set(self, key: str, data: bytes):
+        """Store PDF bytes in memory and on disk"""
+        self._remember(key, data)
+        if self.disk_bytes <= 0 or len(data) > self.disk_bytes:
+            return
+        try:
+            # Write to a temporary file first so readers never see a partial PDF
+            fd, temp_path = tempfile.mkstemp(dir=self.cache_dir, suffix='.tmp')
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+            if self._store_file(key, temp_path, len(data)):
+                self._trim_disk()
+        except OSError as e:
+            print(f"Could not write PDF cache entry: {e}")
+
+    def _scan_disk(self):
+        """(mtime, size, path) of every cached file"""
+        entries = []
+        for entry in os.scandir(self.cache_dir):
+            if entry.name.endswith('.pdf'):
+                try:
+                    stat = entry.stat()
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+        return entries
+
+    def _store_file(self, key: str, temp_path: str, size: int) -> bool:
+        """Move a fully written temporary file into place; True if the disk cache is now over budget"""
+        path = self._path(key)
+        try:
+            replaced = os.path.getsize(path)
+        except OSError:
+            replaced = 0
+        os.replace(temp_path, path)
+        with self._lock:
+            self._disk_size += size - replaced
+            return self._disk_size > self.disk_bytes
+
+    def _trim_disk(self):
+        """Delete the least recently used files until the directory is back within budget"""
+        # Other processes may share the directory, so the scan is the source of truth
+        entries = self._scan_disk()
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.disk_bytes:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            total -= size
+        with self._lock:
+            self._disk_size = total
+
+    @contextmanager
+    def _key_lock(self, key: str):
+        """Hold the lock that makes concurrent misses for one key render only once
+
+        Locks are reference counted and dropped only when no request holds or
+        waits for them, so a later request can't get a fresh lock and render
+        the same key again.
+        """
+        with self._lock:
+            entry = self._key_locks.setdefault(key, [threading.Lock(), 0])
+            entry[1] += 1
+        try:
+            with entry[0]:
+                yield
+        finally:
+            with self._lock:
+                entry[1] -= 1
+                if entry[1] == 0:
+                    del self._key_locks[key]
+
+    def _open_cached(self, key: str) -> Optional[BinaryIO]:
+        """Readable stream over a cached PDF without copying it, or None"""
+        with self._lock:
+            data = self._memory.get(key)
+            if data is not None:
+                self._memory.move_to_end(key)
+                self.hits += 1
+                return BytesIO(data)
+        if self.disk_bytes > 0:
+            try:
+                stream = open(self._path(key), 'rb')
+                os.utime(self._path(key))
+            except OSError:
+                return None
+            with self._lock:
+                self.hits += 1
+            return self._remember_small(key, stream)
+        return None
+
+    def _remember_small(self, key: str, stream: BinaryIO) -> BinaryIO:
+        """Copy a small PDF into the memory LRU; larger ones keep streaming from the file"""
+        size = stream.seek(0, os.SEEK_END)
+        stream.seek(0)
+        if size > PDF_CACHE_MEMORY_ITEM_BYTES:
+            return stream
+        with stream:
+            data = stream.read()
+        self._remember(key, data)
+        return BytesIO(data)
+
+    def open_or_render(self, key: str, write: Callable[[BinaryIO], None]) -> BinaryIO:
+        """Readable stream of the PDF for a key, rendering it with write(stream) on a miss
+
+        On a miss the generator writes straight into the cache file (or into a
+        spooled temporary file when the disk cache is off), so responses can
+        stream the PDF instead of holding the whole document in memory. The
+        caller closes the returned stream.
+        """
+        stream = self._open_cached(key)
+        if stream is not None:
+            return stream
+
+        with self._key_lock(key):
+            stream = self._open_cached(key)
+            if stream is None:
+                with self._lock:
+                    self.misses += 1
+                with _render_slots:
+                    stream = self._render_to_stream(key, write)
+        return stream
+
+    def _render_to_stream(self, key: str, write: Callable[[BinaryIO], None]) -> BinaryIO:
+        if self.disk_bytes > 0:
+            fd, temp_path = tempfile.mkstemp(dir=self.cache_dir, suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'wb') as f:
+                    write(f)
+                    size = f.tell()
+                over_budget = self._store_file(key, temp_path, size)
+            except BaseException:
+                if os.path.exists(temp_path):
+                    os.remove(temp_path)
+                raise
+            # Open before trimming so eviction can't remove the file out from under us
+            stream = open(self._path(key), 'rb')
+            if over_budget:
+                self._trim_disk()
+            return self._remember_small(key, stream)
+
+        spool = tempfile.SpooledTemporaryFile(max_size=PDF_SPOOL_MAX_BYTES)
+        write(spool)
+        return self._remember_small(key, spool)
+
+    def clear(self):
+        """Drop all cached PDFs"""
+        with self._lock:
+            self._memory.clear()
+            self._memory_size = 0
+            self._disk_size = 0
+        if self.disk_bytes > 0:
+            for entry in os.scandir(self.cache_dir):
+                if entry.name.endswith('.pdf'):
+                    try:
+                        os.remove(entry.path)
+                    except OSError:
+                        pass
+
+    def stats(self):
+        with self._lock:
+            return {
+                'memory_entries': len(self._memory),
+                'memory_bytes': self._memory_size,
+                'hits': self.hits,
+                'misses': self.misses
+            }
+
+_cache = None
+_cache_lock = threading.Lock()
+
+def get_pdf_cache() -> RenderedPDFCache:
+    """Get the shared rendered-PDF cache"""
+    global _cache
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = RenderedPDFCache()
+    return _cache
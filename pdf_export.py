@@ -0,0 +1,271 @@
+"""
+Bulk PDF export
+Resumes and cover letters are rendered in a pool of worker processes, so a
+batch export uses every core instead of running ReportLab layout one document
+at a time on the request thread. The PDFs are streamed back as a ZIP archive
+while later documents are still rendering.
+"""
+
+import os
+import json
+import atexit
+import zipfile
+import threading
+from collections import deque
+from concurrent.futures import CancelledError, ProcessPoolExecutor, TimeoutError
+from concurrent.futures.process import BrokenProcessPool
+from typing import Dict, Iterator, List
+
+from werkzeug.utils import secure_filename
+
+from pdf_generator import generate_resume_pdf, generate_cover_letter_pdf, get_output_profile
+from pdf_cache import get_pdf_cache, pdf_cache_key
+
+PDF_EXPORT_WORKERS = int(os.getenv("PDF_EXPORT_WORKERS", str(os.cpu_count() or 2)))
+PDF_EXPORT_TIMEOUT_SECONDS = float(os.getenv("PDF_EXPORT_TIMEOUT_SECONDS", "30"))
+PDF_EXPORT_MAX_DOCUMENTS = int(os.getenv("PDF_EXPORT_MAX_DOCUMENTS", "200"))
+# Rendered PDFs held in memory across all running exports at once
+PDF_EXPORT_MAX_IN_FLIGHT = int(os.getenv("PDF_EXPORT_MAX_IN_FLIGHT", str(PDF_EXPORT_WORKERS * 4)))
+
+_in_flight_slots = threading.BoundedSemaphore(PDF_EXPORT_MAX_IN_FLIGHT)
+
+DOCUMENT_TYPES = ('resume', 'cover_letter')
+
+def render_document(document: Dict) -> bytes:
+    """Render one export document to PDF bytes (runs in a worker process)"""
+    if document['type'] == 'resume':
+        return generate_resume_pdf(document['text'], profile=document['profile'])
+    return generate_cover_letter_pdf(document['text'], document['applicant_name'], document['contact_info'],
+                                     profile=document['profile'])
+
+def document_cache_key(document: Dict) -> str:
+    """Rendered-PDF cache key shared with the single-document download endpoints"""
+    return pdf_cache_key(document['type'], document['text'], document['applicant_name'], document['contact_info'],
+                         document['profile'])
+
+def validate_export_documents(documents) -> List[Dict]:
+    """Normalize export requests, giving each document a unique safe filename
+
+    Each document needs a type ('resume' or 'cover_letter') and its text (as
+    'text', or 'resume_text'/'cover_letter_text' like the download endpoints)
+    and may name an output profile. Raises ValueError for invalid input.
+    """
+    if not isinstance(documents, list) or not documents:
+        raise ValueError("documents must be a non-empty list")
+    if len(documents) > PDF_EXPORT_MAX_DOCUMENTS:
+        raise ValueError(f"At most {PDF_EXPORT_MAX_DOCUMENTS} documents can be exported at once")
+
+    normalized = []
+    used_names = set()
+    for index, document in enumerate(documents, 1):
+        if not isinstance(document, dict):
+            raise ValueError(f"Document {index} must be an object")
+        doc_type = document.get('type', 'resume')
+        if doc_type not in DOCUMENT_TYPES:
+            raise ValueError(f"Document {index} has unknown type '{doc_type}'")
+        text = document.get('text') or document.get(f'{doc_type}_text', '')
+        if not text or not text.strip():
+            raise ValueError(f"Document {index} has no text")
+        try:
+            profile = get_output_profile(document.get('profile'))
+        except ValueError as e:
+            raise ValueError(f"Document {index}: {e}")
+
+        base_name = secure_filename(os.path.splitext(document.get('filename') or '')[0]) or f"{doc_type}_{index}"
+        filename = f"{base_name}.pdf"
+        suffix = 2
+        while filename in used_names:
+            filename = f"{base_name}_{suffix}.pdf"
+            suffix += 1
+        used_names.add(filename)
+
+        is_cover_letter = doc_type == 'cover_letter'
+        normalized.append({
+            'type': doc_type,
+            'text': text,
+            # Only cover letters render the applicant details
+            'applicant_name': document.get('applicant_name', '') if is_cover_letter else '',
+            'contact_info': document.get('contact_info', '') if is_cover_letter else '',
+            'profile': profile,
+            'filename': filename
+        })
+    return normalized
+
+_pool = None
+_pool_lock = threading.Lock()
+
+def get_render_pool() -> ProcessPoolExecutor:
+    """Get the shared pool of PDF rendering processes"""
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = ProcessPoolExecutor(max_workers=PDF_EXPORT_WORKERS)
+                atexit.register(_pool.shutdown, wait=False, cancel_futures=True)
+    return _pool
+
+def _discard_pool(pool: ProcessPoolExecutor):
+    """Drop a broken pool so the next export starts fresh workers"""
+    global _pool
+    with _pool_lock:
+        if _pool is pool:
+            _pool = None
+    pool.shutdown(wait=False, cancel_futures=True)
+
+def _terminate_pool(pool: ProcessPoolExecutor):
+    """Drop a pool and kill its workers, stopping renders that overran their time limit
+
+    Renders of other documents on the pool fail with BrokenProcessPool and are
+    resubmitted to a fresh pool by their exports.
+    """
+    processes = list((getattr(pool, '_processes', None) or {}).values())
+    _discard_pool(pool)
+    for process in processes:
+        process.terminate()
+
+def _release_slot_when_done(future):
+    """Give back a future's in-flight slot once its worker is free again
+
+    A future that is already running can't be cancelled; its worker keeps
+    rendering, so the slot stays taken until it finishes.
+    """
+    if future.cancel():
+        _in_flight_slots.release()
+    else:
+        future.add_done_callback(lambda _: _in_flight_slots.release())
+
+def _submit(document: Dict):
+    """Submit a render to the shared pool, replacing the pool once if it turns out to be broken"""
+    pool = get_render_pool()
+    try:
+        return pool, pool.submit(render_document, document)
+    except BrokenProcessPool:
+        _discard_pool(pool)
+    pool = get_render_pool()
+    return pool, pool.submit(render_document, document)
+
+class ZipStream:
+    """Write-only stream that collects ZIP output until it is drained"""
+
+    def __init__(self):
+        self._chunks = []
+
+    def write(self, data) -> int:
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def flush(self):
+        pass
+
+    def drain(self) -> bytes:
+        data = b''.join(self._chunks)
+        self._chunks = []
+        return data
+
+def iter_export_zip(documents: List[Dict], timeout: float = PDF_EXPORT_TIMEOUT_SECONDS) -> Iterator[bytes]:
+    """Render validated documents in the process pool and yield a ZIP archive in chunks
+
+    At most two documents per worker are in flight for one export, and at most
+    PDF_EXPORT_MAX_IN_FLIGHT across all exports, so peak memory stays bounded
+    however many exports run concurrently. Each document gets up to `timeout`
+    seconds once it is next in line; documents that time out or fail are left
+    out of the archive and listed in errors.json. A render that times out is
+    stopped by terminating its pool, and renders of other documents that were
+    on that pool are resubmitted once. If no slot frees up within `timeout`,
+    the rest of the export is reported as failed instead of waiting forever.
+    """
+    cache = get_pdf_cache()
+    max_in_flight = PDF_EXPORT_WORKERS * 2
+    remaining = iter(documents)
+    pending = deque()
+    failures = []
+
+    def fill():
+        while len(pending) < max_in_flight:
+            # Slots are shared by all exports; only wait for one when this export holds none
+            if pending:
+                if not _in_flight_slots.acquire(blocking=False):
+                    return
+            elif not _in_flight_slots.acquire(timeout=timeout):
+                for document in remaining:
+                    failures.append({'filename': document['filename'],
+                                     'error': f"No renderer available after {timeout:g} seconds"})
+                return
+            document = next(remaining, None)
+            if document is None:
+                _in_flight_slots.release()
+                return
+            key = document_cache_key(document)
+            result = cache.get(key)
+            pool = None
+            if result is None:
+                try:
+                    pool, result = _submit(document)
+                except (RuntimeError, BrokenProcessPool) as e:
+                    result = e
+            pending.append((document, key, result, pool, False))
+
+    stream = ZipStream()
+    archive = zipfile.ZipFile(stream, 'w', compression=zipfile.ZIP_DEFLATED)
+
+    try:
+        fill()
+        while pending:
+            document, key, result, pool, resubmitted = pending.popleft()
+            release_slot = True
+            chunk = None
+            try:
+                pdf_data = None
+                if isinstance(result, bytes):
+                    pdf_data = result
+                elif isinstance(result, Exception):
+                    failures.append({'filename': document['filename'], 'error': f"Could not start renderer: {result}"})
+                else:
+                    try:
+                        pdf_data = result.result(timeout=timeout)
+                        cache.set(key, pdf_data)
+                    except TimeoutError:
+                        # The worker is killed, so its slot can be reused right away
+                        _terminate_pool(pool)
+                        failures.append({'filename': document['filename'], 'error': f"Timed out after {timeout:g} seconds"})
+                    except (BrokenProcessPool, CancelledError) as e:
+                        # Queued renders are cancelled when their pool is discarded
+                        _discard_pool(pool)
+                        if resubmitted:
+                            failures.append({'filename': document['filename'], 'error': f"Renderer crashed: {e}"})
+                        else:
+                            # The pool may have been broken by another document; retry on a fresh one
+                            try:
+                                pool, result = _submit(document)
+                                pending.appendleft((document, key, result, pool, True))
+                                release_slot = False
+                            except (RuntimeError, BrokenProcessPool) as e:
+                                failures.append({'filename': document['filename'], 'error': f"Could not start renderer: {e}"})
+                    except Exception as e:
+                        failures.append({'filename': document['filename'], 'error': str(e)})
+
+                if pdf_data is not None:
+                    archive.writestr(document['filename'], pdf_data)
+                chunk = stream.drain()
+            finally:
+                pdf_data = None
+                if release_slot:
+                    _in_flight_slots.release()
+            fill()
+
+            if chunk:
+                yield chunk
+    finally:
+        # Client went away or rendering failed: give back the slots of unfinished documents
+        for _, _, result, _, _ in pending:
+            if hasattr(result, 'cancel'):
+                _release_slot_when_done(result)
+            else:
+                _in_flight_slots.release()
+        pending.clear()
+
+    if failures:
+        print(f"Bulk PDF export: {len(failures)} of {len(documents)} documents failed")
+        archive.writestr('errors.json', json.dumps(failures, indent=2))
+    archive.close()
+    yield stream.drain()
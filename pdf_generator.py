@@ -1,12 +1,162 @@
+import os
 import re
+import threading
 from io import BytesIO
+from math import gcd
 from reportlab.lib.pagesizes import letter
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle, StyleSheet1
 from reportlab.lib.units import inch
 from reportlab.lib.colors import HexColor, black, white
-# from reportlab.lib import colors  # Not needed, using specific color imports
+from reportlab.lib import colors
 from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle
 from reportlab.lib.enums import TA_LEFT, TA_CENTER, TA_RIGHT, TA_JUSTIFY
+from text_normalization import (
+    keyword_pattern, strip_markdown, is_date_line, ADDRESS_PATTERN,
+    SALUTATION_PREFIXES, CLOSING_PREFIXES, RECIPIENT_PATTERN
+)
+
+# Resume section headers, checked in order against the lowercased line
+SECTION_HEADER_PATTERNS = [
+    ('profile', keyword_pattern('professional summary', 'summary', 'profile', 'objective')),
+    ('skills', keyword_pattern('technical skills', 'skills')),
+    ('experience', keyword_pattern('professional experience', 'work experience', 'experience')),
+    ('education', keyword_pattern('education')),
+    ('certifications', keyword_pattern('certifications', 'training')),
+    ('additional_skills', keyword_pattern('additional skills', 'attributes')),
+]
+
+# Lines that end each resume section
+SECTION_END_PATTERNS = {
+    'profile': keyword_pattern('technical skills', 'professional experience', 'experience', 'education', 'certifications'),
+    'skills': keyword_pattern('professional experience', 'experience', 'education', 'certifications'),
+    'experience': keyword_pattern('education', 'certifications', 'additional skills'),
+    'education': keyword_pattern('certifications', 'additional skills', 'notes'),
+    'certifications': keyword_pattern('additional skills', 'notes'),
+    'additional_skills': keyword_pattern('notes'),
+}
+
+NAME_EXCLUDE_PATTERN = keyword_pattern('mobile:', 'email:', '@', 'phone:', 'summary', 'professional')
+COMPANY_PATTERN = keyword_pattern('inc', 'corp', 'llc', 'ltd', 'company')
+JOB_TITLE_PATTERN = keyword_pattern('developer', 'engineer')
+PHONE_PATTERN = re.compile(r'(\d{3}[-.\s]?\d{3}[-.\s]?\d{4})')
+EMAIL_PATTERN = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b')
+YEAR_PATTERN = re.compile(r'\d{4}')
+SKILL_CATEGORY_PATTERN = re.compile(r'-\s*\*?\*?([^:*]+)\*?\*?:\s*(.+)')
+
+# Skill tag layout
+MAX_SKILLS_PER_CATEGORY = 12
+SKILLS_PER_ROW = 3
+SKILL_COLUMN_WIDTH = 2.2 * inch
+SKILL_ROW_HEIGHT = 24
+SKILL_PARAGRAPH_CACHE_SIZE = 512
+
+# Skill tag colors, assigned to tags in reading order
+SKILL_TAG_COLORS = [
+    colors.Color(0.2, 0.5, 0.8),    # Professional blue
+    colors.Color(0.15, 0.4, 0.65),  # Darker blue
+    colors.Color(0.25, 0.55, 0.75), # Medium blue
+    colors.Color(0.1, 0.35, 0.6),   # Deep blue
+    colors.Color(0.3, 0.6, 0.8),    # Light blue
+    colors.Color(0.18, 0.45, 0.7),  # Balanced blue
+]
+
+# Reading-order colors seen down each column, as a ROWBACKGROUNDS cycle
+SKILL_COLUMN_COLORS = [
+    [SKILL_TAG_COLORS[(row * SKILLS_PER_ROW + col) % len(SKILL_TAG_COLORS)]
+     for row in range(len(SKILL_TAG_COLORS) // gcd(SKILLS_PER_ROW, len(SKILL_TAG_COLORS)))]
+    for col in range(SKILLS_PER_ROW)
+]
+
+SKILL_TABLE_BASE_STYLE = [
+    # Default background for all cells
+    ('BACKGROUND', (0, 0), (-1, -1), white),
+    ('TEXTCOLOR', (0, 0), (-1, -1), white),
+    
+    # Padding and alignment
+    ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+    ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+    ('LEFTPADDING', (0, 0), (-1, -1), 12),
+    ('RIGHTPADDING', (0, 0), (-1, -1), 12),
+    ('TOPPADDING', (0, 0), (-1, -1), 6),
+    ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
+    
+    # Subtle borders for definition
+    ('LINEBELOW', (0, 0), (-1, -1), 0.5, colors.lightgrey),
+    ('LINEAFTER', (0, 0), (-1, -1), 0.5, colors.lightgrey),
+]
+
+SKILL_CATEGORY_UNDERLINE_STYLE = TableStyle([
+    ('LINEBELOW', (0, 0), (-1, -1), 1, colors.lightgrey),
+    ('TOPPADDING', (0, 0), (-1, -1), 0),
+    ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
+])
+
+# Output profiles trade file size against render time and inspectability.
+# Font subsetting needs no setting here: the templates only use the standard
+# PDF fonts, which are referenced by name rather than embedded, and ReportLab
+# already subsets any TrueType font it embeds.
+PDF_OUTPUT_PROFILES = {
+    # Plain-text content streams; largest files, useful when debugging layout
+    'uncompressed': {'page_compression': False, 'strip_metadata': False},
+    # Deflate-compressed content streams
+    'compressed': {'page_compression': True, 'strip_metadata': False},
+    # Compressed, with empty document info and fixed timestamps/IDs so the same
+    # input always renders to the same bytes
+    'minimal': {'page_compression': True, 'strip_metadata': True},
+}
+DEFAULT_PDF_PROFILE = os.getenv("PDF_OUTPUT_PROFILE", "compressed")
+
+STRIPPED_METADATA = {
+    'title': '', 'author': '', 'subject': '', 'creator': '', 'producer': '', 'keywords': '',
+    'invariant': 1,
+}
+
+def get_output_profile(profile=None):
+    """Validated profile name, falling back to PDF_OUTPUT_PROFILE"""
+    profile = profile or DEFAULT_PDF_PROFILE
+    if profile not in PDF_OUTPUT_PROFILES:
+        raise ValueError(f"Unknown PDF output profile '{profile}' (expected one of: {', '.join(PDF_OUTPUT_PROFILES)})")
+    return profile
+
+def document_options(profile=None):
+    """SimpleDocTemplate keyword arguments for an output profile"""
+    settings = PDF_OUTPUT_PROFILES[get_output_profile(profile)]
+    options = {'pageCompression': 1 if settings['page_compression'] else 0}
+    if settings['strip_metadata']:
+        options.update(STRIPPED_METADATA)
+    return options
+
+class SharedStyleSheet(StyleSheet1):
+    """Style sheet that becomes read-only once built, so one instance can be shared across requests"""
+    
+    def __init__(self):
+        super().__init__()
+        self._frozen = False
+        # Start from a copy of ReportLab's sample styles
+        sample = getSampleStyleSheet()
+        self.byName.update(sample.byName)
+        self.byAlias.update(sample.byAlias)
+    
+    def add(self, style, alias=None):
+        if self._frozen:
+            raise TypeError("Shared style sheets are read-only; create a separate ParagraphStyle instead")
+        super().add(style, alias)
+    
+    def freeze(self):
+        self._frozen = True
+        return self
+
+class SkillTagParagraph(Paragraph):
+    """Skill tag paragraph that keeps its line layout for repeated wraps at the same width"""
+    
+    _wrapped_width = None
+    _wrapped_size = None
+    
+    def wrap(self, availWidth, availHeight):
+        if availWidth != self._wrapped_width:
+            self._wrapped_size = super().wrap(availWidth, availHeight)
+            self._wrapped_width = availWidth
+        return self._wrapped_size
 
 class ProfessionalResumeTemplate:
     def __init__(self):
@@ -28,7 +178,7 @@ class ProfessionalResumeTemplate:
     
     def _create_professional_styles(self):
         """Create professional paragraph styles"""
-        styles = getSampleStyleSheet()
+        styles = SharedStyleSheet()
         
         # Header name style - large and prominent
         styles.add(ParagraphStyle(
@@ -159,30 +309,26 @@ class ProfessionalResumeTemplate:
             leading=11
         ))
         
-        return styles
+        return styles.freeze()
 
 class ProfessionalResumePDFGenerator:
-    def __init__(self):
-        self.template = ProfessionalResumeTemplate()
+    def __init__(self, template=None):
+        # Templates are read-only, so the prebuilt module-level one is shared by default
+        self.template = template or RESUME_TEMPLATE
+        # Flowables hold layout state while drawn, so cached ones are never shared across threads
+        self._local = threading.local()
     
     def clean_text(self, text):
         """Clean text by removing markdown formatting and extra characters"""
-        if not text:
-            return ""
-        
-        # Remove markdown formatting
-        text = re.sub(r'\*\*([^*]+)\*\*', r'\1', text)  # Remove **bold**
-        text = re.sub(r'\*([^*]+)\*', r'\1', text)      # Remove *italic*
-        text = re.sub(r'^\*+\s*', '', text)             # Remove leading asterisks
-        text = re.sub(r'\s*\*+$', '', text)             # Remove trailing asterisks
-        
-        # Clean up extra whitespace
-        text = re.sub(r'\s+', ' ', text).strip()
-        
-        return text
+        return strip_markdown(text)
     
     def parse_resume_content(self, resume_text):
-        """Parse comprehensive resume content into structured sections"""
+        """Parse comprehensive resume content into structured sections
+        
+        Single pass over the lines: each line is cleaned and lowercased once, and
+        a section ends when a line matches that section's end pattern, after which
+        the same line is handled as a top-level line (usually the next header).
+        """
         sections = {
             'name': '',
             'contact': {
@@ -199,205 +345,131 @@ class ProfessionalResumePDFGenerator:
         }
         
         lines = [line.strip() for line in resume_text.strip().split('\n') if line.strip()]
-        current_section = None
-        current_experience = {}
+        cleaned = [self.clean_text(line) for line in lines]
+        lowered = [clean_line.lower() for clean_line in cleaned]
         
         # Extract name - look for the first bold line or standalone name
-        for i, line in enumerate(lines[:10]):
-            clean_line = self.clean_text(line)
+        for clean_line, line_lower in zip(cleaned[:10], lowered[:10]):
             if (clean_line and 
-                not clean_line.lower().startswith('here is') and
-                not any(keyword in clean_line.lower() for keyword in ['mobile:', 'email:', '@', 'phone:', 'summary', 'professional']) and
+                not line_lower.startswith('here is') and
+                not NAME_EXCLUDE_PATTERN.search(line_lower) and
                 len(clean_line.split()) >= 2 and
                 not clean_line.startswith('-') and
                 not clean_line.startswith('*')):
                 sections['name'] = clean_line.upper()
                 break
         
-        # Parse content line by line
-        i = 0
-        while i < len(lines):
-            line = lines[i]
-            clean_line = self.clean_text(line)
-            if not clean_line:
-                i += 1
-                continue
-            
-            line_lower = clean_line.lower()
-            
-            # Skip separator lines
-            if clean_line.startswith('---') or clean_line.startswith('==='):
-                i += 1
-                continue
-            
-            # Extract contact information
-            if 'mobile:' in line_lower or 'phone:' in line_lower:
-                phone_match = re.search(r'(\d{3}[-.\s]?\d{3}[-.\s]?\d{4})', clean_line)
-                if phone_match:
-                    sections['contact']['phone'] = phone_match.group(1)
-                i += 1
-                continue
-            
-            if 'email:' in line_lower or '@' in clean_line:
-                email_match = re.search(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b', clean_line)
-                if email_match:
-                    sections['contact']['email'] = email_match.group()
-                i += 1
-                continue
-            
-            # Detect major sections
-            if any(keyword in line_lower for keyword in ['professional summary', 'summary', 'profile', 'objective']):
-                current_section = 'profile'
-                # Collect profile content until next section
-                i += 1
-                profile_lines = []
-                while i < len(lines):
-                    next_line = self.clean_text(lines[i])
-                    if not next_line:
-                        i += 1
-                        continue
-                    if next_line.startswith('---'):
-                        i += 1
-                        break
-                    if any(section_keyword in next_line.lower() for section_keyword in 
-                           ['technical skills', 'professional experience', 'experience', 'education', 'certifications']):
-                        break
-                    profile_lines.append(next_line)
-                    i += 1
+        current_section = None
+        profile_lines = []
+        current_experience = {}
+        # Lines directly after a company line may hold the job title and then the dates
+        expecting = None
+        
+        def close_section():
+            if current_section == 'profile':
                 sections['profile'] = ' '.join(profile_lines)
+            elif current_section == 'experience' and current_experience:
+                sections['experience'].append(current_experience)
+        
+        for clean_line, line_lower in zip(cleaned, lowered):
+            # Job title/date lookahead takes precedence over every other rule
+            if expecting == 'title':
+                expecting = None
+                if clean_line.startswith('*') or JOB_TITLE_PATTERN.search(line_lower):
+                    current_experience['title'] = clean_line.strip('*').strip()
+                    expecting = 'dates'
+                    continue
+            elif expecting == 'dates':
+                expecting = None
+                if YEAR_PATTERN.search(clean_line):
+                    current_experience['dates'] = clean_line.strip('*').strip()
+                    continue
+            
+            if not clean_line:
                 continue
             
-            elif any(keyword in line_lower for keyword in ['technical skills', 'skills']):
-                current_section = 'skills'
-                i += 1
-                # Parse skills section
-                while i < len(lines):
-                    skill_line = self.clean_text(lines[i])
-                    if not skill_line or skill_line.startswith('---'):
-                        i += 1
-                        continue
-                    if any(section_keyword in skill_line.lower() for section_keyword in 
-                           ['professional experience', 'experience', 'education', 'certifications']):
-                        break
-                    
-                    # Parse skill categories
-                    if skill_line.startswith('-') and ':' in skill_line:
-                        # Format: - **Category:** skill1, skill2, skill3
-                        category_match = re.search(r'-\s*\*?\*?([^:*]+)\*?\*?:\s*(.+)', skill_line)
+            if current_section is not None:
+                if clean_line.startswith('---'):
+                    # A separator ends the profile; other sections skip it
+                    if current_section == 'profile':
+                        close_section()
+                        current_section = None
+                    continue
+                
+                if SECTION_END_PATTERNS[current_section].search(line_lower):
+                    close_section()
+                    current_section = None
+                    current_experience = {}
+                    # Fall through so the line is handled as a top-level line
+                
+                elif current_section == 'profile':
+                    profile_lines.append(clean_line)
+                    continue
+                
+                elif current_section == 'skills':
+                    # Format: - **Category:** skill1, skill2, skill3
+                    if clean_line.startswith('-') and ':' in clean_line:
+                        category_match = SKILL_CATEGORY_PATTERN.search(clean_line)
                         if category_match:
                             category = category_match.group(1).strip()
                             skills_text = category_match.group(2).strip()
                             skills_list = [skill.strip() for skill in skills_text.split(',') if skill.strip()]
                             sections['skills'][category] = skills_list
-                    i += 1
-                continue
-            
-            elif any(keyword in line_lower for keyword in ['professional experience', 'work experience', 'experience']):
-                current_section = 'experience'
-                i += 1
-                # Parse experience section
-                while i < len(lines):
-                    exp_line = self.clean_text(lines[i])
-                    if not exp_line or exp_line.startswith('---'):
-                        i += 1
-                        continue
-                    if any(section_keyword in exp_line.lower() for section_keyword in 
-                           ['education', 'certifications', 'additional skills']):
-                        break
-                    
-                    # Check if this is a company/location line
-                    if (not exp_line.startswith('-') and not exp_line.startswith('•') and 
-                        (',' in exp_line or any(keyword in exp_line.lower() for keyword in ['inc', 'corp', 'llc', 'ltd', 'company']))):
-                        
-                        # Save previous experience if exists
+                    continue
+                
+                elif current_section == 'experience':
+                    is_bullet = clean_line.startswith('-') or clean_line.startswith('•')
+                    # Company/location line starts a new experience entry
+                    if not is_bullet and (',' in clean_line or COMPANY_PATTERN.search(line_lower)):
                         if current_experience:
                             sections['experience'].append(current_experience)
-                        
-                        # Start new experience entry
                         current_experience = {
-                            'company': exp_line,
+                            'company': clean_line,
                             'title': '',
                             'dates': '',
                             'responsibilities': []
                         }
-                        
-                        # Look for job title and dates in next lines
-                        i += 1
-                        if i < len(lines):
-                            title_line = self.clean_text(lines[i])
-                            if title_line.startswith('*') or 'developer' in title_line.lower() or 'engineer' in title_line.lower():
-                                current_experience['title'] = title_line.strip('*').strip()
-                                i += 1
-                                if i < len(lines):
-                                    date_line = self.clean_text(lines[i])
-                                    if re.search(r'\d{4}', date_line):
-                                        current_experience['dates'] = date_line.strip('*').strip()
-                                        i += 1
-                        continue
-                    
-                    # Check for responsibilities
-                    elif exp_line.startswith('-') or exp_line.startswith('•'):
-                        if current_experience:
-                            responsibility = exp_line.lstrip('-• ').strip()
-                            current_experience['responsibilities'].append(responsibility)
-                    
-                    i += 1
+                        expecting = 'title'
+                    elif is_bullet and current_experience:
+                        current_experience['responsibilities'].append(clean_line.lstrip('-• ').strip())
+                    continue
                 
-                # Add last experience
-                if current_experience:
-                    sections['experience'].append(current_experience)
-                    current_experience = {}
-                continue
+                elif current_section == 'education':
+                    sections['education'].append(clean_line)
+                    continue
+                
+                else:
+                    # Certifications and additional skills are lists with optional bullets
+                    if clean_line.startswith('-') or clean_line.startswith('•'):
+                        clean_line = clean_line.lstrip('-• ').strip()
+                    sections[current_section].append(clean_line)
+                    continue
             
-            elif any(keyword in line_lower for keyword in ['education']):
-                current_section = 'education'
-                i += 1
-                while i < len(lines):
-                    edu_line = self.clean_text(lines[i])
-                    if not edu_line or edu_line.startswith('---'):
-                        i += 1
-                        continue
-                    if any(section_keyword in edu_line.lower() for section_keyword in 
-                           ['certifications', 'additional skills', 'notes']):
-                        break
-                    sections['education'].append(edu_line)
-                    i += 1
+            # Skip separator lines
+            if clean_line.startswith('---') or clean_line.startswith('==='):
                 continue
             
-            elif any(keyword in line_lower for keyword in ['certifications', 'training']):
-                current_section = 'certifications'
-                i += 1
-                while i < len(lines):
-                    cert_line = self.clean_text(lines[i])
-                    if not cert_line or cert_line.startswith('---'):
-                        i += 1
-                        continue
-                    if any(section_keyword in cert_line.lower() for section_keyword in 
-                           ['additional skills', 'notes']):
-                        break
-                    if cert_line.startswith('-') or cert_line.startswith('•'):
-                        cert_line = cert_line.lstrip('-• ').strip()
-                    sections['certifications'].append(cert_line)
-                    i += 1
+            # Extract contact information
+            if 'mobile:' in line_lower or 'phone:' in line_lower:
+                phone_match = PHONE_PATTERN.search(clean_line)
+                if phone_match:
+                    sections['contact']['phone'] = phone_match.group(1)
                 continue
             
-            elif any(keyword in line_lower for keyword in ['additional skills', 'attributes']):
-                current_section = 'additional_skills'
-                i += 1
-                while i < len(lines):
-                    skill_line = self.clean_text(lines[i])
-                    if not skill_line or skill_line.startswith('---'):
-                        i += 1
-                        continue
-                    if 'notes' in skill_line.lower():
-                        break
-                    if skill_line.startswith('-') or skill_line.startswith('•'):
-                        skill_line = skill_line.lstrip('-• ').strip()
-                    sections['additional_skills'].append(skill_line)
-                    i += 1
+            if 'email:' in line_lower or '@' in clean_line:
+                email_match = EMAIL_PATTERN.search(clean_line)
+                if email_match:
+                    sections['contact']['email'] = email_match.group()
                 continue
             
-            i += 1
+            # Detect major sections
+            for section_name, header_pattern in SECTION_HEADER_PATTERNS:
+                if header_pattern.search(line_lower):
+                    current_section = section_name
+                    profile_lines = []
+                    break
+        
+        close_section()
         
         return sections
     
@@ -478,6 +550,45 @@ class ProfessionalResumePDFGenerator:
             
             story.append(Spacer(1, 8))
     
+    def skill_paragraph(self, skill):
+        """Skill tag Paragraph, reused for repeated skills rendered on this thread"""
+        cache = getattr(self._local, 'skill_paragraphs', None)
+        if cache is None:
+            cache = self._local.skill_paragraphs = {}
+        paragraph = cache.get(skill)
+        if paragraph is None:
+            if len(cache) >= SKILL_PARAGRAPH_CACHE_SIZE:
+                cache.clear()
+            paragraph = cache[skill] = SkillTagParagraph(f"<b>{skill}</b>", self.template.styles['ProfSkillTag'])
+        return paragraph
+    
+    def clear_skill_paragraph_cache(self):
+        """Drop this thread's cached skill tags (benchmarks use it to measure cold renders)"""
+        self._local.skill_paragraphs = {}
+    
+    def build_skill_tag_table(self, skill_list):
+        """Skill tags laid out in rows, styled with one background command per column"""
+        skills_to_show = skill_list[:MAX_SKILLS_PER_CATEGORY]
+        row_count = -(-len(skills_to_show) // SKILLS_PER_ROW)
+        
+        # Fill remaining cells of the last row with blanks
+        cells = [self.skill_paragraph(skill) for skill in skills_to_show]
+        cells += [''] * (row_count * SKILLS_PER_ROW - len(cells))
+        rows = [cells[start:start + SKILLS_PER_ROW] for start in range(0, len(cells), SKILLS_PER_ROW)]
+        
+        table = Table(rows, colWidths=[SKILL_COLUMN_WIDTH] * SKILLS_PER_ROW, rowHeights=SKILL_ROW_HEIGHT)
+        
+        # Color only cells holding a skill; the last row may be partly blank
+        table_style = list(SKILL_TABLE_BASE_STYLE)
+        filled_in_last_row = len(skills_to_show) - (row_count - 1) * SKILLS_PER_ROW
+        for col in range(SKILLS_PER_ROW):
+            last_row = row_count - 1 if col < filled_in_last_row else row_count - 2
+            if last_row >= 0:
+                table_style.append(('ROWBACKGROUNDS', (col, 0), (col, last_row), SKILL_COLUMN_COLORS[col]))
+        
+        table.setStyle(TableStyle(table_style))
+        return table
+    
     def add_skills_content(self, story, skills):
         """Add skills content with modern horizontal tag layout"""
         for category, skill_list in skills.items():
@@ -488,80 +599,11 @@ class ProfessionalResumePDFGenerator:
                 
                 # Add subtle underline for category
                 underline_table = Table([['']], colWidths=[6.5*inch])
-                underline_table.setStyle(TableStyle([
-                    ('LINEBELOW', (0, 0), (-1, -1), 1, colors.lightgrey),
-                    ('TOPPADDING', (0, 0), (-1, -1), 0),
-                    ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
-                ]))
+                underline_table.setStyle(SKILL_CATEGORY_UNDERLINE_STYLE)
                 story.append(underline_table)
                 
                 # Create horizontal skill tags using table
-                skills_to_show = skill_list[:12]  # Limit to 12 skills per category
-                
-                # Create skill tags in rows of 3-4 skills each for better spacing
-                rows = []
-                current_row = []
-                skills_per_row = 3  # Reduced for better spacing
-                
-                for i, skill in enumerate(skills_to_show):
-                    # Create skill tag with enhanced styling
-                    skill_text = f"<b>{skill}</b>"
-                    skill_cell = Paragraph(skill_text, self.template.styles['ProfSkillTag'])
-                    current_row.append(skill_cell)
-                    
-                    # Start new row after specified number of skills or if it's the last skill
-                    if len(current_row) == skills_per_row or i == len(skills_to_show) - 1:
-                        # Fill remaining cells in row if needed
-                        while len(current_row) < skills_per_row:
-                            current_row.append('')
-                        rows.append(current_row)
-                        current_row = []
-                
-                if rows:
-                    # Calculate column widths for better distribution
-                    col_width = 2.2 * inch  # Wider columns for better readability
-                    table = Table(rows, colWidths=[col_width] * skills_per_row, rowHeights=24)
-                    
-                    # Enhanced styling with gradient-like effect
-                    table_style = [
-                        # Default background for all cells
-                                        ('BACKGROUND', (0, 0), (-1, -1), white),
-                ('TEXTCOLOR', (0, 0), (-1, -1), white),
-                        
-                        # Padding and alignment
-                        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-                        ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-                        ('LEFTPADDING', (0, 0), (-1, -1), 12),
-                        ('RIGHTPADDING', (0, 0), (-1, -1), 12),
-                        ('TOPPADDING', (0, 0), (-1, -1), 6),
-                        ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
-                        
-                        # Subtle borders for definition
-                        ('LINEBELOW', (0, 0), (-1, -1), 0.5, colors.lightgrey),
-                        ('LINEAFTER', (0, 0), (-1, -1), 0.5, colors.lightgrey),
-                    ]
-                    
-                    # Create attractive color scheme for skill tags
-                    skill_colors = [
-                        colors.Color(0.2, 0.5, 0.8),   # Professional blue
-                        colors.Color(0.15, 0.4, 0.65), # Darker blue
-                        colors.Color(0.25, 0.55, 0.75), # Medium blue
-                        colors.Color(0.1, 0.35, 0.6),  # Deep blue
-                        colors.Color(0.3, 0.6, 0.8),   # Light blue
-                        colors.Color(0.18, 0.45, 0.7), # Balanced blue
-                    ]
-                    
-                    # Apply colors to non-empty cells
-                    color_index = 0
-                    for row_idx in range(len(rows)):
-                        for col_idx in range(skills_per_row):
-                            if rows[row_idx][col_idx] != '':  # Only style non-empty cells
-                                bg_color = skill_colors[color_index % len(skill_colors)]
-                                table_style.append(('BACKGROUND', (col_idx, row_idx), (col_idx, row_idx), bg_color))
-                                color_index += 1
-                    
-                    table.setStyle(TableStyle(table_style))
-                    story.append(table)
+                story.append(self.build_skill_tag_table(skill_list))
                 
                 story.append(Spacer(1, 12))
     
@@ -583,22 +625,20 @@ class ProfessionalResumePDFGenerator:
             skill_para = Paragraph(f"• {skill}", self.template.styles['ProfBodyText'])
             story.append(skill_para)
     
-    def generate_pdf(self, resume_text, filename=None):
-        """Generate professional PDF resume"""
-        # Parse content
-        sections = self.parse_resume_content(resume_text)
-        
-        # Create PDF
-        buffer = BytesIO()
-        doc = SimpleDocTemplate(
-            buffer,
+    def create_document(self, output, profile=None):
+        """Page template writing to a file name or writable binary stream"""
+        return SimpleDocTemplate(
+            output,
             pagesize=letter,
             leftMargin=self.template.margin_left,
             rightMargin=self.template.margin_right,
             topMargin=self.template.margin_top,
-            bottomMargin=self.template.margin_bottom
+            bottomMargin=self.template.margin_bottom,
+            **document_options(profile)
         )
-        
+    
+    def build_story(self, sections):
+        """Flowables for parsed resume sections"""
         story = []
         
         # Header
@@ -622,10 +662,23 @@ class ProfessionalResumePDFGenerator:
         # Additional Skills section
         self.create_section(story, "Additional Skills & Attributes", self.add_additional_skills_content, sections['additional_skills'])
         
-        # Build PDF
-        doc.build(story)
+        return story
+    
+    def write_pdf(self, resume_text, output, profile=None):
+        """Render the PDF resume straight into a writable binary stream"""
+        # Validate the profile before doing any work
+        profile = get_output_profile(profile)
+        
+        # Parse content
+        sections = self.parse_resume_content(resume_text)
         
-        # Get PDF data
+        # Build PDF
+        self.create_document(output, profile).build(self.build_story(sections))
+    
+    def generate_pdf(self, resume_text, filename=None, profile=None):
+        """Generate professional PDF resume"""
+        buffer = BytesIO()
+        self.write_pdf(resume_text, buffer, profile)
         pdf_data = buffer.getvalue()
         buffer.close()
         
@@ -655,8 +708,9 @@ class ModernCoverLetterTemplate:
         self.margin_bottom = 0.75 * inch
         
         # Create styles
-        self.styles = getSampleStyleSheet()
+        self.styles = SharedStyleSheet()
         self._create_custom_styles()
+        self.styles.freeze()
     
     def _create_custom_styles(self):
         """Create modern custom paragraph styles"""
@@ -777,8 +831,9 @@ class ModernCoverLetterTemplate:
 class ProfessionalCoverLetterPDFGenerator:
     """Professional cover letter PDF generator with modern business letter formatting"""
     
-    def __init__(self):
-        self.template = ModernCoverLetterTemplate()
+    def __init__(self, template=None):
+        # Templates are read-only, so the prebuilt module-level one is shared by default
+        self.template = template or COVER_LETTER_TEMPLATE
         
     def parse_cover_letter_content(self, cover_letter_text):
         """Parse cover letter content into structured sections"""
@@ -797,21 +852,21 @@ class ProfessionalCoverLetterPDFGenerator:
         current_section = 'body_paragraphs'
         
         for i, line in enumerate(lines):
+            line_lower = line.lower()
+            
             # Check for date (usually at the beginning)
-            if i == 0 and (any(month in line.lower() for month in ['january', 'february', 'march', 'april', 'may', 'june', 'july', 'august', 'september', 'october', 'november', 'december']) or 
-                          re.match(r'\d{1,2}[/-]\d{1,2}[/-]\d{2,4}', line) or
-                          re.match(r'\w+\s+\d{1,2},?\s+\d{4}', line)):
+            if i == 0 and is_date_line(line, line_lower):
                 sections['date'] = line
                 continue
                 
             # Check for salutation
-            if line.lower().startswith(('dear ', 'hello ', 'hi ', 'to whom it may concern')):
+            if line_lower.startswith(SALUTATION_PREFIXES):
                 sections['salutation'] = line
                 current_section = 'body_paragraphs'
                 continue
                 
             # Check for closing
-            if line.lower().startswith(('sincerely', 'best regards', 'yours truly', 'respectfully', 'thank you', 'kind regards', 'warm regards')):
+            if line_lower.startswith(CLOSING_PREFIXES):
                 sections['closing'] = line
                 current_section = 'signature'
                 continue
@@ -819,10 +874,10 @@ class ProfessionalCoverLetterPDFGenerator:
             # Check for recipient info (company name, address, etc.)
             if i < 5 and not sections['salutation'] and not sections['date']:
                 # Likely recipient information
-                if any(keyword in line.lower() for keyword in ['company', 'corporation', 'inc', 'ltd', 'manager', 'director', 'hr', 'human resources', 'hiring']):
+                if RECIPIENT_PATTERN.search(line_lower):
                     sections['recipient_info'].append(line)
                     continue
-                elif re.match(r'\d+.*[A-Za-z].*\d{5}', line):  # Address pattern
+                elif ADDRESS_PATTERN.match(line):  # Address pattern
                     sections['recipient_info'].append(line)
                     continue
                     
@@ -930,23 +985,22 @@ class ProfessionalCoverLetterPDFGenerator:
         # Add some space at the bottom
         story.append(Spacer(1, 20))
     
-    def generate_pdf(self, cover_letter_text, applicant_name="", contact_info="", filename=None):
-        """Generate modern professional PDF cover letter"""
-        # Parse content
-        sections = self.parse_cover_letter_content(cover_letter_text)
-        
-        # Create PDF with modern styling
-        buffer = BytesIO()
-        doc = SimpleDocTemplate(
-            buffer,
+    def create_document(self, output, profile=None):
+        """Page template with modern styling writing to a file name or writable binary stream"""
+        options = {'title': "Professional Cover Letter"}
+        options.update(document_options(profile))
+        return SimpleDocTemplate(
+            output,
             pagesize=letter,
             leftMargin=self.template.margin_left,
             rightMargin=self.template.margin_right,
             topMargin=self.template.margin_top,
             bottomMargin=self.template.margin_bottom,
-            title="Professional Cover Letter"
+            **options
         )
-        
+    
+    def build_story(self, sections, applicant_name="", contact_info=""):
+        """Flowables for parsed cover letter sections"""
         story = []
         
         # Modern header with enhanced styling
@@ -967,25 +1021,51 @@ class ProfessionalCoverLetterPDFGenerator:
         # Closing and signature
         self.create_closing_section(story, sections['closing'], sections['signature'])
         
-        # Build PDF
-        doc.build(story)
+        return story
+    
+    def write_pdf(self, cover_letter_text, output, applicant_name="", contact_info="", profile=None):
+        """Render the PDF cover letter straight into a writable binary stream"""
+        # Validate the profile before doing any work
+        profile = get_output_profile(profile)
         
-        # Get PDF data
+        # Parse content
+        sections = self.parse_cover_letter_content(cover_letter_text)
+        
+        # Build PDF
+        self.create_document(output, profile).build(self.build_story(sections, applicant_name, contact_info))
+    
+    def generate_pdf(self, cover_letter_text, applicant_name="", contact_info="", filename=None, profile=None):
+        """Generate modern professional PDF cover letter"""
+        buffer = BytesIO()
+        self.write_pdf(cover_letter_text, buffer, applicant_name, contact_info, profile)
         pdf_data = buffer.getvalue()
         buffer.close()
         
         return pdf_data
 
+# Prebuilt templates and generators shared by every request; style sheets are
+# built once at import instead of once per PDF
+RESUME_TEMPLATE = ProfessionalResumeTemplate()
+COVER_LETTER_TEMPLATE = ModernCoverLetterTemplate()
+_resume_generator = ProfessionalResumePDFGenerator()
+_cover_letter_generator = ProfessionalCoverLetterPDFGenerator()
+
 # Compatibility functions
-def generate_resume_pdf(resume_text, filename=None):
-    """Generate professional resume PDF"""
-    generator = ProfessionalResumePDFGenerator()
-    return generator.generate_pdf(resume_text, filename)
+def generate_resume_pdf(resume_text, filename=None, profile=None):
+    """Generate professional resume PDF using an output profile from PDF_OUTPUT_PROFILES"""
+    return _resume_generator.generate_pdf(resume_text, filename, profile)
+
+def generate_cover_letter_pdf(cover_letter_text, applicant_name="", contact_info="", filename=None, profile=None):
+    """Generate professional cover letter PDF using an output profile from PDF_OUTPUT_PROFILES"""
+    return _cover_letter_generator.generate_pdf(cover_letter_text, applicant_name, contact_info, filename, profile)
+
+def write_resume_pdf(resume_text, output, profile=None):
+    """Render a resume PDF into a writable binary stream (file, socket wrapper, ...)"""
+    _resume_generator.write_pdf(resume_text, output, profile)
 
-def generate_cover_letter_pdf(cover_letter_text, applicant_name="", contact_info="", filename=None):
-    """Generate professional cover letter PDF"""
-    generator = ProfessionalCoverLetterPDFGenerator()
-    return generator.generate_pdf(cover_letter_text, applicant_name, contact_info, filename)
+def write_cover_letter_pdf(cover_letter_text, output, applicant_name="", contact_info="", profile=None):
+    """Render a cover letter PDF into a writable binary stream"""
+    _cover_letter_generator.write_pdf(cover_letter_text, output, applicant_name, contact_info, profile)
 
 # Legacy function for backward compatibility
 def convert_text_to_pdf(text):
@@ -0,0 +1,122 @@
+"""
+Deterministic scoring engine for Likert-scale psychometric assessments
+Maps each answer to a normalized score, label and dimension without any LLM calls,
+supports reverse-keyed items and aggregates results per dimension.
+"""
+
+from typing import Dict, List, Optional
+
+# Normalized score for each Likert response (positively keyed items)
+LIKERT_SCORES = {
+    'strongly agree': 1.0,
+    'agree': 0.75,
+    'neutral': 0.5,
+    'disagree': 0.25,
+    'strongly disagree': 0.0
+}
+
+PERSONALITY_TRAITS = ['Conscientiousness', 'Extraversion', 'Agreeableness', 'Emotional Stability', 'Openness to Experience']
+WORKPLACE_BEHAVIORS = ['Teamwork', 'Problem-solving', 'Adaptability', 'Initiative', 'Communication', 'Time Management']
+ALL_DIMENSIONS = PERSONALITY_TRAITS + WORKPLACE_BEHAVIORS
+
+# Keyword heuristics used when a question doesn't carry its dimension, in priority order
+DIMENSION_KEYWORDS = [
+    ('Teamwork', ['team', 'collaborate', 'group', 'together']),
+    ('Initiative', ['lead', 'initiative', 'take charge', 'responsibility']),
+    ('Communication', ['communicate', 'speak', 'express', 'listen']),
+    ('Problem-solving', ['problem', 'solve', 'challenge', 'solution']),
+    ('Adaptability', ['adapt', 'change', 'flexible', 'adjust']),
+    ('Time Management', ['time', 'deadline', 'schedule', 'organize']),
+    ('Conscientiousness', ['detail', 'careful', 'thorough', 'precise']),
+    ('Extraversion', ['social', 'outgoing', 'people', 'interact']),
+    ('Agreeableness', ['help', 'kind', 'considerate', 'cooperative']),
+    ('Emotional Stability', ['calm', 'stress', 'pressure', 'emotional']),
+    ('Openness to Experience', ['creative', 'new', 'innovative', 'ideas'])
+]
+
+DEFAULT_DIMENSION = 'Communication'
+
+def infer_dimension(question: str) -> str:
+    """Infer the assessed dimension from question keywords"""
+    question_lower = question.lower()
+    for dimension, keywords in DIMENSION_KEYWORDS:
+        if any(word in question_lower for word in keywords):
+            return dimension
+    return DEFAULT_DIMENSION
+
+def score_label(score: float) -> str:
+    """Label a normalized score: Low (0-0.33), Moderate (>0.33-0.66), High (>0.66-1)"""
+    if score <= 0.33:
+        return 'Low'
+    elif score <= 0.66:
+        return 'Moderate'
+    return 'High'
+
+def score_response(question: str, user_response: str, dimension: Optional[str] = None,
+                   reverse_keyed: bool = False) -> Dict:
+    """Score a single Likert response
+    
+    Returns a dict in the same shape as mcq_utils.get_response.
+    """
+    if dimension not in ALL_DIMENSIONS:
+        dimension = infer_dimension(question)
+
+    score = LIKERT_SCORES.get(str(user_response).strip().lower(), 0.5)
+    if reverse_keyed:
+        score = 1.0 - score
+    label = score_label(score)
+
+    return {
+        'inferred_dimension': dimension,
+        'original_response': user_response,
+        'normalized_score': score,
+        'label': label,
+        'reasoning': f'Based on the response "{user_response}" to a question about {dimension.lower()}, this indicates a {label.lower()} level in this dimension.'
+    }
+
+def score_assessment(questions: List[Dict], answers: List) -> List[Dict]:
+    """Score every answered question of an assessment
+    
+    Unanswered questions are skipped; question_number keeps the original position.
+    """
+    results = []
+    for i, (question, answer) in enumerate(zip(questions, answers)):
+        if answer is None:
+            continue
+
+        scored = score_response(
+            question['question'],
+            answer,
+            dimension=question.get('dimension'),
+            reverse_keyed=bool(question.get('reverse_keyed', False))
+        )
+        results.append({
+            'question_number': i + 1,
+            'question': question['question'],
+            'question_type': question.get('type', 'MCQ'),
+            'user_answer': answer,
+            'category': question.get('category', 'Unknown'),
+            'reverse_keyed': bool(question.get('reverse_keyed', False)),
+            'Dimension': scored['inferred_dimension'],
+            'Score': scored['normalized_score'],
+            'Label': scored['label'],
+            'Reasoning': scored['reasoning']
+        })
+    return results
+
+def aggregate_dimensions(results: List[Dict]) -> Dict[str, Dict]:
+    """Aggregate item results into a mean score and label per dimension"""
+    grouped = {}
+    for result in results:
+        grouped.setdefault(result['Dimension'], []).append(result)
+
+    dimension_scores = {}
+    for dimension, items in grouped.items():
+        mean = sum(item['Score'] for item in items) / len(items)
+        dimension_scores[dimension] = {
+            'score': round(mean, 3),
+            'label': score_label(mean),
+            'count': len(items),
+            'category': 'Personality Traits' if dimension in PERSONALITY_TRAITS else 'Workplace Behaviors'
+        }
+    return dimension_scores
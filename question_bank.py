@@ -0,0 +1,172 @@
+"""
+Persistent psychometric question bank
+Questions are generated offline (scripts/build_question_bank.py), deduplicated by
+embedding similarity and indexed by category and dimension, so a balanced test
+can be sampled without any LLM calls.
+"""
+
+import os
+import json
+import random
+import sqlite3
+import threading
+from datetime import datetime
+from typing import Dict, List
+
+import numpy as np
+
+from mcq_utils import CATEGORY_DIMENSIONS, LIKERT_OPTIONS
+
+# Questions at least this similar to an existing one in the bank are rejected
+SIMILARITY_THRESHOLD = float(os.getenv("QUESTION_BANK_SIMILARITY_THRESHOLD", "0.92"))
+
+class QuestionBank:
+    """SQLite-backed bank of Likert-scale questions indexed by category and dimension"""
+
+    def __init__(self, db_path: str = None, embedding_function=None,
+                 similarity_threshold: float = SIMILARITY_THRESHOLD):
+        self.db_path = db_path or os.getenv("QUESTION_BANK_DB_PATH", "smart_ats.db")
+        self.similarity_threshold = similarity_threshold
+        self._embedding_function = embedding_function
+        self._lock = threading.Lock()
+        self._init_db()
+
+    def _connect(self):
+        conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        conn.row_factory = sqlite3.Row
+        return conn
+
+    def _init_db(self):
+        conn = self._connect()
+        cursor = conn.cursor()
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS question_bank (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                category TEXT NOT NULL,
+                dimension TEXT NOT NULL,
+                question TEXT NOT NULL UNIQUE,
+                options TEXT NOT NULL,
+                reverse_keyed INTEGER NOT NULL DEFAULT 0,
+                embedding BLOB,
+                created_at TEXT NOT NULL
+            )
+        ''')
+        cursor.execute('''
+            CREATE INDEX IF NOT EXISTS idx_question_bank_dimension
+            ON question_bank (category, dimension)
+        ''')
+        conn.commit()
+        conn.close()
+
+    @property
+    def embedding_function(self):
+        if self._embedding_function is None:
+            from rag.embeddings import get_embedding_function
+            self._embedding_function = get_embedding_function()
+        return self._embedding_function
+
+    def counts(self, category: str) -> Dict[str, int]:
+        """Number of banked questions per dimension for a category"""
+        conn = self._connect()
+        rows = conn.execute(
+            "SELECT dimension, COUNT(*) AS n FROM question_bank WHERE category=? GROUP BY dimension",
+            (category,)
+        ).fetchall()
+        conn.close()
+        counts = {dimension: 0 for dimension in CATEGORY_DIMENSIONS.get(category, [])}
+        counts.update({row['dimension']: row['n'] for row in rows})
+        return counts
+
+    def add_questions(self, category: str, questions: List) -> int:
+        """Add questions (MCQQuestion objects) to the bank, skipping near-duplicates
+        
+        Returns the number of questions added.
+        """
+        candidates = [q for q in questions if q.question and q.dimension in CATEGORY_DIMENSIONS.get(category, [])]
+        if not candidates:
+            return 0
+
+        # One embedding request for the whole batch
+        vectors = np.asarray(
+            self.embedding_function.embed_documents([q.question for q in candidates]), dtype=np.float32
+        )
+        vectors /= np.linalg.norm(vectors, axis=1, keepdims=True) + 1e-12
+
+        with self._lock:
+            conn = self._connect()
+            try:
+                rows = conn.execute(
+                    "SELECT embedding FROM question_bank WHERE category=? AND embedding IS NOT NULL", (category,)
+                ).fetchall()
+                existing = [np.frombuffer(row['embedding'], dtype=np.float32) for row in rows]
+                bank_matrix = np.vstack(existing) if existing else np.empty((0, vectors.shape[1]), dtype=np.float32)
+
+                added = 0
+                for question, vector in zip(candidates, vectors):
+                    if bank_matrix.shape[0] and float(np.max(bank_matrix @ vector)) >= self.similarity_threshold:
+                        continue
+                    try:
+                        conn.execute(
+                            "INSERT INTO question_bank (category, dimension, question, options, reverse_keyed, embedding, created_at) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                            (category, question.dimension, question.question.strip(),
+                             json.dumps(question.options or LIKERT_OPTIONS), int(question.reverse_keyed),
+                             vector.tobytes(), datetime.now().isoformat())
+                        )
+                    except sqlite3.IntegrityError:
+                        continue  # Exact duplicate text
+                    bank_matrix = np.vstack([bank_matrix, vector[None, :]])
+                    added += 1
+                conn.commit()
+                return added
+            finally:
+                conn.close()
+
+    def sample(self, category: str, count: int) -> List[Dict]:
+        """Sample up to count questions, balanced across the category's dimensions
+        
+        Returns fewer than count questions when the bank runs low.
+        """
+        conn = self._connect()
+        rows = conn.execute(
+            "SELECT id, dimension, question, options, reverse_keyed FROM question_bank WHERE category=?", (category,)
+        ).fetchall()
+        conn.close()
+
+        by_dimension = {}
+        for row in rows:
+            by_dimension.setdefault(row['dimension'], []).append(row)
+        for pool in by_dimension.values():
+            random.shuffle(pool)
+
+        # Round-robin over dimensions (random start) so each is represented evenly
+        dimensions = [d for d in CATEGORY_DIMENSIONS.get(category, []) if by_dimension.get(d)]
+        random.shuffle(dimensions)
+        selected = []
+        while len(selected) < count and dimensions:
+            for dimension in list(dimensions):
+                if len(selected) >= count:
+                    break
+                pool = by_dimension[dimension]
+                if not pool:
+                    dimensions.remove(dimension)
+                    continue
+                row = pool.pop()
+                selected.append({
+                    'question': row['question'],
+                    'options': json.loads(row['options']),
+                    'dimension': row['dimension'],
+                    'reverse_keyed': bool(row['reverse_keyed'])
+                })
+        return selected
+
+_bank = None
+_bank_lock = threading.Lock()
+
+def get_question_bank() -> QuestionBank:
+    """Get the shared question bank"""
+    global _bank
+    if _bank is None:
+        with _bank_lock:
+            if _bank is None:
+                _bank = QuestionBank()
+    return _bank
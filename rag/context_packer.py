@@ -0,0 +1,141 @@
+import os
+import hashlib
+from typing import Any, Dict, List, Optional
+
+from langchain_core.retrievers import BaseRetriever
+from langchain_core.documents import Document
+from pydantic import PrivateAttr
+
+from rag.token_utils import count_tokens, truncate_to_tokens
+
+# Tokens available for retrieved context, per model. Leaves room for the
+# prompt template, chat history and the answer itself.
+MODEL_CONTEXT_BUDGETS = {
+    "gpt-4o": 6000,
+    "gpt-4o-mini": 6000,
+    "gpt-4-turbo": 6000,
+    "gpt-3.5-turbo": 2500,
+    "llama-3.3-70b-versatile": 4000,
+    "llama-3.1-8b-instant": 4000,
+    "llama3-70b-8192": 2500,
+    "llama3-8b-8192": 2500,
+    "mixtral-8x7b-32768": 4000,
+    "mistral-saba-24b": 4000,
+}
+DEFAULT_CONTEXT_BUDGET = int(os.getenv("RAG_CONTEXT_TOKEN_BUDGET", "2500"))
+
+# Don't bother adding a truncated chunk smaller than this
+MIN_CHUNK_TOKENS = 50
+
+# Chunks are split with a 200 character overlap (see chunk_documents)
+MIN_OVERLAP_CHARS = 40
+MAX_OVERLAP_CHARS = 400
+
+def get_context_budget(model=None):
+    """Get the retrieved-context token budget for a model"""
+    return MODEL_CONTEXT_BUDGETS.get(model, DEFAULT_CONTEXT_BUDGET)
+
+def _content_key(doc):
+    return hashlib.sha1(doc.page_content.strip().encode('utf-8')).hexdigest()
+
+def _source_key(doc):
+    return doc.metadata.get("doc_id") or doc.metadata.get("title") or doc.metadata.get("source")
+
+def _strip_overlap(previous, text):
+    """Remove the prefix of text that repeats the tail of previous"""
+    max_overlap = min(len(previous), len(text), MAX_OVERLAP_CHARS)
+    for size in range(max_overlap, MIN_OVERLAP_CHARS - 1, -1):
+        if previous.endswith(text[:size]):
+            return text[size:].lstrip()
+    return text
+
+def pack_documents(documents, model=None, budget=None):
+    """Deduplicate, order by relevance and trim documents to a token budget
+    
+    Returns (packed_documents, stats)
+    """
+    if budget is None:
+        budget = get_context_budget(model)
+
+    # Order by relevance - retrievers return best-first, but honour explicit scores
+    ranked = list(enumerate(documents))
+    if all(doc.metadata.get("score") is not None for doc in documents):
+        ranked.sort(key=lambda item: item[1].metadata["score"], reverse=True)
+
+    original_tokens = sum(count_tokens(doc.page_content, model) for doc in documents)
+
+    packed = []
+    seen = set()
+    kept_text = []
+    used = 0
+    for _, doc in ranked:
+        key = _content_key(doc)
+        if key in seen:
+            continue
+        seen.add(key)
+
+        text = doc.page_content
+        source = _source_key(doc)
+
+        # Drop chunks fully contained in one already kept, and strip the
+        # overlap shared with neighbouring chunks from the same source
+        if any(text.strip() in kept for kept_source, kept in kept_text if kept_source == source):
+            continue
+        for kept_source, kept in kept_text:
+            if source is not None and kept_source == source:
+                text = _strip_overlap(kept, text)
+        if not text.strip():
+            continue
+
+        tokens = count_tokens(text, model)
+        remaining = budget - used
+        if tokens > remaining:
+            if remaining < MIN_CHUNK_TOKENS:
+                break
+            text = truncate_to_tokens(text, remaining, model)
+            tokens = count_tokens(text, model)
+
+        kept_text.append((source, doc.page_content))
+        packed.append(Document(page_content=text, metadata=doc.metadata, id=getattr(doc, "id", None)))
+        used += tokens
+
+    stats = {
+        "model": model,
+        "budget_tokens": budget,
+        "original_documents": len(documents),
+        "packed_documents": len(packed),
+        "original_tokens": original_tokens,
+        "packed_tokens": used,
+        "tokens_saved": original_tokens - used
+    }
+    return packed, stats
+
+class PackedContextRetriever(BaseRetriever):
+    """Wrap a retriever so its results are packed into the model's context budget"""
+
+    base_retriever: BaseRetriever
+    model: Optional[str] = None
+    budget: Optional[int] = None
+
+    _last_packing_stats: Dict[str, Any] = PrivateAttr(default_factory=dict)
+
+    @property
+    def last_run_metadata(self):
+        """Base retriever metadata (if any) plus packing statistics"""
+        metadata = dict(getattr(self.base_retriever, "last_run_metadata", None) or {})
+        if self._last_packing_stats:
+            metadata["context_packing"] = self._last_packing_stats
+        return metadata
+
+    def _get_relevant_documents(self, query: str, *, run_manager) -> List[Document]:
+        documents = self.base_retriever.invoke(query, config={"callbacks": run_manager.get_child()})
+        packed, stats = pack_documents(documents, self.model, self.budget)
+        self._last_packing_stats = stats
+        print(f"Context packing: {stats['original_tokens']} -> {stats['packed_tokens']} tokens "
+              f"({stats['tokens_saved']} saved, {stats['packed_documents']}/{stats['original_documents']} chunks, "
+              f"model={self.model})")
+        return packed
+
+def get_llm_model_name(llm):
+    """Best-effort model name for a LangChain chat model"""
+    return getattr(llm, "model_name", None) or getattr(llm, "model", None)
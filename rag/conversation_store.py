@@ -0,0 +1,196 @@
+import os
+import sqlite3
+import threading
+from contextlib import contextmanager
+from datetime import datetime
+from dotenv import load_dotenv
+
+from rag.token_utils import count_tokens, truncate_to_tokens
+
+load_dotenv()
+
+# Token budgets for the history injected into each prompt. The recent-turn
+# window and the rolling summary are both capped, so prompt size stays flat
+# no matter how long a conversation runs.
+HISTORY_TOKEN_BUDGET = int(os.getenv("CONVERSATION_HISTORY_TOKENS", "1200"))
+SUMMARY_TOKEN_BUDGET = int(os.getenv("CONVERSATION_SUMMARY_TOKENS", "300"))
+
+SUMMARY_PROMPT = """You are maintaining a running summary of a conversation between a job seeker and a career advisor.
+
+Current summary:
+{summary}
+
+New conversation turns to fold into the summary:
+{turns}
+
+Write an updated summary in at most {max_words} words. Keep the user's goals, background, constraints and any advice already given. Return only the summary text."""
+
+class ConversationStore:
+    """SQLite-backed per-user conversation history with token-budgeted windowing"""
+
+    def __init__(self, db_path=None, history_token_budget=HISTORY_TOKEN_BUDGET,
+                 summary_token_budget=SUMMARY_TOKEN_BUDGET):
+        self.db_path = db_path or os.getenv("CONVERSATION_DB_PATH", "smart_ats.db")
+        self.history_token_budget = history_token_budget
+        self.summary_token_budget = summary_token_budget
+        # Guards _user_locks; each user's history is serialized by their own
+        # lock so one user's (slow, LLM-backed) summarization never blocks another
+        self._lock = threading.Lock()
+        self._user_locks = {}
+        self._init_db()
+
+    def _connect(self):
+        conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        conn.row_factory = sqlite3.Row
+        return conn
+
+    def _init_db(self):
+        conn = self._connect()
+        cursor = conn.cursor()
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS conversation_turns (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                user_id TEXT NOT NULL,
+                question TEXT NOT NULL,
+                answer TEXT NOT NULL,
+                tokens INTEGER NOT NULL,
+                created_at TEXT NOT NULL
+            )
+        ''')
+        cursor.execute('''
+            CREATE INDEX IF NOT EXISTS idx_conversation_turns_user
+            ON conversation_turns (user_id, id)
+        ''')
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS conversation_summaries (
+                user_id TEXT PRIMARY KEY,
+                summary TEXT NOT NULL,
+                updated_at TEXT NOT NULL
+            )
+        ''')
+        conn.commit()
+        conn.close()
+
+    @contextmanager
+    def _user_lock(self, user_id):
+        """Hold the user's lock; locks are reference counted and dropped once unused"""
+        with self._lock:
+            entry = self._user_locks.setdefault(user_id, [threading.Lock(), 0])
+            entry[1] += 1
+        try:
+            with entry[0]:
+                yield
+        finally:
+            with self._lock:
+                entry[1] -= 1
+                if entry[1] == 0:
+                    del self._user_locks[user_id]
+
+    def add_turn(self, user_id, question, answer):
+        """Append a question/answer pair to the user's conversation"""
+        tokens = count_tokens(f"User: {question}\nAssistant: {answer}")
+        conn = self._connect()
+        conn.execute(
+            "INSERT INTO conversation_turns (user_id, question, answer, tokens, created_at) VALUES (?, ?, ?, ?, ?)",
+            (str(user_id), question, answer, tokens, datetime.now().isoformat())
+        )
+        conn.commit()
+        conn.close()
+
+    def get_history(self, user_id, llm=None):
+        """Return (summary, recent_turns) for a user, folding overflow turns into the summary"""
+        user_id = str(user_id)
+        with self._user_lock(user_id):
+            conn = self._connect()
+            try:
+                row = conn.execute(
+                    "SELECT summary FROM conversation_summaries WHERE user_id=?", (user_id,)
+                ).fetchone()
+                summary = row['summary'] if row else ""
+
+                turns = conn.execute(
+                    "SELECT id, question, answer, tokens FROM conversation_turns WHERE user_id=? ORDER BY id",
+                    (user_id,)
+                ).fetchall()
+
+                # Keep the newest turns that fit in the budget
+                window_start = len(turns)
+                used = 0
+                for idx in range(len(turns) - 1, -1, -1):
+                    if used + turns[idx]['tokens'] > self.history_token_budget:
+                        break
+                    used += turns[idx]['tokens']
+                    window_start = idx
+
+                overflow = turns[:window_start]
+                if overflow:
+                    summary = self._summarize(summary, overflow, llm)
+                    conn.execute(
+                        "INSERT OR REPLACE INTO conversation_summaries (user_id, summary, updated_at) VALUES (?, ?, ?)",
+                        (user_id, summary, datetime.now().isoformat())
+                    )
+                    conn.execute(
+                        "DELETE FROM conversation_turns WHERE user_id=? AND id<=?",
+                        (user_id, overflow[-1]['id'])
+                    )
+                    conn.commit()
+
+                window = [(turn['question'], turn['answer']) for turn in turns[window_start:]]
+                return summary, window
+            finally:
+                conn.close()
+
+    def format_history(self, user_id, llm=None):
+        """Render the bounded history as prompt text"""
+        summary, window = self.get_history(user_id, llm)
+        parts = []
+        if summary:
+            parts.append(f"Summary of earlier conversation: {summary}")
+        for question, answer in window:
+            parts.append(f"User: {question}\nAssistant: {answer}")
+        return "\n\n".join(parts)
+
+    def clear(self, user_id):
+        """Delete all stored history for a user"""
+        user_id = str(user_id)
+        with self._user_lock(user_id):
+            conn = self._connect()
+            conn.execute("DELETE FROM conversation_turns WHERE user_id=?", (user_id,))
+            conn.execute("DELETE FROM conversation_summaries WHERE user_id=?", (user_id,))
+            conn.commit()
+            conn.close()
+
+    def _summarize(self, summary, turns, llm=None):
+        """Fold old turns into the rolling summary, capped at the summary budget"""
+        turns_text = "\n".join(f"User: {turn['question']}\nAssistant: {turn['answer']}" for turn in turns)
+
+        if llm is not None:
+            try:
+                prompt = SUMMARY_PROMPT.format(
+                    summary=summary or "(none)",
+                    turns=truncate_to_tokens(turns_text, self.history_token_budget * 2),
+                    max_words=int(self.summary_token_budget * 0.75)
+                )
+                response = llm.invoke(prompt)
+                new_summary = response.content if hasattr(response, 'content') else str(response)
+                return truncate_to_tokens(new_summary.strip(), self.summary_token_budget)
+            except Exception as e:
+                print(f"Warning: Conversation summarization failed, using extractive summary: {e}")
+
+        # Extractive fallback: remember the most recent questions the user asked
+        questions = [turn['question'] for turn in turns]
+        combined = " | ".join(([summary] if summary else []) + questions)
+        budget_chars = self.summary_token_budget * 4
+        return combined[-budget_chars:] if len(combined) > budget_chars else combined
+
+_store = None
+_store_lock = threading.Lock()
+
+def get_conversation_store():
+    """Get the shared conversation store"""
+    global _store
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                _store = ConversationStore()
+    return _store
@@ -1,13 +1,12 @@
 import warnings
 from langchain.chains import RetrievalQA
 from langchain.prompts import PromptTemplate
+from rag.context_packer import PackedContextRetriever, get_llm_model_name
 
 # Suppress LangChain deprecation warnings
 warnings.filterwarnings("ignore", category=DeprecationWarning, module="langchain")
 
-def create_rag_chain(llm, retriever):
-    """Create RAG QA chain"""
-    template = """You are an expert career advisor and job search assistant with extensive knowledge about:
+RAG_PROMPT_TEMPLATE = """You are an expert career advisor and job search assistant with extensive knowledge about:
 - Resume writing and optimization
 - Job search strategies and best practices  
 - Interview preparation and techniques
@@ -31,37 +30,8 @@ Context: {context}
 Question: {question}
 
 Helpful Answer:"""
-    
-    QA_PROMPT = PromptTemplate.from_template(template)
-    
-    qa_chain = RetrievalQA.from_chain_type(
-        llm=llm,
-        chain_type="stuff",
-        retriever=retriever,
-        return_source_documents=True,
-        chain_type_kwargs={"prompt": QA_PROMPT}
-    )
-    
-    return qa_chain
 
-def create_conversation_chain(llm, retriever):
-    """Create a conversation chain for multi-turn dialogue"""
-    from langchain.chains import ConversationalRetrievalChain
-    import warnings
-    
-    # Suppress deprecation warnings for memory
-    with warnings.catch_warnings():
-        warnings.filterwarnings("ignore", category=DeprecationWarning)
-        from langchain.memory import ConversationBufferMemory
-        
-        # Use the memory with warning suppression
-        memory = ConversationBufferMemory(
-            memory_key="chat_history",
-            return_messages=True,
-            output_key="answer"
-        )
-    
-    template = """You are an expert career advisor continuing a conversation about job search and career development.
+CONVERSATION_PROMPT_TEMPLATE = """You are an expert career advisor continuing a conversation about job search and career development.
 
 Previous conversation context and current relevant information:
 {context}
@@ -74,17 +44,82 @@ Please provide a helpful, specific response that builds on our previous conversa
 
 Answer:"""
 
-    QA_PROMPT = PromptTemplate(
-        input_variables=["context", "chat_history", "question"],
-        template=template
+CONDENSE_QUESTION_TEMPLATE = """Given the following conversation and a follow up question, rephrase the follow up question to be a standalone question, in its original language.
+
+Chat History:
+{chat_history}
+Follow Up Input: {question}
+Standalone question:"""
+
+RAG_PROMPT = PromptTemplate.from_template(RAG_PROMPT_TEMPLATE)
+
+CONVERSATION_PROMPT = PromptTemplate(
+    input_variables=["context", "chat_history", "question"],
+    template=CONVERSATION_PROMPT_TEMPLATE
+)
+
+CONDENSE_QUESTION_PROMPT = PromptTemplate.from_template(CONDENSE_QUESTION_TEMPLATE)
+
+def pack_retriever(llm, retriever):
+    """Wrap a retriever so retrieved context fits the LLM's token budget"""
+    if isinstance(retriever, PackedContextRetriever):
+        return retriever
+    return PackedContextRetriever(base_retriever=retriever, model=get_llm_model_name(llm))
+
+def create_rag_chain(llm, retriever):
+    """Create RAG QA chain"""
+    qa_chain = RetrievalQA.from_chain_type(
+        llm=llm,
+        chain_type="stuff",
+        retriever=pack_retriever(llm, retriever),
+        return_source_documents=True,
+        chain_type_kwargs={"prompt": RAG_PROMPT}
     )
+    
+    return qa_chain
+
+def create_conversation_chain(llm, retriever):
+    """Create a conversation chain for multi-turn dialogue
+    
+    The chain holds no memory of its own - callers pass a pre-rendered,
+    token-bounded history string (see rag.conversation_store) as chat_history.
+    """
+    from langchain.chains import ConversationalRetrievalChain
 
     conversation_chain = ConversationalRetrievalChain.from_llm(
         llm=llm,
-        retriever=retriever,
-        memory=memory,
+        retriever=pack_retriever(llm, retriever),
+        condense_question_prompt=CONDENSE_QUESTION_PROMPT,
         return_source_documents=True,
-        combine_docs_chain_kwargs={"prompt": QA_PROMPT}
+        get_chat_history=lambda chat_history: chat_history,
+        combine_docs_chain_kwargs={"prompt": CONVERSATION_PROMPT}
     )
     
-    return conversation_chain
\ No newline at end of file
+    return conversation_chain
+
+def _message_text(message):
+    return message.content if hasattr(message, 'content') else str(message)
+
+def condense_question(llm, question, chat_history):
+    """Rephrase a follow-up question as a standalone question (as the conversation chain does)"""
+    if not chat_history:
+        return question
+    response = llm.invoke(CONDENSE_QUESTION_PROMPT.format(chat_history=chat_history, question=question))
+    return _message_text(response).strip() or question
+
+def stream_rag_answer(llm, documents, question, chat_history=None):
+    """Stream answer tokens for already-retrieved documents
+    
+    Uses the same prompts as create_rag_chain / create_conversation_chain;
+    pass chat_history (possibly empty) to use the conversation prompt.
+    """
+    context = "\n\n".join(doc.page_content for doc in documents)
+    if chat_history is not None:
+        prompt = CONVERSATION_PROMPT.format(context=context, chat_history=chat_history, question=question)
+    else:
+        prompt = RAG_PROMPT.format(context=context, question=question)
+    
+    for chunk in llm.stream(prompt):
+        text = _message_text(chunk)
+        if text:
+            yield text
@@ -1,8 +1,20 @@
+import os
+import re
+import time
+import uuid
+import hashlib
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional
+
 from langchain_core.prompts import PromptTemplate
+from langchain_core.retrievers import BaseRetriever
+from langchain_core.documents import Document
+from pydantic import PrivateAttr
 
 try:
     from langchain.retrievers import EnsembleRetriever
-    from langchain.retrievers.multi_query import MultiQueryRetriever
     ADVANCED_RETRIEVERS_AVAILABLE = True
 except ImportError:
     ADVANCED_RETRIEVERS_AVAILABLE = False
@@ -38,35 +50,115 @@ def get_retriever(vector_store, search_kwargs=None, retriever_type="similarity")
     
     return retriever
 
-def get_multi_query_retriever(vector_store, llm, search_kwargs=None):
-    """Get a multi-query retriever that generates multiple queries for better results"""
-    if not ADVANCED_RETRIEVERS_AVAILABLE:
-        print("Warning: Multi-query retriever not available. Using standard retriever.")
-        return get_retriever(vector_store, search_kwargs)
-    
-    base_retriever = get_retriever(vector_store, search_kwargs)
-    
-    # Custom prompt for generating multiple queries
-    prompt_template = """You are an AI language model assistant. Your task is to generate five 
+MULTI_QUERY_PROMPT = PromptTemplate(
+    input_variables=["question"],
+    template="""You are an AI language model assistant. Your task is to generate five 
     different versions of the given user question to retrieve relevant documents from a vector 
     database. By generating multiple perspectives on the user question, your goal is to help 
     the user overcome some of the limitations of the distance-based similarity search. 
     Provide these alternative questions separated by newlines.
 
     Original question: {question}"""
+)
+
+def get_chunk_id(doc):
+    """Stable identifier for a retrieved chunk, used to deduplicate results"""
+    if getattr(doc, "id", None):
+        return doc.id
+    doc_id = doc.metadata.get("doc_id", "")
+    return f"{doc_id}:{hashlib.sha1(doc.page_content.encode('utf-8')).hexdigest()}"
+
+class ParallelMultiQueryRetriever(BaseRetriever):
+    """Multi-query retriever that embeds all query variants in one batch and searches them concurrently"""
+
+    vector_store: Any
+    llm: Any
+    prompt: Any = MULTI_QUERY_PROMPT
+    search_kwargs: Dict[str, Any] = {"k": 5}
+    include_original: bool = False
+    max_workers: int = 5
+
+    _last_run_metadata: Dict[str, Any] = PrivateAttr(default_factory=dict)
+
+    @property
+    def last_run_metadata(self):
+        """Timing and dedup details for the most recent retrieval"""
+        return self._last_run_metadata
+
+    def generate_queries(self, question):
+        """Ask the LLM for alternative phrasings of the question"""
+        response = (self.prompt | self.llm).invoke({"question": question})
+        text = response.content if hasattr(response, "content") else str(response)
+        queries = [line.strip() for line in text.strip().split("\n") if line.strip()]
+        if self.include_original or not queries:
+            queries.insert(0, question)
+        return queries
+
+    def _search_variant(self, query, embedding):
+        """Run a single vector search for one query variant and time it"""
+        k = self.search_kwargs.get("k", 5)
+        started = time.perf_counter()
+        if hasattr(self.vector_store, "similarity_search_by_vector_with_score"):
+            results = self.vector_store.similarity_search_by_vector_with_score(embedding, k=k)
+        else:
+            results = [(doc, None) for doc in self.vector_store.similarity_search_by_vector(embedding, k=k)]
+        latency_ms = (time.perf_counter() - started) * 1000
+        return results, {"query": query, "latency_ms": round(latency_ms, 1), "num_results": len(results)}
+
+    def _get_relevant_documents(self, query: str, *, run_manager) -> List[Document]:
+        started = time.perf_counter()
+        queries = self.generate_queries(query)
+        rewrite_ms = (time.perf_counter() - started) * 1000
+
+        # One embedding request for every variant instead of one per search
+        embed_started = time.perf_counter()
+        embeddings = self.vector_store.embeddings.embed_documents(queries)
+        embedding_ms = (time.perf_counter() - embed_started) * 1000
+
+        workers = max(1, min(self.max_workers, len(queries)))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            outcomes = list(executor.map(self._search_variant, queries, embeddings))
+
+        # Deduplicate by chunk id, keeping each chunk's best score
+        best = {}
+        order = []
+        for results, _ in outcomes:
+            for doc, score in results:
+                chunk_id = get_chunk_id(doc)
+                if chunk_id not in best:
+                    order.append(chunk_id)
+                    best[chunk_id] = (doc, score)
+                elif score is not None and (best[chunk_id][1] is None or score > best[chunk_id][1]):
+                    best[chunk_id] = (doc, score)
+
+        ranked = sorted(order, key=lambda cid: best[cid][1] if best[cid][1] is not None else float("-inf"), reverse=True)
+        documents = [best[cid][0] for cid in ranked]
+
+        self._last_run_metadata = {
+            "strategy": "multi_query",
+            "rewrite_ms": round(rewrite_ms, 1),
+            "embedding_ms": round(embedding_ms, 1),
+            "variants": [variant for _, variant in outcomes],
+            "total_results": sum(variant["num_results"] for _, variant in outcomes),
+            "unique_results": len(documents),
+            "total_ms": round((time.perf_counter() - started) * 1000, 1)
+        }
+        return documents
+
+def get_multi_query_retriever(vector_store, llm, search_kwargs=None):
+    """Get a multi-query retriever that searches all generated queries in parallel"""
+    if search_kwargs is None:
+        search_kwargs = {"k": 5}
     
-    prompt = PromptTemplate(
-        input_variables=["question"],
-        template=prompt_template
-    )
+    if not hasattr(vector_store, "embeddings") or vector_store.embeddings is None:
+        print("Warning: Vector store does not expose embeddings. Using standard retriever.")
+        return get_retriever(vector_store, search_kwargs)
     
-    retriever = MultiQueryRetriever.from_llm(
-        retriever=base_retriever,
+    return ParallelMultiQueryRetriever(
+        vector_store=vector_store,
         llm=llm,
-        prompt=prompt
+        search_kwargs=search_kwargs
     )
-    
-    return retriever
 
 def get_ensemble_retriever(vector_store, search_kwargs=None):
     """Get an ensemble retriever that combines multiple search strategies"""
@@ -106,4 +198,128 @@ def get_contextual_retriever(vector_store, query_type="general", search_kwargs=N
         return get_retriever(vector_store, search_kwargs, "similarity")
     else:
         # Default to similarity search
-        return get_retriever(vector_store, search_kwargs, "similarity")
\ No newline at end of file
+        return get_retriever(vector_store, search_kwargs, "similarity")
+
+# Retrieval result cache
+RETRIEVAL_CACHE_SIZE = int(os.getenv("RAG_RETRIEVAL_CACHE_SIZE", "256"))
+RETRIEVAL_CACHE_TTL = int(os.getenv("RAG_RETRIEVAL_CACHE_TTL", "3600"))
+
+# Written by scripts/init_vector_db.py whenever the index is rebuilt, so
+# every app process sees the new version and stops serving stale results
+INDEX_VERSION_FILE = os.getenv(
+    "RAG_INDEX_VERSION_FILE",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), ".index_version")
+)
+
+_index_version = {"mtime": None, "value": "0"}
+
+def get_index_version():
+    """Get the current vector index version"""
+    try:
+        mtime = os.stat(INDEX_VERSION_FILE).st_mtime_ns
+    except OSError:
+        return "0"
+    if mtime != _index_version["mtime"]:
+        with open(INDEX_VERSION_FILE, "r") as f:
+            _index_version["value"] = f.read().strip() or "0"
+        _index_version["mtime"] = mtime
+    return _index_version["value"]
+
+def bump_index_version():
+    """Mark the vector index as rebuilt, invalidating cached retrieval results"""
+    version = f"{int(time.time())}-{uuid.uuid4().hex[:8]}"
+    with open(INDEX_VERSION_FILE, "w") as f:
+        f.write(version)
+    get_retrieval_cache().clear()
+    return version
+
+def normalize_query(query):
+    """Normalize a query for cache lookups"""
+    query = re.sub(r"\s+", " ", query.strip().lower())
+    return query.rstrip("?!. ")
+
+class RetrievalCache:
+    """Thread-safe LRU cache with per-entry TTL for retrieval results"""
+
+    def __init__(self, max_size=RETRIEVAL_CACHE_SIZE, ttl=RETRIEVAL_CACHE_TTL):
+        self.max_size = max_size
+        self.ttl = ttl
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            stored_at, value = entry
+            if time.monotonic() - stored_at > self.ttl:
+                del self._entries[key]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key, value):
+        with self._lock:
+            self._entries[key] = (time.monotonic(), value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self):
+        with self._lock:
+            return {"size": len(self._entries), "hits": self.hits, "misses": self.misses}
+
+_retrieval_cache = RetrievalCache()
+
+def get_retrieval_cache():
+    """Get the shared retrieval result cache"""
+    return _retrieval_cache
+
+class CachedRetriever(BaseRetriever):
+    """Serve repeated retrievals from the cache, keyed by (normalized query, strategy, k, index version)"""
+
+    base_retriever: BaseRetriever
+    strategy: str = "similarity"
+    k: Optional[int] = None
+
+    _last_run_metadata: Dict[str, Any] = PrivateAttr(default_factory=dict)
+
+    @property
+    def last_run_metadata(self):
+        """Base retriever metadata for the run plus cache status
+
+        On a hit the stored metadata describes the run that filled the cache, so
+        it is nested under 'cached_from' rather than reported as this run's timings.
+        """
+        return self._last_run_metadata
+
+    def _get_relevant_documents(self, query: str, *, run_manager) -> List[Document]:
+        cache = get_retrieval_cache()
+        key = (normalize_query(query), self.strategy, self.k, get_index_version())
+
+        cached = cache.get(key)
+        if cached is not None:
+            documents, metadata = cached
+            self._last_run_metadata = {"cache_hit": True, "cached_from": metadata}
+            return list(documents)
+
+        documents = self.base_retriever.invoke(query, config={"callbacks": run_manager.get_child()})
+        metadata = dict(getattr(self.base_retriever, "last_run_metadata", None) or {})
+        cache.set(key, (list(documents), metadata))
+        self._last_run_metadata = {**metadata, "cache_hit": False}
+        return documents
+
+def get_cached_retriever(retriever, strategy, search_kwargs=None):
+    """Wrap a retriever with the shared retrieval result cache"""
+    k = (search_kwargs or {}).get("k")
+    return CachedRetriever(base_retriever=retriever, strategy=strategy, k=k)
@@ -0,0 +1,52 @@
+try:
+    import tiktoken
+    TIKTOKEN_AVAILABLE = True
+except ImportError:
+    TIKTOKEN_AVAILABLE = False
+    print("Warning: tiktoken not available. Falling back to approximate token counts.")
+
+_encodings = {}
+
+def get_encoding(model=None):
+    """Get (and cache) the tiktoken encoding for a model"""
+    if not TIKTOKEN_AVAILABLE:
+        return None
+    
+    key = model or "cl100k_base"
+    if key not in _encodings:
+        try:
+            try:
+                _encodings[key] = tiktoken.encoding_for_model(model) if model else tiktoken.get_encoding("cl100k_base")
+            except KeyError:
+                # Non-OpenAI models (Groq/Llama) - cl100k_base is a close enough estimate
+                _encodings[key] = tiktoken.get_encoding("cl100k_base")
+        except Exception as e:
+            # Encoding files are downloaded on first use and may be unreachable
+            print(f"Warning: Could not load tiktoken encoding ({e}). Using approximate token counts.")
+            _encodings[key] = None
+    return _encodings[key]
+
+def count_tokens(text, model=None):
+    """Count tokens in text for the given model"""
+    if not text:
+        return 0
+    
+    encoding = get_encoding(model)
+    if encoding is None:
+        # Roughly four characters per token for English text
+        return max(1, len(text) // 4)
+    return len(encoding.encode(text, disallowed_special=()))
+
+def truncate_to_tokens(text, max_tokens, model=None):
+    """Truncate text to at most max_tokens tokens"""
+    if max_tokens <= 0 or not text:
+        return ""
+    
+    encoding = get_encoding(model)
+    if encoding is None:
+        return text[:max_tokens * 4]
+    
+    tokens = encoding.encode(text, disallowed_special=())
+    if len(tokens) <= max_tokens:
+        return text
+    return encoding.decode(tokens[:max_tokens])
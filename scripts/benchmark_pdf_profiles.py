@@ -0,0 +1,61 @@
+"""
+PDF output profile comparison
+Renders every resume and cover letter fixture with each output profile in
+PDF_OUTPUT_PROFILES and reports the file size and best-of-N render time, so
+the default (PDF_OUTPUT_PROFILE) can be picked on real numbers.
+
+Usage:
+    python scripts/benchmark_pdf_profiles.py [iterations]
+"""
+
+import gc
+import os
+import sys
+import time
+
+# Add the parent directory to sys.path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pdf_generator import generate_resume_pdf, generate_cover_letter_pdf, PDF_OUTPUT_PROFILES, DEFAULT_PDF_PROFILE
+from pdf_benchmark_fixtures import RESUME_FIXTURES, COVER_LETTER_FIXTURES, APPLICANT_NAME, CONTACT_INFO
+
+def measure_profile(render, profile, number):
+    """Size in bytes and best-of-N render milliseconds for one profile"""
+    timings = []
+    for _ in range(number):
+        gc.collect()
+        gc.disable()
+        start = time.perf_counter()
+        pdf_data = render(profile)
+        timings.append(time.perf_counter() - start)
+        gc.enable()
+    return {'bytes': len(pdf_data), 'render_ms': min(timings) * 1000}
+
+def compare_profiles(number=10):
+    """Results keyed by fixture name, then by profile"""
+    renders = {}
+    for name, text in RESUME_FIXTURES.items():
+        renders[f"resume/{name}"] = lambda profile, text=text: generate_resume_pdf(text, profile=profile)
+    for name, text in COVER_LETTER_FIXTURES.items():
+        renders[f"cover_letter/{name}"] = lambda profile, text=text: generate_cover_letter_pdf(
+            text, APPLICANT_NAME, CONTACT_INFO, profile=profile
+        )
+
+    return {
+        name: {profile: measure_profile(render, profile, number) for profile in PDF_OUTPUT_PROFILES}
+        for name, render in renders.items()
+    }
+
+def print_results(results):
+    print(f"  {'fixture':<24} {'profile':<14} {'bytes':>8} {'vs default':>10} {'render ms':>10}")
+    for name, profiles in results.items():
+        default_size = profiles[DEFAULT_PDF_PROFILE]['bytes']
+        for profile, result in profiles.items():
+            change = f"{(result['bytes'] / default_size - 1) * 100:+.0f}%"
+            print(f"  {name:<24} {profile:<14} {result['bytes']:8d} {change:>10} {result['render_ms']:10.2f}")
+
+if __name__ == "__main__":
+    number = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+
+    print(f"PDF output profiles (best of {number} iterations, default profile: {DEFAULT_PDF_PROFILE})")
+    print_results(compare_profiles(number))
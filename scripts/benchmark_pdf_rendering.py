@@ -0,0 +1,169 @@
+"""
+PDF rendering benchmark suite
+Times parsing, story building and doc.build separately for every resume and
+cover letter fixture, measures peak memory of a full render and compares the
+results with a stored baseline.
+
+Story building is timed cold: per-thread render caches (skill tags) are
+cleared before every iteration, as for the first render on a worker thread.
+story_warm_ms times the same step with those caches already populated.
+
+Usage:
+    python scripts/benchmark_pdf_rendering.py [iterations] [--save-baseline]
+
+Baselines are machine specific; save one before a change and compare after it
+on the same machine. Exits with status 1 when a regression is found.
+"""
+
+import gc
+import os
+import sys
+import json
+import time
+import tracemalloc
+from io import BytesIO
+
+# Add the parent directory to sys.path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pdf_generator import ProfessionalResumePDFGenerator, ProfessionalCoverLetterPDFGenerator
+from pdf_benchmark_fixtures import RESUME_FIXTURES, COVER_LETTER_FIXTURES, APPLICANT_NAME, CONTACT_INFO
+
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "pdf_rendering_baseline.json")
+
+# A result regresses when it is this much slower (or larger) than the baseline...
+REGRESSION_TOLERANCE = float(os.getenv("PDF_BENCHMARK_TOLERANCE", "0.3"))
+# ...and the difference is above these floors, which keep timer noise out
+MIN_TIME_DELTA_MS = 0.5
+MIN_MEMORY_DELTA_KB = 64
+
+def resume_phases(generator, text):
+    """Parse, story, build and cache-reset callables for one resume render"""
+    sections = generator.parse_resume_content(text)
+    return (
+        lambda: generator.parse_resume_content(text),
+        lambda: generator.build_story(sections),
+        lambda story: generator.create_document(BytesIO()).build(story),
+        generator.clear_skill_paragraph_cache
+    )
+
+def cover_letter_phases(generator, text):
+    """Parse, story, build and cache-reset callables for one cover letter render"""
+    sections = generator.parse_cover_letter_content(text)
+    return (
+        lambda: generator.parse_cover_letter_content(text),
+        lambda: generator.build_story(sections, APPLICANT_NAME, CONTACT_INFO),
+        lambda story: generator.create_document(BytesIO()).build(story),
+        lambda: None
+    )
+
+def measure(phases, number):
+    """Best-of-N milliseconds per phase and peak traced memory (KB) of a full render"""
+    parse, build_story, build_doc, reset_caches = phases
+    timings = {'parse_ms': [], 'story_ms': [], 'build_ms': [], 'story_warm_ms': []}
+    for _ in range(number):
+        # Collect between runs so garbage collection doesn't land inside a timed phase
+        gc.collect()
+        reset_caches()
+        gc.disable()
+        start = time.perf_counter()
+        parse()
+        timings['parse_ms'].append(time.perf_counter() - start)
+
+        start = time.perf_counter()
+        story = build_story()
+        timings['story_ms'].append(time.perf_counter() - start)
+
+        start = time.perf_counter()
+        build_doc(story)
+        timings['build_ms'].append(time.perf_counter() - start)
+
+        # Same story again, now with this thread's caches populated
+        start = time.perf_counter()
+        build_story()
+        timings['story_warm_ms'].append(time.perf_counter() - start)
+        gc.enable()
+
+    # The fastest run is the least affected by other load on the machine
+    result = {phase: min(values) * 1000 for phase, values in timings.items()}
+
+    # Memory is traced in a separate (cold) render since tracing slows everything down
+    reset_caches()
+    tracemalloc.start()
+    parse()
+    build_doc(build_story())
+    result['peak_kb'] = tracemalloc.get_traced_memory()[1] / 1024
+    tracemalloc.stop()
+    return result
+
+def run_suite(number=20):
+    """Benchmark results keyed by 'resume/<fixture>' and 'cover_letter/<fixture>'"""
+    resume_generator = ProfessionalResumePDFGenerator()
+    cover_letter_generator = ProfessionalCoverLetterPDFGenerator()
+
+    results = {}
+    for name, text in RESUME_FIXTURES.items():
+        results[f"resume/{name}"] = measure(resume_phases(resume_generator, text), number)
+    for name, text in COVER_LETTER_FIXTURES.items():
+        results[f"cover_letter/{name}"] = measure(cover_letter_phases(cover_letter_generator, text), number)
+    return results
+
+def compare_to_baseline(results, baseline):
+    """Regression messages for results that are notably worse than the baseline"""
+    regressions = []
+    for name, result in results.items():
+        previous = baseline.get(name)
+        if not previous:
+            continue
+        for metric, value in result.items():
+            old_value = previous.get(metric)
+            if old_value is None:
+                continue
+            floor = MIN_MEMORY_DELTA_KB if metric == 'peak_kb' else MIN_TIME_DELTA_MS
+            if value > old_value * (1 + REGRESSION_TOLERANCE) and value - old_value > floor:
+                regressions.append(f"{name} {metric}: {old_value:.2f} -> {value:.2f} (+{(value / old_value - 1) * 100:.0f}%)")
+    return regressions
+
+def print_results(results, baseline):
+    print(f"  {'fixture':<24} {'parse ms':>9} {'story ms':>9} {'warm ms':>9} {'build ms':>9} {'peak KB':>9}  vs baseline (total ms)")
+    for name, result in results.items():
+        total = result['parse_ms'] + result['story_ms'] + result['build_ms']
+        change = ""
+        previous = baseline.get(name)
+        if previous:
+            old_total = previous['parse_ms'] + previous['story_ms'] + previous['build_ms']
+            change = f"{(total / old_total - 1) * 100:+.0f}%"
+        print(f"  {name:<24} {result['parse_ms']:9.3f} {result['story_ms']:9.3f} {result['story_warm_ms']:9.3f} {result['build_ms']:9.3f} "
+              f"{result['peak_kb']:9.0f}  {change}")
+
+if __name__ == "__main__":
+    args = [arg for arg in sys.argv[1:] if not arg.startswith('--')]
+    number = int(args[0]) if args else 20
+    save_baseline = '--save-baseline' in sys.argv
+
+    baseline = {}
+    if os.path.exists(BASELINE_PATH):
+        with open(BASELINE_PATH) as f:
+            baseline = json.load(f)
+
+    print(f"PDF rendering benchmark (best of {number} iterations)")
+    results = run_suite(number)
+    print_results(results, {} if save_baseline else baseline)
+
+    if save_baseline:
+        with open(BASELINE_PATH, 'w') as f:
+            json.dump(results, f, indent=2, sort_keys=True)
+        print(f"Baseline saved to {BASELINE_PATH}")
+        sys.exit(0)
+
+    if not baseline:
+        print("No baseline found; run with --save-baseline to create one")
+        sys.exit(0)
+
+    regressions = compare_to_baseline(results, baseline)
+    if regressions:
+        print("Regressions against baseline:")
+        for regression in regressions:
+            print(f"  {regression}")
+        sys.exit(1)
+    print("No regressions against baseline")
@@ -0,0 +1,50 @@
+import os
+import sys
+import timeit
+
+# Add the parent directory to sys.path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pdf_generator import (
+    ProfessionalResumeTemplate, ModernCoverLetterTemplate,
+    ProfessionalResumePDFGenerator, ProfessionalCoverLetterPDFGenerator,
+    generate_cover_letter_pdf
+)
+
+SAMPLE_COVER_LETTER = """October 1, 2025
+Dear Hiring Manager,
+I am excited to apply for the Senior Software Engineer role at your company.
+Over the past six years I have built and operated data-intensive web services.
+I would welcome the chance to discuss how I can contribute to your team.
+Sincerely,
+Jane Doe"""
+
+def time_per_call(func, number):
+    """Average seconds per call"""
+    return timeit.timeit(func, number=number) / number
+
+def benchmark_pdf_setup(number=200):
+    """Compare per-PDF setup cost with per-request templates vs the shared prebuilt ones"""
+    results = {
+        # Before: every request built its own template and style sheet
+        'resume setup (new template)': time_per_call(lambda: ProfessionalResumePDFGenerator(ProfessionalResumeTemplate()), number),
+        'cover letter setup (new template)': time_per_call(lambda: ProfessionalCoverLetterPDFGenerator(ModernCoverLetterTemplate()), number),
+        # After: generators reuse the module-level templates
+        'resume setup (shared template)': time_per_call(ProfessionalResumePDFGenerator, number),
+        'cover letter setup (shared template)': time_per_call(ProfessionalCoverLetterPDFGenerator, number),
+    }
+
+    render_number = max(1, number // 10)
+    fresh = lambda: ProfessionalCoverLetterPDFGenerator(ModernCoverLetterTemplate()).generate_pdf(SAMPLE_COVER_LETTER, "Jane Doe", "jane@example.com")
+    results['cover letter render (new template)'] = time_per_call(fresh, render_number)
+    results['cover letter render (shared template)'] = time_per_call(
+        lambda: generate_cover_letter_pdf(SAMPLE_COVER_LETTER, "Jane Doe", "jane@example.com"), render_number
+    )
+    return results
+
+if __name__ == "__main__":
+    number = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    
+    print(f"PDF setup benchmark ({number} iterations)")
+    for name, seconds in benchmark_pdf_setup(number).items():
+        print(f"  {name:<40} {seconds * 1000:8.3f} ms")
@@ -0,0 +1,276 @@
+import os
+import re
+import sys
+import timeit
+
+# Add the parent directory to sys.path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pdf_generator import ProfessionalResumePDFGenerator
+from pdf_benchmark_fixtures import build_resume
+
+class LegacyResumeParser:
+    """Previous parser: nested per-section rescans with uncompiled patterns, kept for comparison"""
+
+    def clean_text(self, text):
+        """Clean text by removing markdown formatting and extra characters"""
+        if not text:
+            return ""
+        
+        # Remove markdown formatting
+        text = re.sub(r'\*\*([^*]+)\*\*', r'\1', text)  # Remove **bold**
+        text = re.sub(r'\*([^*]+)\*', r'\1', text)      # Remove *italic*
+        text = re.sub(r'^\*+\s*', '', text)             # Remove leading asterisks
+        text = re.sub(r'\s*\*+$', '', text)             # Remove trailing asterisks
+        
+        # Clean up extra whitespace
+        text = re.sub(r'\s+', ' ', text).strip()
+        
+        return text
+    
+    def parse_resume_content(self, resume_text):
+        """Parse comprehensive resume content into structured sections"""
+        sections = {
+            'name': '',
+            'contact': {
+                'phone': '',
+                'email': '',
+                'address': ''
+            },
+            'profile': '',
+            'experience': [],
+            'education': [],
+            'skills': {},
+            'certifications': [],
+            'additional_skills': []
+        }
+        
+        lines = [line.strip() for line in resume_text.strip().split('\n') if line.strip()]
+        current_section = None
+        current_experience = {}
+        
+        # Extract name - look for the first bold line or standalone name
+        for i, line in enumerate(lines[:10]):
+            clean_line = self.clean_text(line)
+            if (clean_line and 
+                not clean_line.lower().startswith('here is') and
+                not any(keyword in clean_line.lower() for keyword in ['mobile:', 'email:', '@', 'phone:', 'summary', 'professional']) and
+                len(clean_line.split()) >= 2 and
+                not clean_line.startswith('-') and
+                not clean_line.startswith('*')):
+                sections['name'] = clean_line.upper()
+                break
+        
+        # Parse content line by line
+        i = 0
+        while i < len(lines):
+            line = lines[i]
+            clean_line = self.clean_text(line)
+            if not clean_line:
+                i += 1
+                continue
+            
+            line_lower = clean_line.lower()
+            
+            # Skip separator lines
+            if clean_line.startswith('---') or clean_line.startswith('==='):
+                i += 1
+                continue
+            
+            # Extract contact information
+            if 'mobile:' in line_lower or 'phone:' in line_lower:
+                phone_match = re.search(r'(\d{3}[-.\s]?\d{3}[-.\s]?\d{4})', clean_line)
+                if phone_match:
+                    sections['contact']['phone'] = phone_match.group(1)
+                i += 1
+                continue
+            
+            if 'email:' in line_lower or '@' in clean_line:
+                email_match = re.search(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b', clean_line)
+                if email_match:
+                    sections['contact']['email'] = email_match.group()
+                i += 1
+                continue
+            
+            # Detect major sections
+            if any(keyword in line_lower for keyword in ['professional summary', 'summary', 'profile', 'objective']):
+                current_section = 'profile'
+                # Collect profile content until next section
+                i += 1
+                profile_lines = []
+                while i < len(lines):
+                    next_line = self.clean_text(lines[i])
+                    if not next_line:
+                        i += 1
+                        continue
+                    if next_line.startswith('---'):
+                        i += 1
+                        break
+                    if any(section_keyword in next_line.lower() for section_keyword in 
+                           ['technical skills', 'professional experience', 'experience', 'education', 'certifications']):
+                        break
+                    profile_lines.append(next_line)
+                    i += 1
+                sections['profile'] = ' '.join(profile_lines)
+                continue
+            
+            elif any(keyword in line_lower for keyword in ['technical skills', 'skills']):
+                current_section = 'skills'
+                i += 1
+                # Parse skills section
+                while i < len(lines):
+                    skill_line = self.clean_text(lines[i])
+                    if not skill_line or skill_line.startswith('---'):
+                        i += 1
+                        continue
+                    if any(section_keyword in skill_line.lower() for section_keyword in 
+                           ['professional experience', 'experience', 'education', 'certifications']):
+                        break
+                    
+                    # Parse skill categories
+                    if skill_line.startswith('-') and ':' in skill_line:
+                        # Format: - **Category:** skill1, skill2, skill3
+                        category_match = re.search(r'-\s*\*?\*?([^:*]+)\*?\*?:\s*(.+)', skill_line)
+                        if category_match:
+                            category = category_match.group(1).strip()
+                            skills_text = category_match.group(2).strip()
+                            skills_list = [skill.strip() for skill in skills_text.split(',') if skill.strip()]
+                            sections['skills'][category] = skills_list
+                    i += 1
+                continue
+            
+            elif any(keyword in line_lower for keyword in ['professional experience', 'work experience', 'experience']):
+                current_section = 'experience'
+                i += 1
+                # Parse experience section
+                while i < len(lines):
+                    exp_line = self.clean_text(lines[i])
+                    if not exp_line or exp_line.startswith('---'):
+                        i += 1
+                        continue
+                    if any(section_keyword in exp_line.lower() for section_keyword in 
+                           ['education', 'certifications', 'additional skills']):
+                        break
+                    
+                    # Check if this is a company/location line
+                    if (not exp_line.startswith('-') and not exp_line.startswith('•') and 
+                        (',' in exp_line or any(keyword in exp_line.lower() for keyword in ['inc', 'corp', 'llc', 'ltd', 'company']))):
+                        
+                        # Save previous experience if exists
+                        if current_experience:
+                            sections['experience'].append(current_experience)
+                        
+                        # Start new experience entry
+                        current_experience = {
+                            'company': exp_line,
+                            'title': '',
+                            'dates': '',
+                            'responsibilities': []
+                        }
+                        
+                        # Look for job title and dates in next lines
+                        i += 1
+                        if i < len(lines):
+                            title_line = self.clean_text(lines[i])
+                            if title_line.startswith('*') or 'developer' in title_line.lower() or 'engineer' in title_line.lower():
+                                current_experience['title'] = title_line.strip('*').strip()
+                                i += 1
+                                if i < len(lines):
+                                    date_line = self.clean_text(lines[i])
+                                    if re.search(r'\d{4}', date_line):
+                                        current_experience['dates'] = date_line.strip('*').strip()
+                                        i += 1
+                        continue
+                    
+                    # Check for responsibilities
+                    elif exp_line.startswith('-') or exp_line.startswith('•'):
+                        if current_experience:
+                            responsibility = exp_line.lstrip('-• ').strip()
+                            current_experience['responsibilities'].append(responsibility)
+                    
+                    i += 1
+                
+                # Add last experience
+                if current_experience:
+                    sections['experience'].append(current_experience)
+                    current_experience = {}
+                continue
+            
+            elif any(keyword in line_lower for keyword in ['education']):
+                current_section = 'education'
+                i += 1
+                while i < len(lines):
+                    edu_line = self.clean_text(lines[i])
+                    if not edu_line or edu_line.startswith('---'):
+                        i += 1
+                        continue
+                    if any(section_keyword in edu_line.lower() for section_keyword in 
+                           ['certifications', 'additional skills', 'notes']):
+                        break
+                    sections['education'].append(edu_line)
+                    i += 1
+                continue
+            
+            elif any(keyword in line_lower for keyword in ['certifications', 'training']):
+                current_section = 'certifications'
+                i += 1
+                while i < len(lines):
+                    cert_line = self.clean_text(lines[i])
+                    if not cert_line or cert_line.startswith('---'):
+                        i += 1
+                        continue
+                    if any(section_keyword in cert_line.lower() for section_keyword in 
+                           ['additional skills', 'notes']):
+                        break
+                    if cert_line.startswith('-') or cert_line.startswith('•'):
+                        cert_line = cert_line.lstrip('-• ').strip()
+                    sections['certifications'].append(cert_line)
+                    i += 1
+                continue
+            
+            elif any(keyword in line_lower for keyword in ['additional skills', 'attributes']):
+                current_section = 'additional_skills'
+                i += 1
+                while i < len(lines):
+                    skill_line = self.clean_text(lines[i])
+                    if not skill_line or skill_line.startswith('---'):
+                        i += 1
+                        continue
+                    if 'notes' in skill_line.lower():
+                        break
+                    if skill_line.startswith('-') or skill_line.startswith('•'):
+                        skill_line = skill_line.lstrip('-• ').strip()
+                    sections['additional_skills'].append(skill_line)
+                    i += 1
+                continue
+            
+            i += 1
+        
+        return sections
+
+def benchmark_resume_parser(number=50, sizes=(5, 20, 80)):
+    """Average parse time per resume for the legacy and current parsers, for increasing numbers of jobs"""
+    generator = ProfessionalResumePDFGenerator()
+    legacy = LegacyResumeParser()
+    results = {}
+    for jobs in sizes:
+        resume = build_resume(jobs=jobs, bullets_per_job=8, skill_categories=10, certifications=5)
+        # The single-pass parser must produce exactly what the old one did
+        assert generator.parse_resume_content(resume) == legacy.parse_resume_content(resume), \
+            f"Parsers disagree on the {jobs}-job resume"
+        results[jobs] = {
+            'lines': len(resume.split('\n')),
+            'legacy_seconds': timeit.timeit(lambda: legacy.parse_resume_content(resume), number=number) / number,
+            'seconds': timeit.timeit(lambda: generator.parse_resume_content(resume), number=number) / number,
+        }
+    return results
+
+if __name__ == "__main__":
+    number = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+
+    print(f"Resume parser benchmark ({number} iterations, output checked against the legacy parser)")
+    for jobs, result in benchmark_resume_parser(number).items():
+        per_line = result['seconds'] / result['lines'] * 1e6
+        speedup = result['legacy_seconds'] / result['seconds']
+        print(f"  {jobs:>3} jobs, {result['lines']:>5} lines  legacy {result['legacy_seconds'] * 1000:8.3f} ms  "
+              f"current {result['seconds'] * 1000:8.3f} ms  ({per_line:6.2f} us/line, {speedup:4.1f}x)")
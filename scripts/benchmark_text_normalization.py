@@ -0,0 +1,67 @@
+import os
+import re
+import sys
+import timeit
+
+# Add the parent directory to sys.path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from text_normalization import strip_markdown, strip_think_blocks
+from pdf_generator import ProfessionalCoverLetterPDFGenerator
+
+SAMPLE_LINES = [
+    "**JANE DOE**",
+    "Mobile: 555-123-4567 | Email: jane.doe@example.com",
+    "**PROFESSIONAL SUMMARY**",
+    "Software engineer with a decade of experience building data-intensive web services.",
+    "- **Languages:** Python, Go, SQL, TypeScript",
+    "*Senior Software Engineer*",
+    "- Reduced p95 latency by 40% by redesigning the caching layer",
+    "Jan 2019 - Present",
+]
+
+SAMPLE_COVER_LETTER = """October 1, 2025
+Acme Corporation
+123 Main Street, Springfield 12345
+Dear Hiring Manager,
+I am excited to apply for the Senior Software Engineer role at your company.
+Over the past six years I have built and operated data-intensive web services.
+I would welcome the chance to discuss how I can contribute to your team.
+Sincerely,
+Jane Doe"""
+
+SAMPLE_RESPONSE = "<think>" + "Weighing the candidate's experience. " * 50 + "</think>\n" + SAMPLE_COVER_LETTER
+
+def legacy_clean_text(text):
+    """Previous clean_text: five uncompiled regex passes per line"""
+    if not text:
+        return ""
+    text = re.sub(r'\*\*([^*]+)\*\*', r'\1', text)
+    text = re.sub(r'\*([^*]+)\*', r'\1', text)
+    text = re.sub(r'^\*+\s*', '', text)
+    text = re.sub(r'\s*\*+$', '', text)
+    return re.sub(r'\s+', ' ', text).strip()
+
+def time_per_call(func, number):
+    """Average seconds per call"""
+    return timeit.timeit(func, number=number) / number
+
+def benchmark_text_normalization(number=20000):
+    """Per-call cost of the shared normalization helpers against the previous inline code"""
+    generator = ProfessionalCoverLetterPDFGenerator()
+    return {
+        'clean lines (legacy)': time_per_call(lambda: [legacy_clean_text(line) for line in SAMPLE_LINES], number),
+        'clean lines (strip_markdown)': time_per_call(lambda: [strip_markdown(line) for line in SAMPLE_LINES], number),
+        'think stripping (legacy)': time_per_call(
+            lambda: re.sub(r"<think>.*?</think>", "", SAMPLE_RESPONSE, flags=re.DOTALL), number
+        ),
+        'think stripping (strip_think_blocks)': time_per_call(lambda: strip_think_blocks(SAMPLE_RESPONSE), number),
+        'cover letter parse': time_per_call(lambda: generator.parse_cover_letter_content(SAMPLE_COVER_LETTER), number),
+    }
+
+if __name__ == "__main__":
+    number = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+
+    print(f"Text normalization benchmark ({number} iterations)")
+    for name, seconds in benchmark_text_normalization(number).items():
+        print(f"  {name:<40} {seconds * 1e6:8.2f} us")
@@ -0,0 +1,54 @@
+import os
+import sys
+
+# Add the parent directory to sys.path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from mcq_utils import QuestionGenerator, CATEGORY_DIMENSIONS
+from question_bank import get_question_bank
+
+# Target number of banked questions per dimension
+TARGET_PER_DIMENSION = int(os.getenv("QUESTION_BANK_TARGET_PER_DIMENSION", "20"))
+
+def build_question_bank(model="llama-3.3-70b-versatile", target_per_dimension=TARGET_PER_DIMENSION, max_rounds=10):
+    """Populate the psychometric question bank until each dimension reaches its target"""
+    bank = get_question_bank()
+    generator = QuestionGenerator(model)
+    
+    for category, dimensions in CATEGORY_DIMENSIONS.items():
+        print(f"Building '{category}' questions...")
+        for round_number in range(max_rounds):
+            counts = bank.counts(category)
+            # Only under-filled dimensions are generated, each for its own gap
+            gaps = {d: target_per_dimension - counts[d] for d in dimensions if counts[d] < target_per_dimension}
+            print(f"  Round {round_number + 1}: {counts} ({sum(gaps.values())} missing)")
+            if not gaps:
+                break
+            
+            for dimension, gap in gaps.items():
+                try:
+                    questions = generator.generate_mcq_batch(topic=category, count=gap, dimensions=[dimension])
+                except RuntimeError as e:
+                    print(f"  ⚠️  {dimension}: generation failed: {e}")
+                    continue
+                
+                added = bank.add_questions(category, questions)
+                print(f"  ✓ {dimension}: added {added}/{len(questions)} questions (rest were near-duplicates or off-topic)")
+        
+        print(f"✓ '{category}': {bank.counts(category)}")
+    
+    return bank
+
+if __name__ == "__main__":
+    model = sys.argv[1] if len(sys.argv) > 1 else "llama-3.3-70b-versatile"
+    
+    print("Starting question bank build...")
+    print(f"Model: {model}, target per dimension: {TARGET_PER_DIMENSION}")
+    
+    try:
+        build_question_bank(model)
+        print("🎉 Question bank build completed successfully!")
+    except Exception as e:
+        print(f"❌ Error during question bank build: {str(e)}")
+        import traceback
+        traceback.print_exc()
@@ -0,0 +1,114 @@
+"""
+Import-time report for the Flask app
+Imports flask_app in a fresh interpreter under `python -X importtime`, prints
+the cost of its direct imports and of the most expensive modules overall, and
+checks the import-time budget:
+
+- the total import time must stay under IMPORT_TIME_BUDGET_MS, and
+- no lazily loaded subsystem (lazy_imports.LAZY_SUBSYSTEMS) or other heavy
+  library may be imported at app import.
+
+Usage:
+    python scripts/import_time_report.py [runs]
+
+The fastest of the runs is reported. Exits with status 1 on a regression.
+"""
+
+import os
+import re
+import sys
+import subprocess
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Add the parent directory to sys.path
+sys.path.append(ROOT)
+
+from lazy_imports import registered_modules
+
+IMPORT_TIME_BUDGET_MS = float(os.getenv("IMPORT_TIME_BUDGET_MS", "500"))
+# Libraries that only lazily loaded subsystems should pull in
+HEAVY_PACKAGES = ('groq', 'openai', 'langchain', 'langchain_core', 'langchain_groq', 'langchain_openai',
+                  'reportlab', 'sklearn', 'numpy', 'pinecone')
+TOP_MODULES = 15
+
+# "import time:       342 |      31317 |           jinja2"
+IMPORT_TIME_LINE = re.compile(r'^import time:\s+(\d+) \|\s+(\d+) \|( +)(\S+)')
+
+def measure_imports(target="flask_app"):
+    """Import records (name, depth, self ms, cumulative ms) of the target and everything it imports"""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {target}"],
+        cwd=ROOT, capture_output=True, text=True
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"Importing {target} failed:\n{result.stderr[-2000:]}")
+
+    records = []
+    for line in result.stderr.splitlines():
+        match = IMPORT_TIME_LINE.match(line)
+        if match:
+            self_us, cumulative_us, indent, name = match.groups()
+            records.append({
+                'name': name,
+                'depth': (len(indent) - 1) // 2,
+                'self_ms': int(self_us) / 1000,
+                'cumulative_ms': int(cumulative_us) / 1000,
+            })
+
+    # Modules are listed after their own imports, so the target's subtree is
+    # everything since the previous top-level entry (interpreter startup)
+    end = next(i for i, record in enumerate(records) if record['name'] == target and record['depth'] == 0)
+    start = end
+    while start > 0 and records[start - 1]['depth'] > 0:
+        start -= 1
+    return records[start:end + 1]
+
+def total_ms(records):
+    return records[-1]['cumulative_ms']
+
+def find_regressions(records, total):
+    """Budget overruns and eagerly imported modules that should load lazily"""
+    regressions = []
+    if total > IMPORT_TIME_BUDGET_MS:
+        regressions.append(f"import time {total:.0f} ms exceeds budget of {IMPORT_TIME_BUDGET_MS:.0f} ms")
+
+    imported = {record['name'] for record in records}
+    for module in registered_modules():
+        if module in imported:
+            regressions.append(f"lazy module '{module}' is imported at app import")
+    for package in HEAVY_PACKAGES:
+        if package in imported:
+            regressions.append(f"heavy package '{package}' is imported at app import")
+    return regressions
+
+def print_report(records, total):
+    print(f"  flask_app total: {total:.1f} ms (budget {IMPORT_TIME_BUDGET_MS:.0f} ms)")
+
+    print("  Direct imports of flask_app (cumulative):")
+    direct = [record for record in records if record['depth'] == 1]
+    for record in sorted(direct, key=lambda r: r['cumulative_ms'], reverse=True):
+        print(f"    {record['name']:<40} {record['cumulative_ms']:8.1f} ms")
+
+    print(f"  Most expensive modules (self time, top {TOP_MODULES}):")
+    for record in sorted(records, key=lambda r: r['self_ms'], reverse=True)[:TOP_MODULES]:
+        print(f"    {record['name']:<40} {record['self_ms']:8.1f} ms")
+
+if __name__ == "__main__":
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 3
+
+    # The first run also pays for writing bytecode caches; keep the fastest
+    measurements = [measure_imports() for _ in range(runs)]
+    records = min(measurements, key=total_ms)
+    total = total_ms(records)
+
+    print(f"Import-time report (fastest of {runs} runs)")
+    print_report(records, total)
+
+    regressions = find_regressions(records, total)
+    if regressions:
+        print("Import-time regressions:")
+        for regression in regressions:
+            print(f"  {regression}")
+        sys.exit(1)
+    print("Import time within budget")
@@ -7,6 +7,7 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from rag.document_processor import load_job_descriptions, process_job_descriptions, chunk_documents
 from rag.embeddings import get_embedding_function
 from rag.vector_store import get_or_create_vector_store, delete_vector_store
+from rag.retriever import bump_index_version
 
 def init_vector_database(data_path, recreate=False):
     """Initialize vector database with job descriptions"""
@@ -51,6 +52,10 @@ def init_vector_database(data_path, recreate=False):
         print(f"✓ Added batch {i//batch_size + 1}/{(len(chunked_documents)-1)//batch_size + 1}")
     
     print(f"✓ Successfully added {len(chunked_documents)} document chunks to vector store")
+    
+    # Invalidate cached retrieval results in running app processes
+    index_version = bump_index_version()
+    print(f"✓ Index version updated to {index_version}")
     return vector_store
 
 if __name__ == "__main__":
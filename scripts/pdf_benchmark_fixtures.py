@@ -0,0 +1,67 @@
+"""
+Synthetic resume and cover letter fixtures for the PDF benchmarks
+Each fixture is in the markdown-ish format the LLM prompts produce, so it
+exercises the same parsing and layout paths as real documents.
+"""
+
+SKILL_NAMES = [
+    "Python", "Go", "Java", "TypeScript", "SQL", "PostgreSQL", "Redis", "Kafka", "Docker", "Kubernetes",
+    "Terraform", "AWS", "GCP", "React", "GraphQL", "gRPC", "Airflow", "Spark", "Pandas", "PyTorch",
+]
+
+def build_resume(jobs=3, bullets_per_job=4, skill_categories=3, skills_per_category=6, certifications=2):
+    """Resume with the given number of jobs, bullets, skill categories and certifications"""
+    lines = [
+        "**JANE DOE**",
+        "Mobile: 555-123-4567 | Email: jane.doe@example.com",
+        "---",
+        "**PROFESSIONAL SUMMARY**",
+        "Software engineer with ten years of building data-intensive web services, "
+        "from database tuning to front-end performance.",
+        "---",
+        "**TECHNICAL SKILLS**",
+    ]
+    for c in range(skill_categories):
+        skills = [SKILL_NAMES[(c * skills_per_category + s) % len(SKILL_NAMES)] for s in range(skills_per_category)]
+        lines.append(f"- **Category {c + 1}:** {', '.join(skills)}")
+    lines += ["---", "**PROFESSIONAL EXPERIENCE**"]
+    for j in range(jobs):
+        lines += [f"**Company {j + 1} Inc, Springfield**", "*Senior Software Engineer*", f"Jan {2000 + j} - Dec {2001 + j}"]
+        for b in range(bullets_per_job):
+            lines.append(f"- Delivered project {b + 1}, cutting p95 latency by {b + 10}% for key customers "
+                         f"while keeping infrastructure spend flat")
+    lines += ["---", "**EDUCATION**", "B.S. Computer Science, State University, 2010", "---", "**CERTIFICATIONS**"]
+    lines += [f"- Certification {c + 1}" for c in range(certifications)]
+    lines += ["---", "**ADDITIONAL SKILLS**", "- Mentoring", "- Technical writing"]
+    return '\n'.join(lines)
+
+def build_cover_letter(paragraphs=3, with_recipient=True, with_date=True, sentences_per_paragraph=3):
+    """Cover letter with the given number of body paragraphs"""
+    lines = []
+    if with_date:
+        lines.append("October 1, 2025")
+    if with_recipient:
+        lines += ["Hiring Manager", "Acme Corporation", "123 Main Street, Springfield 12345"]
+    lines.append("Dear Hiring Manager,")
+    sentence = "Over the past six years I have built and operated data-intensive web services for demanding customers."
+    for p in range(paragraphs):
+        lines.append(f"Paragraph {p + 1}. " + " ".join([sentence] * sentences_per_paragraph))
+    lines += ["Sincerely,", "Jane Doe"]
+    return '\n'.join(lines)
+
+RESUME_FIXTURES = {
+    'short': build_resume(jobs=1, bullets_per_job=2, skill_categories=1, skills_per_category=4, certifications=0),
+    'long': build_resume(jobs=6, bullets_per_job=8, skill_categories=4, skills_per_category=8, certifications=5),
+    'skill_heavy': build_resume(jobs=2, bullets_per_job=3, skill_categories=12, skills_per_category=12, certifications=3),
+    'many_jobs': build_resume(jobs=25, bullets_per_job=5, skill_categories=3, skills_per_category=6, certifications=2),
+}
+
+COVER_LETTER_FIXTURES = {
+    'short': build_cover_letter(paragraphs=2, sentences_per_paragraph=2),
+    'long': build_cover_letter(paragraphs=8, sentences_per_paragraph=6),
+    'no_header': build_cover_letter(paragraphs=3, with_recipient=False, with_date=False),
+}
+
+# Applicant details passed to the cover letter generator
+APPLICANT_NAME = "Jane Doe"
+CONTACT_INFO = "jane.doe@example.com | 555-123-4567"
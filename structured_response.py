@@ -0,0 +1,242 @@
+"""
+Structured JSON responses from the chat completion APIs
+Requests provider JSON mode where it is supported, parses the output with a
+tolerant incremental parser instead of regex salvage, and re-requests only the
+fields that came back missing or invalid.
+"""
+
+import os
+import json
+from functools import lru_cache
+from typing import Callable, Dict, List, Optional
+
+from groq import Groq
+
+# Try to import OpenAI, handle if not installed
+try:
+    from openai import OpenAI
+    OPENAI_AVAILABLE = True
+except ImportError:
+    OPENAI_AVAILABLE = False
+
+OPENAI_MODELS = ["gpt-4o", "gpt-4o-mini", "gpt-4-turbo", "gpt-3.5-turbo"]
+
+# Providers whose chat completion API accepts response_format={"type": "json_object"}
+JSON_MODE_PROVIDERS = {'openai', 'groq'}
+
+# How many times missing/invalid fields are re-requested before giving up
+MAX_FIELD_REPAIRS = 2
+
+FIELD_REPAIR_TEMPLATE = """{prompt}
+
+IMPORTANT: An earlier answer to the request above was incomplete. Return ONLY a valid JSON
+object containing exactly these fields: {fields}. Do not include any other fields."""
+
+def get_provider(model: str) -> str:
+    """Provider serving a model: 'openai' or 'groq'"""
+    return 'openai' if model in OPENAI_MODELS or model.startswith('gpt-') else 'groq'
+
+@lru_cache(maxsize=8)
+def _get_client(provider: str, api_key: str):
+    """Shared API client per provider and key"""
+    if provider == 'openai':
+        if not OPENAI_AVAILABLE:
+            raise Exception("OpenAI library not installed. Please install it with: pip install openai")
+        return OpenAI(api_key=api_key)
+    return Groq(api_key=api_key)
+
+def _failed_generation(error) -> Optional[str]:
+    """Raw output attached to a JSON-mode validation error (Groq returns it as failed_generation)"""
+    body = getattr(error, 'body', None)
+    if isinstance(body, dict):
+        details = body.get('error', body)
+        if isinstance(details, dict) and details.get('failed_generation'):
+            return details['failed_generation']
+    return None
+
+def complete_json_text(model: str, api_key: Optional[str], prompt: str) -> str:
+    """Run a JSON-producing prompt and return the raw model output
+
+    Uses JSON mode when the provider supports it. If the provider rejects the
+    output in JSON mode, its raw generation is returned for tolerant parsing
+    when available; otherwise the request is repeated without JSON mode.
+    """
+    provider = get_provider(model)
+    if provider == 'openai':
+        api_key = os.getenv("OPENAI_API_KEY")
+        if not api_key:
+            raise Exception("OPENAI_API_KEY not found in environment variables")
+
+    client = _get_client(provider, api_key)
+    request = {
+        'model': model,
+        'messages': [
+            {"role": "system", "content": prompt},
+            {"role": "user", "content": " "}
+        ],
+        'temperature': 1,
+        'top_p': 1
+    }
+
+    if provider in JSON_MODE_PROVIDERS:
+        try:
+            completion = client.chat.completions.create(response_format={"type": "json_object"}, **request)
+            response = completion.choices[0].message.content
+            if response:
+                return response
+        except Exception as e:
+            failed = _failed_generation(e)
+            if failed:
+                return failed
+            print(f"JSON mode request failed for {model}, retrying without it: {e}")
+
+    completion = client.chat.completions.create(**request)
+    response = completion.choices[0].message.content
+    if not response:
+        raise Exception(f"Empty response received from {provider}")
+    return response
+
+def repair_json(fragment: str) -> str:
+    """Repair common defects in model-generated JSON in a single pass
+
+    Drops trailing commas, escapes raw newlines inside strings and closes
+    brackets left open by truncated output. A string cut off by truncation is
+    dropped rather than closed (a cut-off value becomes null), so partial text
+    never passes validation and gets re-requested. If the final element still
+    doesn't parse, the output is cut back to the last complete element.
+    """
+    out = []
+    stack = []
+    in_string = False
+    string_start = 0
+    escaped = False
+    last_complete = None  # (length of out, open brackets) after the last complete element
+
+    for char in fragment:
+        if in_string:
+            if escaped:
+                escaped = False
+            elif char == '\\':
+                escaped = True
+            elif char == '"':
+                in_string = False
+            elif char == '\n':
+                out.append('\\n')
+                continue
+            out.append(char)
+            continue
+
+        if char == '"':
+            in_string = True
+            string_start = len(out)
+        elif char in '{[':
+            stack.append('}' if char == '{' else ']')
+        elif char in '}]':
+            # Remove a trailing comma before the closing bracket
+            while out and out[-1].isspace():
+                out.pop()
+            if out and out[-1] == ',':
+                out.pop()
+            if not stack:
+                break
+            stack.pop()
+            out.append(char)
+            if not stack:
+                return ''.join(out)
+            last_complete = (len(out), list(stack))
+            continue
+        elif char == ',':
+            last_complete = (len(out), list(stack))
+        out.append(char)
+
+    # Truncated output: drop a cut-off string, then close whatever is still open
+    candidate = ''.join(out[:string_start] if in_string else out)
+    candidate = candidate.rstrip()
+    if candidate.endswith(':'):
+        candidate += ' null'
+    candidate = candidate.rstrip(',')
+    candidate += ''.join(reversed(stack))
+    try:
+        json.loads(candidate)
+        return candidate
+    except json.JSONDecodeError:
+        pass
+
+    if last_complete is None:
+        return candidate
+    length, open_brackets = last_complete
+    return ''.join(out[:length]).rstrip().rstrip(',') + ''.join(reversed(open_brackets))
+
+def parse_json(text: str):
+    """Parse the first JSON value in text
+
+    Leading prose, code fences and trailing text are ignored. Malformed or
+    truncated JSON is repaired with repair_json. Raises ValueError if nothing
+    can be parsed.
+    """
+    starts = [idx for idx in (text.find('{'), text.find('[')) if idx != -1]
+    if not starts:
+        raise ValueError("No JSON found in response")
+    start = min(starts)
+
+    decoder = json.JSONDecoder()
+    try:
+        value, _ = decoder.raw_decode(text, start)
+        return value
+    except json.JSONDecodeError:
+        pass
+
+    try:
+        value, _ = decoder.raw_decode(repair_json(text[start:]))
+        return value
+    except json.JSONDecodeError as e:
+        raise ValueError(f"Could not parse JSON response: {e}")
+
+def invalid_fields(data: Dict, required_fields: List[str] = None,
+                   validators: Dict[str, Callable] = None) -> List[str]:
+    """Fields that are missing, null or rejected by their validator"""
+    fields = list(required_fields or [])
+    fields += [field for field in (validators or {}) if field not in fields]
+
+    invalid = []
+    for field in fields:
+        value = data.get(field)
+        if value is None:
+            invalid.append(field)
+            continue
+        validator = (validators or {}).get(field)
+        try:
+            if validator is not None and not validator(value):
+                invalid.append(field)
+        except Exception:
+            invalid.append(field)
+    return invalid
+
+def request_json(model: str, api_key: Optional[str], prompt: str, required_fields: List[str] = None,
+                 validators: Dict[str, Callable] = None, max_repairs: int = MAX_FIELD_REPAIRS) -> Dict:
+    """Request a JSON object, re-requesting only fields that are missing or invalid
+
+    Raises ValueError if required fields are still invalid after max_repairs.
+    """
+    data = parse_json(complete_json_text(model, api_key, prompt))
+    if not isinstance(data, dict):
+        raise ValueError("Expected a JSON object in the response")
+
+    invalid = invalid_fields(data, required_fields, validators)
+    for attempt in range(max_repairs):
+        if not invalid:
+            break
+        print(f"Re-requesting invalid fields (attempt {attempt + 1}): {invalid}")
+        repair_prompt = FIELD_REPAIR_TEMPLATE.format(prompt=prompt, fields=', '.join(invalid))
+        try:
+            patch = parse_json(complete_json_text(model, api_key, repair_prompt))
+        except Exception as e:
+            print(f"Field repair request failed: {e}")
+            continue
+        if isinstance(patch, dict):
+            data.update({field: patch[field] for field in invalid if field in patch})
+        invalid = invalid_fields(data, required_fields, validators)
+
+    if invalid:
+        raise ValueError(f"Missing required field(s): {', '.join(invalid)}")
+    return data
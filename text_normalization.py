@@ -0,0 +1,68 @@
+"""
+Shared text normalization
+Precompiled patterns for cleaning LLM-generated text before it is parsed or
+rendered: markdown emphasis stripping, whitespace collapsing, <think> block
+removal and the date/recipient patterns used to parse cover letters.
+"""
+
+import re
+
+def keyword_pattern(*keywords):
+    """Compiled pattern matching any of the keywords as a substring"""
+    return re.compile('|'.join(re.escape(keyword) for keyword in keywords))
+
+# Bold spans are removed before italic ones; an italic span may only become
+# complete once the bold markers inside it are gone
+BOLD_PATTERN = re.compile(r'\*\*([^*]+)\*\*')
+ITALIC_PATTERN = re.compile(r'\*([^*]+)\*')
+
+# Reasoning blocks emitted by reasoning models ahead of the answer
+THINK_BLOCK_PATTERN = re.compile(r'<think>.*?</think>', re.DOTALL)
+
+MONTH_NAMES = ('january', 'february', 'march', 'april', 'may', 'june', 'july',
+               'august', 'september', 'october', 'november', 'december')
+MONTH_PATTERN = keyword_pattern(*MONTH_NAMES)
+NUMERIC_DATE_PATTERN = re.compile(r'\d{1,2}[/-]\d{1,2}[/-]\d{2,4}')
+WRITTEN_DATE_PATTERN = re.compile(r'\w+\s+\d{1,2},?\s+\d{4}')
+ADDRESS_PATTERN = re.compile(r'\d+.*[A-Za-z].*\d{5}')
+
+SALUTATION_PREFIXES = ('dear ', 'hello ', 'hi ', 'to whom it may concern')
+CLOSING_PREFIXES = ('sincerely', 'best regards', 'yours truly', 'respectfully', 'thank you', 'kind regards', 'warm regards')
+RECIPIENT_PATTERN = keyword_pattern('company', 'corporation', 'inc', 'ltd', 'manager', 'director', 'hr',
+                                    'human resources', 'hiring')
+
+def normalize_whitespace(text: str) -> str:
+    """Collapse whitespace runs to single spaces and trim the ends"""
+    return ' '.join(text.split())
+
+def strip_markdown(text: str) -> str:
+    """Remove markdown bold/italic markers and stray asterisks, then normalize whitespace
+
+    Text without asterisks skips the regex passes entirely; stray asterisks and
+    whitespace are handled with plain string operations.
+    """
+    if not text:
+        return ""
+    if '**' in text:
+        text = BOLD_PATTERN.sub(r'\1', text)
+    if '*' in text:
+        text = ITALIC_PATTERN.sub(r'\1', text)
+        # Stray asterisks left at either end (a trailing newline doesn't count)
+        text = text.lstrip('*')
+        body = text[:-1] if text.endswith('\n') else text
+        if body.endswith('*'):
+            text = body.rstrip('*')
+    return normalize_whitespace(text)
+
+def strip_think_blocks(text: str) -> str:
+    """Remove <think>...</think> reasoning blocks from a model response"""
+    if '<think>' not in text:
+        return text
+    return THINK_BLOCK_PATTERN.sub('', text)
+
+def is_date_line(line: str, line_lower: str = None) -> bool:
+    """Whether a line looks like a letter date (month name, 01/02/2025 or 'Month 1, 2025')"""
+    line_lower = line.lower() if line_lower is None else line_lower
+    return bool(MONTH_PATTERN.search(line_lower) or
+                NUMERIC_DATE_PATTERN.match(line) or
+                WRITTEN_DATE_PATTERN.match(line))
@@ -1,8 +1,9 @@
 import PyPDF2 as pdf
 import json
 from groq import Groq
-import re
 import os
+from structured_response import request_json
+from text_normalization import strip_think_blocks
 
 # Try to import OpenAI, handle if not installed
 try:
@@ -90,62 +91,25 @@ def get_groq_response(model, api_key, prompt):
     except Exception as e:
         raise Exception(f"Error generating response: {str(e)}")
 
+# Fields every resume analysis response must contain
+RESUME_ANALYSIS_FIELDS = ["overall_match_percentage", "matching_skills", "missing_skills", "skills_gap_analysis", "experience_match_analysis", "education_match_analysis", "recommendations_for_improvement", "ats_optimization_suggestions", "key_strengths", "areas_of_improvement"]
+
+def get_required_fields(prompt):
+    """Required response fields for known prompt types"""
+    # For resume analysis, validate required fields
+    if "overall_match_percentage" in prompt or "matching_skills" in prompt:
+        return RESUME_ANALYSIS_FIELDS
+    return None
+
 def get_openai_response(model, prompt):
     """Generate a response using OpenAI API."""
     if not OPENAI_AVAILABLE:
         raise Exception("OpenAI library not installed. Please install it with: pip install openai")
     
-    openai_api_key = os.getenv("OPENAI_API_KEY")
-    if not openai_api_key:
-        raise Exception("OPENAI_API_KEY not found in environment variables")
-    
     try:
-        client = OpenAI(api_key=openai_api_key)
-        
-        completion = client.chat.completions.create(
-            model=model,
-            messages=[
-                {
-                    "role": "system",
-                    "content": prompt
-                },
-                {
-                    "role": "user",
-                    "content": " "
-                }
-            ],
-            temperature=1,
-            top_p=1,
-            response_format={"type": "json_object"}
-        )
-        
-        response = completion.choices[0].message.content
-        
-        # Ensure response is not empty
-        if not response:
-            raise Exception("Empty response received from OpenAI")
-            
-        # Try to parse the response as JSON
-        try:
-            response_json = json.loads(response)
-            
-            # For resume analysis, validate required fields
-            if "overall_match_percentage" in prompt or "matching_skills" in prompt:
-                required_fields = ["overall_match_percentage", "matching_skills", "missing_skills", "skills_gap_analysis", "experience_match_analysis", "education_match_analysis", "recommendations_for_improvement", "ats_optimization_suggestions", "key_strengths", "areas_of_improvement"]
-                for field in required_fields:
-                    if field not in response_json:
-                        raise ValueError(f"Missing required field: {field}")
-                    
-            return response
-            
-        except json.JSONDecodeError:
-            # If response is not valid JSON, try to extract JSON-like content
-            json_pattern = r'\{.*\}'
-            match = re.search(json_pattern, response, re.DOTALL)
-            if match:
-                return match.group()
-            else:
-                raise Exception("Could not extract valid JSON response")
+        # JSON mode plus tolerant parsing; only missing fields are re-requested
+        response_json = request_json(model, None, prompt, required_fields=get_required_fields(prompt))
+        return json.dumps(response_json)
                 
     except Exception as e:
         raise Exception(f"Error generating OpenAI response: {str(e)}")
@@ -153,54 +117,9 @@ def get_openai_response(model, prompt):
 def get_groq_api_response(model, api_key, prompt):
     """Generate a response using Groq API."""
     try:
-        client = Groq(api_key=api_key)
-        
-        completion = client.chat.completions.create(
-            model=model,
-            messages=[
-                {
-                    "role": "system",
-                    "content": prompt
-                },
-                {
-                    "role": "user",
-                    "content": " "
-                }
-            ],
-            temperature=1,
-            top_p=1,
-            stream=False,
-            response_format={"type": "json_object"},
-            stop=None,
-        )
-        
-        response = completion.choices[0].message.content
-        
-        # Ensure response is not empty
-        if not response:
-            raise Exception("Empty response received from Groq")
-            
-        # Try to parse the response as JSON
-        try:
-            response_json = json.loads(response)
-            
-            # For resume analysis, validate required fields
-            if "overall_match_percentage" in prompt or "matching_skills" in prompt:
-                required_fields = ["overall_match_percentage", "matching_skills", "missing_skills", "skills_gap_analysis", "experience_match_analysis", "education_match_analysis", "recommendations_for_improvement", "ats_optimization_suggestions", "key_strengths", "areas_of_improvement"]
-                for field in required_fields:
-                    if field not in response_json:
-                        raise ValueError(f"Missing required field: {field}")
-                    
-            return response
-            
-        except json.JSONDecodeError:
-            # If response is not valid JSON, try to extract JSON-like content
-            json_pattern = r'\{.*\}'
-            match = re.search(json_pattern, response, re.DOTALL)
-            if match:
-                return match.group()
-            else:
-                raise Exception("Could not extract valid JSON response")
+        # JSON mode plus tolerant parsing; only missing fields are re-requested
+        response_json = request_json(model, api_key, prompt, required_fields=get_required_fields(prompt))
+        return json.dumps(response_json)
                 
     except Exception as e:
         raise Exception(f"Error generating Groq response: {str(e)}")
@@ -343,7 +262,7 @@ def generate_cover_letter(model, api_key, job_analysis, resume_analysis, match_a
             )
 
         response = completion.choices[0].message.content
-        return (re.sub(r"<think>.*?</think>", "", response, flags=re.DOTALL))
+        return strip_think_blocks(response)
 
     except Exception as e:
         return Exception(f"Error generating cover letter: {str(e)}")
@@ -412,7 +331,7 @@ def generate_updated_resume(model, api_key, job_analysis, resume_text, match_ana
             )
 
         response = completion.choices[0].message.content
-        return (re.sub(r"<think>.*?</think>", "", response, flags=re.DOTALL))
+        return strip_think_blocks(response)
 
     except Exception as e:
         return Exception(f"Error generating updated resume: {str(e)}")
\ No newline at end of file